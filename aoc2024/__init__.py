@@ -3,30 +3,109 @@
 from __future__ import annotations
 
 import os
+import sys
 import time
-from typing import Callable, Literal, Any, Self, TypeAlias
+import dataclasses
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, Literal, Any, Self, TypeAlias, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import aocd
+    from aoc2024.bench import BenchmarkStats, ABComparison
+    from aoc2024.inputs import Input
+    from aoc2024.memory import MemoryStats
 
 
 this_dir = os.path.dirname(os.path.abspath(__file__))
 data_dir = os.path.join(os.path.dirname(this_dir), "data")
 
-# set the aoc session when missing
-if not os.getenv("AOC_SESSION", ""):
-    session_file = os.path.join(os.path.dirname(this_dir), ".aoc_session")
-    if os.path.exists(session_file):
-        with open(session_file) as f:
-            os.environ["AOC_SESSION"] = f.read().strip()
 
-import aocd
+def setup_session() -> None:
+    """
+    Sets the ``AOC_SESSION`` env var from the ``.aoc_session`` file in the repository when missing. Deferred until
+    network access is actually needed to keep the package import fast.
+    """
+    if not os.getenv("AOC_SESSION", ""):
+        session_file = os.path.join(os.path.dirname(this_dir), ".aoc_session")
+        if os.path.exists(session_file):
+            with open(session_file) as f:
+                os.environ["AOC_SESSION"] = f.read().strip()
 
 
 Part = Literal["a", "b", "x"]
 
 
+# hot-path counters, only collecting values while enabled through the solver
+_counters: Counter[str] | None = None
+
+
+def count(name: str, n: int = 1) -> None:
+    """
+    Increments the counter *name* by *n* while counters are enabled (e.g. via ``Solver.solve(..., counters=True)``)
+    and does nothing otherwise. Pairs of counters named ``<name>_hits`` and ``<name>_misses`` are reported along with
+    their hit rate.
+    """
+    if _counters is not None:
+        _counters[name] += n
+
+
+def _clear_memos(scope: Literal["call", "shared"] | None = None) -> None:
+    # clears caches of memoized functions with a scope, or all, if any were created, see aoc2024.memo
+    if (memo := sys.modules.get("aoc2024.memo")) is not None:
+        memo.clear(scope)
+
+
+def format_counters(counters: dict[str, int]) -> list[str]:
+    """
+    Formats *counters* into lines of the form ``name: value``, merging hit and miss counters into a single line.
+    """
+    lines = []
+    for name in sorted(counters):
+        if name.endswith("_misses") and f"{name[:-7]}_hits" in counters:
+            continue
+        if name.endswith("_hits") and (misses_name := f"{name[:-5]}_misses") in counters:
+            hits, misses = counters[name], counters[misses_name]
+            rate = hits / (hits + misses) if hits + misses else 0.0
+            lines.append(f"{name[:-5]}: {hits} hits, {misses} misses ({rate:.1%} hit rate)")
+        else:
+            lines.append(f"{name}: {counters[name]}")
+    return lines
+
+
+@dataclass
+class Result:
+    """
+    Outcome of running a solution function for a single puzzle part.
+    """
+
+    puzzle_id: str
+    day: int
+    part: Part
+    value: int | str | None
+    truth: int | str | None
+    runtime: float
+    error: str | None = None
+    profile_path: str | None = None
+    memory: MemoryStats | None = None
+    counters: dict[str, int] = field(default_factory=dict)
+    parse_time: float | None = None
+    parse_cached: bool = False
+    cached: bool = False
+    status: Literal["TIMEOUT", "OOM"] | None = None
+
+    @property
+    def correct(self) -> bool | None:
+        if self.value is None or self.truth is None:
+            return None
+        return self.value == self.truth
+
+
 class Solver:
     """
     Puzzle solver class, helping with repeated tasks like input fetching and solution submission.
-    Requires the ``AOC_SESSION`` env var to be set. Use as:
+    Requires the ``AOC_SESSION`` env var (or a ``.aoc_session`` file) to be set for downloading inputs and submitting
+    solutions. Use as:
 
     .. code-block:: python
 
@@ -35,6 +114,19 @@ class Solver:
             return None
 
         Solver(year=..., day=...).solve(solution, part="a")
+
+    Solutions can optionally be split into two stages, with parsing being done only once for both parts:
+
+    .. code-block:: python
+
+        def parse(data: list[str]) -> Any:
+            return ...
+
+        def solution(parsed: Any, part: Part) -> int | None:
+            # parsed must not be changed in-place
+            return None
+
+        Solver(year=..., day=...).solve(solution, parse=parse, part="x")
     """
 
     def __init__(
@@ -59,6 +151,9 @@ class Solver:
     @property
     def puzzle(self) -> aocd.models.Puzzle:
         if self._puzzle is None:
+            # aocd is imported lazily as it is slow to import and only needed when interacting with the aoc website
+            setup_session()
+            import aocd
             self._puzzle = aocd.get_puzzle(year=self.year, day=self.day)
         return self._puzzle
 
@@ -68,78 +163,658 @@ class Solver:
 
     @property
     def has_session(self) -> bool:
+        setup_session()
         return bool(os.getenv("AOC_SESSION", ""))
 
-    def solve(
-        self,
-        func: Callable[[list[str], Part], int | str | None],
-        /,
-        *,
-        part: Part,
-        submit: bool = True,
-        example: bool = False,
-        example_index: int = 0,
-        strip: bool = True,
-    ) -> None:
-        assert part in ("a", "b", "x")
-
-        # solve both parts when "x" is given
-        if part == "x":
-            self.solve(func, part="a", submit=submit, example=example, example_index=example_index)
-            print("")
-            self.solve(func, part="b", submit=submit, example=example, example_index=example_index)
-            return
+    def _print_header(self, puzzle_id: str, n_lines: int | None) -> None:
+        header = f"🎄 {puzzle_id}"
+        if self.has_session:
+            header += f"  ─  {self.puzzle.title}"
+        if n_lines is None:
+            header += "  ─  streamed data"
+        else:
+            header += f"  ─  {n_lines} data line{'' if n_lines == 1 else 's'}"
+        header += " 🎄"
+        width = max(len(header) + 2, 40)
+        print(f"{'━' * width}\n{header}\n{'─' * width}")
 
-        # puzzle identifier
+    def puzzle_id(self, part: Part, *, example: bool = False, example_index: int = 0) -> str:
         puzzle_id = f"{self.year}_{self.day:02d}_{part}"
         if example:
             puzzle_id += f"_example{example_index or ''}"
+        return puzzle_id
 
-        # fetch data from local file, fallback to aocd
+    def data_path(self, *, example: bool = False, example_index: int = 0) -> str:
         data_name = f"example{example_index or ''}" if example else "data"
-        data_name = f"{data_name}{self.day:02d}.txt"
-        data_path = os.path.join(data_dir, data_name)
-        if os.path.exists(data_path):
-            with open(data_path, "r") as f:
-                data_raw = f.read()
-        else:
+        return os.path.join(data_dir, f"{data_name}{self.day:02d}.txt")
+
+    def input(self, *, example: bool = False, example_index: int = 0) -> Input:
+        """
+        Returns the :py:class:`~aoc2024.inputs.Input` of the puzzle or one of its examples, which is read only once per
+        process and provides access to raw bytes, memory views and lines. The input is downloaded via aocd when
+        missing locally.
+        """
+        from aoc2024.inputs import get_input
+
+        # fetch data from local file, fallback to aocd
+        data_path = self.data_path(example=example, example_index=example_index)
+        if not os.path.exists(data_path):
             data_raw = (self.puzzle.examples[example_index] if example else self.puzzle).input_data
             with open(data_path, "w") as f:
                 f.write(data_raw)
 
+        return get_input(data_path)
+
+    def load(self, *, example: bool = False, example_index: int = 0, strip: bool = True) -> list[str]:
         # split into lines
-        data = data_raw.splitlines()
-        if strip:
-            data = [line for line in (line.strip() for line in data) if line]
+        return self.input(example=example, example_index=example_index).lines(strip=strip)
 
-        # header
-        header = f"🎄 {puzzle_id}"
-        if self.has_session:
-            header += f"  ─  {self.puzzle.title}"
-        header += f"  ─  {len(data)} data line{'' if len(data) == 1 else 's'}"
-        header += " 🎄"
-        width = max(len(header) + 2, 40)
-        print(f"{'━' * width}\n{header}\n{'─' * width}")
+    def stream(self, *, example: bool = False, example_index: int = 0, strip: bool = True) -> Iterator[str]:
+        """
+        Returns a lazy iterator over input lines that reads the file in chunks, see
+        :py:func:`~aoc2024.inputs.iter_lines`.
+        """
+        from aoc2024.inputs import iter_lines
+
+        return iter_lines(self.input(example=example, example_index=example_index).path, strip=strip)
+
+    def _load(self, *, stream: bool, **kwargs: Any) -> list[str] | Iterator[str]:
+        return self.stream(**kwargs) if stream else self.load(**kwargs)
+
+    def _parse_cache_key(
+        self,
+        parse: Callable[[Any], Any],
+        *,
+        example: bool,
+        example_index: int,
+        strip: bool,
+    ) -> str:
+        # cache key of the output of parse, depending on the input content and the source of the parser
+        from aoc2024.cache import hash_bytes, hash_source
+
+        inp = self.input(example=example, example_index=example_index)
+        parser_hash = hash_source(parse)
+        key_hash = hash_bytes(f"{parse.__module__}.{parse.__qualname__}:{parser_hash}:{inp.digest}:{strip}")
+        return f"{self.year}_{self.day:02d}_{key_hash[:32]}"
+
+    def _parse(
+        self,
+        parse: Callable[[Any], Any],
+        data: Callable[[], list[str] | Iterator[str]],
+        *,
+        cache: bool,
+        example: bool,
+        example_index: int,
+        strip: bool,
+        key: str | None = None,
+    ) -> tuple[Any, bool]:
+        # calls parse with the lazily loaded data, or loads its output from the parse cache when enabled, and returns
+        # it along with whether it was cached; a precomputed cache key can be passed as key to skip hashing
+        if not cache:
+            return parse(data()), False
+
+        from aoc2024.cache import parse_cache, missing
+
+        if key is None:
+            key = self._parse_cache_key(parse, example=example, example_index=example_index, strip=strip)
+
+        if (parsed := parse_cache.get(key)) is not missing:
+            return parsed, True
+
+        parsed = parse(data())
+        parse_cache.set(key, parsed)
+        return parsed, False
+
+    def run(
+        self,
+        func: Callable[[Any, Part], int | str | None],
+        /,
+        *,
+        part: Part,
+        parse: Callable[[list[str]], Any] | None = None,
+        example: bool = False,
+        example_index: int = 0,
+        strip: bool = True,
+        stream: bool = False,
+        parse_cache: bool = False,
+        cache: bool = False,
+        force: bool = False,
+        timeout: float | None = None,
+        max_memory: int | None = None,
+        profile: bool = False,
+        memory: bool | int = False,
+        counters: bool = False,
+    ) -> Result:
+        """
+        Runs *func* for a single *part* without printing or submitting anything and returns a :py:class:`Result`.
+        Exceptions raised by *func* are not caught. When a *parse* function is given, it is called with the input data
+        first and its return value is passed to *func* instead. With *parse_cache* enabled, its return value is cached
+        on disk, keyed by the content of the input and the source of *parse*. When *stream* is *True*, input lines are
+        passed as a lazy iterator, see :py:meth:`stream`. When *profile* is *True*, the call is profiled with
+        cProfile and stats are dumped to a pstats file whose path is stored in the result. When *memory* is set, memory
+        usage and the top allocation sites (*memory* sites if it is an integer, 10 otherwise) are traced and stored as
+        well. When *counters* is *True*, values collected through :py:func:`count` are stored in the result.
+
+        When *cache* is *True*, results are stored on disk, keyed by the content of the input and the source of the
+        module defining *func*, and a previously stored result (including its runtime) is returned without running
+        *func* again unless *force* is *True*. The cache is bypassed when profiling, tracing memory or collecting
+        counters.
+
+        When a *timeout* in seconds or a *max_memory* budget in bytes is given, the part is run in a child process that
+        is killed on overrun, in which case the result has no value and its *status* is ``"TIMEOUT"`` or ``"OOM"``,
+        see :py:func:`~aoc2024.isolation.run_isolated`. Same as for :py:meth:`solve`, loading and parsing happen in the
+        current process and are not subject to budgets.
+        """
+        assert part in ("a", "b")
+
+        # check the result cache
+        cache_key = None
+        if cache and not (profile or memory or counters):
+            cache_key = self._result_cache_key(func, part, example=example, example_index=example_index, strip=strip)
+            if not force and (res := self._cached_result(cache_key)) is not None:
+                return res
+
+        load = lambda: self._load(stream=stream, example=example, example_index=example_index, strip=strip)
+
+        # optional parsing
+        data: Any
+        parse_time = None
+        parse_cached = False
+        if parse is None:
+            data = load()
+        else:
+            t1 = time.perf_counter()
+            data, parse_cached = self._parse(
+                parse,
+                load,
+                cache=parse_cache,
+                example=example,
+                example_index=example_index,
+                strip=strip,
+            )
+            parse_time = time.perf_counter() - t1
+
+        # run the solution function, optionally in a child process with budgets
+        call = lambda: self._call(
+            func,
+            data,
+            part,
+            example=example,
+            example_index=example_index,
+            profile=profile,
+            memory=memory,
+            counters=counters,
+        )
+        if timeout is None and max_memory is None:
+            res = call()
+        else:
+            from aoc2024.isolation import run_isolated, BudgetExceeded
+
+            t1 = time.perf_counter()
+            try:
+                res = run_isolated(call, timeout=timeout, max_memory=max_memory)
+            except BudgetExceeded as e:
+                res = Result(
+                    puzzle_id=self.puzzle_id(part, example=example, example_index=example_index),
+                    day=self.day,
+                    part=part,
+                    value=None,
+                    truth=None if example else getattr(self, f"truth_{part}"),
+                    runtime=time.perf_counter() - t1,
+                    error=str(e),
+                    status=e.status,
+                )
+        res.parse_time = parse_time
+        res.parse_cached = parse_cached
+
+        # store in the result cache
+        if cache_key is not None and res.value is not None:
+            from aoc2024.cache import result_cache
+            result_cache.set(cache_key, dataclasses.asdict(res))
+
+        return res
+
+    def _result_cache_key(
+        self,
+        func: Callable[[Any, Part], int | str | None],
+        part: Part,
+        *,
+        example: bool,
+        example_index: int,
+        strip: bool,
+    ) -> str:
+        from aoc2024.cache import hash_bytes, hash_modules, package_deps, result_cache_version
+
+        # besides the day module, results depend on the shared modules it uses, e.g. grids and searches
+        inp = self.input(example=example, example_index=example_index)
+        source_hash = hash_modules(package_deps(func.__module__))
+        key_hash = hash_bytes(f"v{result_cache_version}:{func.__module__}:{source_hash}:{inp.digest}:{strip}")
+        return f"{self.puzzle_id(part, example=example, example_index=example_index)}_{key_hash[:32]}"
+
+    def _cached_result(self, key: str) -> Result | None:
+        from aoc2024.cache import result_cache
+
+        data = result_cache.get(key, None)
+        if not isinstance(data, dict):
+            return None
+        try:
+            res = Result(**data)
+        except TypeError:
+            # stored with a different set of fields
+            result_cache.delete(key)
+            return None
+        res.cached = True
+        return res
+
+    def _call(
+        self,
+        func: Callable[[Any, Part], int | str | None],
+        data: Any,
+        part: Part,
+        *,
+        example: bool = False,
+        example_index: int = 0,
+        profile: bool = False,
+        memory: bool | int = False,
+        counters: bool = False,
+    ) -> Result:
+        # calls the solution function, optionally profiled, with memory tracing and counters, and returns the result
+        global _counters
+
+        puzzle_id = self.puzzle_id(part, example=example, example_index=example_index)
+
+        profile_path = None
+        if profile:
+            from aoc2024.profiling import profile_call, profile_path as get_profile_path
+            profile_path = get_profile_path(puzzle_id)
+            call = lambda: profile_call(func, data, part, path=profile_path)
+        else:
+            call = lambda: func(data, part)
+
+        # start with empty per-call memo caches and remember statistics of shared ones
+        _clear_memos("call")
+        memo_stats = None
+        if counters and (memo := sys.modules.get("aoc2024.memo")) is not None:
+            memo_stats = memo.snapshot()
+
+        memory_stats = None
+        if counters:
+            _counters = Counter()
+        try:
+            t1 = time.perf_counter()
+            if memory:
+                from aoc2024.memory import trace_call
+                top = 10 if memory is True else int(memory)
+                value, memory_stats = trace_call(call, code=getattr(func, "__code__", None), top=top)
+            else:
+                value = call()
+            runtime = time.perf_counter() - t1
+        finally:
+            counter_values = dict(_counters or {})
+            _counters = None
+            if counters and (memo := sys.modules.get("aoc2024.memo")) is not None:
+                counter_values.update(memo.collect(memo_stats))
+            _clear_memos("call")
+
+        return Result(
+            puzzle_id=puzzle_id,
+            day=self.day,
+            part=part,
+            value=value,
+            truth=None if example else getattr(self, f"truth_{part}"),
+            runtime=runtime,
+            profile_path=profile_path,
+            memory=memory_stats,
+            counters=counter_values,
+        )
+
+    def benchmark(
+        self,
+        func: Callable[[Any, Part], int | str | None],
+        /,
+        *,
+        part: Part,
+        parse: Callable[[list[str]], Any] | None = None,
+        warmup: int = 1,
+        repeat: int | None = None,
+        min_time: float = 1.0,
+        example: bool = False,
+        example_index: int = 0,
+        strip: bool = True,
+        parse_cache: bool = False,
+        json_path: str | None = None,
+        verbose: bool = True,
+    ) -> list[BenchmarkStats]:
+        """
+        Repeatedly runs *func* for a *part* (or both parts for ``"x"``) and returns timing statistics per part. Each
+        part is called *warmup* times first, followed by *repeat* timed calls. When *repeat* is *None*, it is chosen
+        automatically such that all timed calls of a part take about *min_time* seconds. When a *parse* function is
+        given, it is included in each timed call so that timings remain comparable to single-stage solutions. With
+        *parse_cache* enabled, each timed call loads the cached output of *parse* instead, see :py:meth:`run`.
+        Statistics are optionally written to *json_path*.
+        """
+        from aoc2024.bench import BenchmarkStats, measure, write_json
+
+        assert part in ("a", "b", "x")
+
+        data = self.load(example=example, example_index=example_index, strip=strip)
+
+        # pass a fresh copy of the data in each call as solutions are allowed to change it in-place, and start with
+        # empty memo caches so that timed calls do not profit from previous ones
+        def setup() -> list[str]:
+            _clear_memos()
+            return list(data)
+
+        parts: list[Part] = ["a", "b"] if part == "x" else [part]
+        stats: list[BenchmarkStats] = []
+        for _part in parts:
+            puzzle_id = self.puzzle_id(_part, example=example, example_index=example_index)
+            if verbose:
+                if stats:
+                    print("")
+                self._print_header(puzzle_id, len(data))
+
+            call: Callable[[list[str]], int | str | None]
+            if parse is None:
+                call = lambda data: func(data, _part)
+            else:
+                parse_kwargs: dict[str, Any] = dict(
+                    cache=parse_cache,
+                    example=example,
+                    example_index=example_index,
+                    strip=strip,
+                )
+                # hash the parser and input only once, so that timed calls only load cached outputs
+                if parse_cache:
+                    parse_kwargs["key"] = self._parse_cache_key(
+                        parse,
+                        example=example,
+                        example_index=example_index,
+                        strip=strip,
+                    )
+                call = lambda data: func(self._parse(parse, lambda: data, **parse_kwargs)[0], _part)
+            value, times = measure(
+                call,
+                warmup=warmup,
+                repeat=repeat,
+                min_time=min_time,
+                setup=setup,
+            )
+            part_stats = BenchmarkStats(
+                puzzle_id=puzzle_id,
+                day=self.day,
+                part=_part,
+                value=value,
+                warmup=warmup,
+                times=times,
+            )
+            stats.append(part_stats)
+
+            if verbose:
+                print(f"✨ solution : {value}")
+                if not example and (truth := getattr(self, f"truth_{_part}")) is not None:
+                    print(f"{'✅' if value == truth else '❌'} truth    : {truth}")
+                part_stats.print()
+
+        if json_path:
+            write_json(stats, json_path)
+
+        return stats
+
+    def compare(
+        self,
+        func_a: Callable[[Any, Part], int | str | None],
+        func_b: Callable[[Any, Part], int | str | None],
+        /,
+        *,
+        part: Part,
+        parse: Callable[[list[str]], Any] | None = None,
+        warmup: int = 1,
+        repeat: int | None = None,
+        min_time: float = 1.0,
+        confidence: float = 0.95,
+        example: bool = False,
+        example_index: int = 0,
+        strip: bool = True,
+        verbose: bool = True,
+    ) -> list[ABComparison]:
+        """
+        Compares the runtimes of two solution functions *func_a* and *func_b* for a *part* (or both parts for
+        ``"x"``) on the same input and returns an :py:class:`~aoc2024.bench.ABComparison` per part. Both functions are
+        called *warmup* times first, followed by *repeat* interleaved rounds in alternating order, see
+        :py:func:`~aoc2024.bench.measure_interleaved`. The speedup of *func_b* over *func_a* is reported as the
+        geometric mean of per-round ratios with a bootstrap confidence interval at the *confidence* level, along with
+        whether their results match. Same as for :py:meth:`benchmark`, a *parse* function is included in each call.
+        """
+        from aoc2024.bench import ABComparison, measure_interleaved
+
+        assert part in ("a", "b", "x")
+
+        data = self.load(example=example, example_index=example_index, strip=strip)
+
+        # pass a fresh copy of the data in each call as solutions are allowed to change it in-place, and start with
+        # empty memo caches so that timed calls do not profit from previous ones
+        def setup() -> list[str]:
+            _clear_memos()
+            return list(data)
+
+        parts: list[Part] = ["a", "b"] if part == "x" else [part]
+        comparisons: list[ABComparison] = []
+        for _part in parts:
+            puzzle_id = self.puzzle_id(_part, example=example, example_index=example_index)
+            if verbose:
+                if comparisons:
+                    print("")
+                self._print_header(puzzle_id, len(data))
+
+            if parse is None:
+                call_a = lambda data: func_a(data, _part)
+                call_b = lambda data: func_b(data, _part)
+            else:
+                call_a = lambda data: func_a(parse(data), _part)
+                call_b = lambda data: func_b(parse(data), _part)
+            value_a, value_b, times_a, times_b = measure_interleaved(
+                call_a,
+                call_b,
+                warmup=warmup,
+                repeat=repeat,
+                min_time=min_time,
+                setup=setup,
+            )
+            comparison = ABComparison(
+                puzzle_id=puzzle_id,
+                day=self.day,
+                part=_part,
+                name_a=getattr(func_a, "__name__", "a"),
+                name_b=getattr(func_b, "__name__", "b"),
+                value_a=value_a,
+                value_b=value_b,
+                warmup=warmup,
+                times_a=times_a,
+                times_b=times_b,
+                confidence=confidence,
+            )
+            comparisons.append(comparison)
+
+            if verbose:
+                comparison.print()
+
+        return comparisons
+
+    @staticmethod
+    def map_records(
+        func: Callable[[Any], Any],
+        records: Iterable[Any],
+        reduce: Callable[[Iterable[Any]], Any] = sum,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Applies *func* to independent *records*, e.g. input lines, and combines the results with *reduce*, distributing
+        records over forked worker processes when the input is large enough for this to pay off. All *kwargs* are
+        forwarded to :py:func:`aoc2024.parallel.map_reduce`.
+        """
+        from aoc2024.parallel import map_reduce
+
+        return map_reduce(func, records, reduce, **kwargs)
+
+    def solve(
+        self,
+        func: Callable[[Any, Part], int | str | None],
+        /,
+        *,
+        part: Part,
+        parse: Callable[[list[str]], Any] | None = None,
+        submit: bool = True,
+        example: bool = False,
+        example_index: int = 0,
+        strip: bool = True,
+        stream: bool = False,
+        parse_cache: bool = False,
+        timeout: float | None = None,
+        max_memory: int | None = None,
+        profile: bool | int = False,
+        memory: bool | int = False,
+        counters: bool = False,
+    ) -> None:
+        """
+        Runs *func* for a *part* (or both parts for ``"x"``), prints the result and runtime, and optionally submits
+        the result. Input data is loaded only once. When a *parse* function is given, it is called with the input data
+        only once as well and its return value is shared by all parts, so *func* must not change it in-place. With
+        *parse_cache* enabled, the return value of *parse* is additionally cached on disk across runs, keyed by the
+        content of the input and the source of *parse* (including module-level helpers it refers to). When *stream*
+        is *True*, input lines are instead passed to *func* (or *parse*) as a lazy iterator that reads the input file
+        in chunks, allowing for solutions with constant memory usage, see :py:meth:`stream`.
+
+        When *profile* is set, the call is profiled with cProfile, stats are dumped to a pstats file and the top
+        functions by cumulative and self time are printed (*profile* functions if it is an integer, 10 otherwise).
+        Similarly, when *memory* is set, the peak traced memory and rss as well as the top allocation sites are
+        printed. Note that both options add overhead to the reported runtime. When *counters* is *True*, values
+        collected through :py:func:`count` are printed next to the runtime. Per-part budgets can be set with
+        *timeout* in seconds and *max_memory* in bytes, running each part in a child process that is killed on
+        overrun, see :py:func:`~aoc2024.isolation.run_isolated`. Parsing is not subject to budgets.
+        """
+        assert part in ("a", "b", "x")
 
-        # run the solution function
+        # load data
+        load_kwargs: dict[str, Any] = dict(example=example, example_index=example_index, strip=strip)
+        data = None if stream else self.load(**load_kwargs)
+
+        parsed: Any = None
+        parse_time: float | None = None
+        parts: list[Literal["a", "b"]] = ["a", "b"] if part == "x" else [part]
+        for i, _part in enumerate(parts):
+            # puzzle identifier
+            puzzle_id = self.puzzle_id(_part, example=example, example_index=example_index)
+
+            # header
+            if i > 0:
+                print("")
+            self._print_header(puzzle_id, None if data is None else len(data))
+
+            # parse data once, or pass a fresh copy (or stream) as solutions are allowed to change it in-place
+            if parse is None:
+                inp = self.stream(**load_kwargs) if data is None else list(data)
+            else:
+                if parse_time is None:
+                    t1 = time.perf_counter()
+                    try:
+                        parsed, cached = self._parse(
+                            parse,
+                            lambda: self.stream(**load_kwargs) if data is None else data,  # type: ignore
+                            cache=parse_cache,
+                            **load_kwargs,
+                        )
+                    except:
+                        print(f"🚫 exception while parsing after {human_time_diff(time.perf_counter() - t1)}")
+                        raise
+                    parse_time = time.perf_counter() - t1
+                    print(f"⏰ parse    : {human_time_diff(parse_time)}{' (cached)' if cached else ''}")
+                else:
+                    print(f"⏰ parse    : {human_time_diff(parse_time)} (shared)")
+                inp = parsed
+
+            self._solve_part(
+                func,
+                inp,
+                _part,
+                submit=submit,
+                example=example,
+                example_index=example_index,
+                timeout=timeout,
+                max_memory=max_memory,
+                profile=profile,
+                memory=memory,
+                counters=counters,
+            )
+
+    def _solve_part(
+        self,
+        func: Callable[[Any, Part], int | str | None],
+        data: Any,
+        part: Literal["a", "b"],
+        *,
+        submit: bool,
+        example: bool,
+        example_index: int,
+        timeout: float | None,
+        max_memory: int | None,
+        profile: bool | int,
+        memory: bool | int,
+        counters: bool,
+    ) -> None:
+        # run the solution function, optionally in a child process with budgets
+        call = lambda: self._call(
+            func,
+            data,
+            part,
+            example=example,
+            example_index=example_index,
+            profile=bool(profile),
+            memory=memory,
+            counters=counters,
+        )
         t1 = time.perf_counter()
-        runtime: float = 0
         try:
-            result = func(data, part)
+            if timeout is None and max_memory is None:
+                res = call()
+            else:
+                from aoc2024.isolation import run_isolated, BudgetExceeded
+                try:
+                    res = run_isolated(call, timeout=timeout, max_memory=max_memory)
+                except BudgetExceeded as e:
+                    print(f"{'⏳' if e.status == 'TIMEOUT' else '💥'} {e.status:<8} : {e}")
+                    return
         except:
-            print(f"🚫 exception after {runtime:.2f}s")
+            print(f"🚫 exception after {human_time_diff(time.perf_counter() - t1)}")
             raise
-        finally:
-            runtime = time.perf_counter() - t1
+        result = res.value
 
         # handle the result
         if result is None:
             print("❗️ no solution provided")
+        else:
+            print(f"✨ solution : {result}")
+            if not example and (truth := getattr(self, f"truth_{part}")) is not None:
+                print(f"{'✅' if result == truth else '❌'} truth    : {truth}")
+            print(f"⏰ runtime  : {human_time_diff(res.runtime)}")
+
+        # print counters
+        for line in format_counters(res.counters):
+            print(f"🔢 {line}")
+
+        # print memory stats
+        if res.memory:
+            res.memory.print()
+
+        # print profiling stats
+        if res.profile_path:
+            from aoc2024.profiling import print_profile
+            print(f"🔬 profile  : {res.profile_path}")
+            print_profile(res.profile_path, top=10 if profile is True else int(profile))
+
+        # optionally stop
+        if result is None:
             return
-        print(f"✨ solution : {result}")
-        if not example and (truth := getattr(self, f"truth_{part}")) is not None:
-            print(f"{'✅' if result == truth else '❌'} truth    : {truth}")
-        print(f"⏰ runtime  : {human_time_diff(runtime)}")
 
         # check if submission is an option
         if example:
@@ -191,6 +866,11 @@ def human_time_diff(seconds: float) -> str:
 
 class Point:  # noqa
 
+    __slots__ = ("i", "j")
+
+    i: int
+    j: int
+
     InterpretableTypes: TypeAlias = (
         int |
         float |
@@ -232,34 +912,51 @@ class Point:  # noqa
             return i, j
         return TypeError(f"invalid value for {cls.__name__}: {other}")
 
-    def __init__(
-        self,
-        i: Point | InterpretableTypes | None = None,
-        j: int | None = None,
-        /,
-    ) -> None:
-        super().__init__()
-
+    @classmethod
+    def _cast_args(cls, i: Point | InterpretableTypes | None, j: int | None) -> tuple[int, int]:
         # rearrange values under certain conditions
         if j is None:
             if i is None:
                 i = j = 0
             else:
-                tpl = self._cast_tuple(i)
+                tpl = cls._cast_tuple(i)
                 if isinstance(tpl, Exception):
                     raise tpl
                 i, j = tpl
 
         # final validation
         if not isinstance(i, int):
-            raise TypeError(f"invalid i value for {self.__class__.__name__}: {i}")
+            raise TypeError(f"invalid i value for {cls.__name__}: {i}")
         if not isinstance(j, int):
-            raise TypeError(f"invalid j value for {self.__class__.__name__}: {j}")
+            raise TypeError(f"invalid j value for {cls.__name__}: {j}")
+
+        return i, j
+
+    @classmethod
+    def _from_ij(cls, i: int, j: int) -> Self:
+        # fast constructor skipping casting and validation
+        obj = object.__new__(cls)
+        obj.i = i
+        obj.j = j
+        return obj
+
+    def __init__(
+        self,
+        i: Point | InterpretableTypes | None = None,
+        j: int | None = None,
+        /,
+    ) -> None:
+        # cast values unless plain integers are given (exact type checks are cheapest)
+        if type(i) is not int or type(j) is not int:
+            i, j = self._cast_args(i, j)
 
         # store values
         self.i = i
         self.j = j
 
+    def __reduce__(self) -> tuple[type, tuple[int, int]]:
+        return (self.__class__, (self.i, self.j))
+
     def __repr__(self) -> str:
         return f"({self.i}, {self.j})"
 
@@ -273,25 +970,36 @@ class Point:  # noqa
         return self.i != 0 and self.j != 0
 
     def __eq__(self, other: Any) -> bool:
+        # fast path for points
+        if isinstance(other, Point):
+            return self.i == other.i and self.j == other.j
         tpl = self._cast_tuple(other)
         return False if tpl is None else tpl == (self.i, self.j)
 
     def __neg__(self) -> Self:
-        return self.__class__(-self.i, -self.j)
+        return self._from_ij(-self.i, -self.j)
 
     def __add__(self, other: Point | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point):
+            return self._from_ij(self.i + other.i, self.j + other.j)
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i + tpl[0], self.j + tpl[1])
+        return self._from_ij(self.i + tpl[0], self.j + tpl[1])
 
     def __radd__(self, other: Point | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for +: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] + self.i, tpl[1] + self.j)
+        return self._from_ij(tpl[0] + self.i, tpl[1] + self.j)
 
     def __iadd__(self, other: Point | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point):
+            self.i += other.i
+            self.j += other.j
+            return self
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'")
@@ -300,18 +1008,26 @@ class Point:  # noqa
         return self
 
     def __sub__(self, other: Point | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point):
+            return self._from_ij(self.i - other.i, self.j - other.j)
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for -: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i - tpl[0], self.j - tpl[1])
+        return self._from_ij(self.i - tpl[0], self.j - tpl[1])
 
     def __rsub__(self, other: Point | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for -: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] - self.i, tpl[1] - self.j)
+        return self._from_ij(tpl[0] - self.i, tpl[1] - self.j)
 
     def __isub__(self, other: Point | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point):
+            self.i -= other.i
+            self.j -= other.j
+            return self
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for -: '{type(self)}' and '{type(other)}'")
@@ -320,18 +1036,26 @@ class Point:  # noqa
         return self
 
     def __mul__(self, other: Point | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point):
+            return self._from_ij(self.i * other.i, self.j * other.j)
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for *: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i * tpl[0], self.j * tpl[1])
+        return self._from_ij(self.i * tpl[0], self.j * tpl[1])
 
     def __rmul__(self, other: Point | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for *: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] * self.i, tpl[1] * self.j)
+        return self._from_ij(tpl[0] * self.i, tpl[1] * self.j)
 
     def __imul__(self, other: Point | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point):
+            self.i *= other.i
+            self.j *= other.j
+            return self
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for *: '{type(self)}' and '{type(other)}'")
@@ -354,21 +1078,79 @@ class Point:  # noqa
         return self * factor
 
 
+# slot setters of points, called directly by frozen points to bypass their __setattr__ at the cost of a c call
+_set_i, _set_j = Point.__dict__["i"].__set__, Point.__dict__["j"].__set__
+
+
+class FrozenPoint(Point):
+    """
+    Immutable :py:class:`Point` whose hash is computed only once on first use, to be used as set members or dictionary
+    keys in hot loops. In-place operators return new objects.
+    """
+
+    __slots__ = ("_hash",)
+
+    _hash: int
+
+    @classmethod
+    def _from_ij(cls, i: int, j: int) -> Self:
+        # slots are set through their descriptors to bypass the immutability check
+        obj = object.__new__(cls)
+        _set_i(obj, i)
+        _set_j(obj, j)
+        return obj
+
+    def __init__(
+        self,
+        i: Point | Point.InterpretableTypes | None = None,
+        j: int | None = None,
+        /,
+    ) -> None:
+        if type(i) is not int or type(j) is not int:
+            i, j = self._cast_args(i, j)
+        _set_i(self, i)
+        _set_j(self, j)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            _set_hash(self, h := hash((self.i, self.j)))
+            return h
+
+    # in-place operators fall back to regular ones, returning new objects
+    __iadd__ = Point.__add__
+    __isub__ = Point.__sub__
+    __imul__ = Point.__mul__
+
+
+_set_hash = FrozenPoint.__dict__["_hash"].__set__
+
+
 # derived types
 class Dim(Point):
-    pass
+    __slots__ = ()
 
 
 class Direction(Point):
-    pass
+    __slots__ = ()
 
 
 class Area(Point):
-    pass
+    __slots__ = ()
 
 
 class Point3:
 
+    __slots__ = ("i", "j", "k")
+
+    i: int
+    j: int
+    k: int
+
     InterpretableTypes: TypeAlias = (
         list[int | float] |
         tuple[int | float, int | float, int | float]
@@ -401,38 +1183,61 @@ class Point3:
             return i, j, k
         return TypeError(f"invalid value for {cls.__name__}: {other}")
 
-    def __init__(
-        self,
-        i: Point3 | InterpretableTypes | int | None = None,
-        j: int | None = None,
-        k: int | None = None,
-        /,
-    ) -> None:
-        super().__init__()
-
+    @classmethod
+    def _cast_args(
+        cls,
+        i: Point3 | InterpretableTypes | int | None,
+        j: int | None,
+        k: int | None,
+    ) -> tuple[int, int, int]:
         # rearrange values under certain conditions
         if j is None and k is None:
             if i is None:
                 i = j = k = 0
             else:
-                tpl = self._cast_tuple(i)
+                tpl = cls._cast_tuple(i)
                 if isinstance(tpl, Exception):
                     raise tpl
                 i, j, k = tpl
 
         # final validation
         if not isinstance(i, int):
-            raise TypeError(f"invalid i value for {self.__class__.__name__}: {i}")
+            raise TypeError(f"invalid i value for {cls.__name__}: {i}")
         if not isinstance(j, int):
-            raise TypeError(f"invalid j value for {self.__class__.__name__}: {j}")
+            raise TypeError(f"invalid j value for {cls.__name__}: {j}")
         if not isinstance(k, int):
-            raise TypeError(f"invalid k value for {self.__class__.__name__}: {k}")
+            raise TypeError(f"invalid k value for {cls.__name__}: {k}")
+
+        return i, j, k
+
+    @classmethod
+    def _from_ijk(cls, i: int, j: int, k: int) -> Self:
+        # fast constructor skipping casting and validation
+        obj = object.__new__(cls)
+        obj.i = i
+        obj.j = j
+        obj.k = k
+        return obj
+
+    def __init__(
+        self,
+        i: Point3 | InterpretableTypes | int | None = None,
+        j: int | None = None,
+        k: int | None = None,
+        /,
+    ) -> None:
+        # cast values unless plain integers are given (exact type checks are cheapest)
+        if type(i) is not int or type(j) is not int or type(k) is not int:
+            i, j, k = self._cast_args(i, j, k)
 
         # store values
         self.i = i
         self.j = j
         self.k = k
 
+    def __reduce__(self) -> tuple[type, tuple[int, int, int]]:
+        return (self.__class__, (self.i, self.j, self.k))
+
     def __repr__(self) -> str:
         return f"({self.i}, {self.j}, {self.k})"
 
@@ -446,25 +1251,37 @@ class Point3:
         return self.i != 0 and self.j != 0 and self.k != 0
 
     def __eq__(self, other: Any) -> bool:
+        # fast path for points
+        if isinstance(other, Point3):
+            return self.i == other.i and self.j == other.j and self.k == other.k
         tpl = self._cast_tuple(other)
         return False if tpl is None else tpl == (self.i, self.j, self.k)
 
     def __neg__(self) -> Self:
-        return self.__class__(-self.i, -self.j, -self.k)
+        return self._from_ijk(-self.i, -self.j, -self.k)
 
     def __add__(self, other: Point3 | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point3):
+            return self._from_ijk(self.i + other.i, self.j + other.j, self.k + other.k)
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i + tpl[0], self.j + tpl[1], self.k + tpl[2])
+        return self._from_ijk(self.i + tpl[0], self.j + tpl[1], self.k + tpl[2])
 
     def __radd__(self, other: Point3 | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for +: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] + self.i, tpl[1] + self.j, tpl[2] + self.k)
+        return self._from_ijk(tpl[0] + self.i, tpl[1] + self.j, tpl[2] + self.k)
 
     def __iadd__(self, other: Point3 | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point3):
+            self.i += other.i
+            self.j += other.j
+            self.k += other.k
+            return self
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'")
@@ -474,18 +1291,27 @@ class Point3:
         return self
 
     def __sub__(self, other: Point3 | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point3):
+            return self._from_ijk(self.i - other.i, self.j - other.j, self.k - other.k)
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for -: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i - tpl[0], self.j - tpl[1], self.k - tpl[2])
+        return self._from_ijk(self.i - tpl[0], self.j - tpl[1], self.k - tpl[2])
 
     def __rsub__(self, other: Point3 | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for -: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] - self.i, tpl[1] - self.j, tpl[2] - self.k)
+        return self._from_ijk(tpl[0] - self.i, tpl[1] - self.j, tpl[2] - self.k)
 
     def __isub__(self, other: Point3 | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point3):
+            self.i -= other.i
+            self.j -= other.j
+            self.k -= other.k
+            return self
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for -: '{type(self)}' and '{type(other)}'")
@@ -495,18 +1321,27 @@ class Point3:
         return self
 
     def __mul__(self, other: Point3 | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point3):
+            return self._from_ijk(self.i * other.i, self.j * other.j, self.k * other.k)
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for *: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i * tpl[0], self.j * tpl[1], self.k * tpl[2])
+        return self._from_ijk(self.i * tpl[0], self.j * tpl[1], self.k * tpl[2])
 
     def __rmul__(self, other: Point3 | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for *: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] * self.i, tpl[1] * self.j, tpl[2] * self.k)
+        return self._from_ijk(tpl[0] * self.i, tpl[1] * self.j, tpl[2] * self.k)
 
     def __imul__(self, other: Point3 | InterpretableTypes) -> Self:
+        # fast path for points
+        if isinstance(other, Point3):
+            self.i *= other.i
+            self.j *= other.j
+            self.k *= other.k
+            return self
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for *: '{type(self)}' and '{type(other)}'")
@@ -524,3 +1359,72 @@ class Point3:
             self *= factor
             return self
         return self * factor
+
+
+# slot setters of 3d points, see above
+_set3_i, _set3_j, _set3_k = (Point3.__dict__[attr].__set__ for attr in "ijk")
+
+
+class FrozenPoint3(Point3):
+    """
+    Immutable :py:class:`Point3` whose hash is computed only once on first use, see :py:class:`FrozenPoint`.
+    """
+
+    __slots__ = ("_hash",)
+
+    _hash: int
+
+    @classmethod
+    def _from_ijk(cls, i: int, j: int, k: int) -> Self:
+        # slots are set through their descriptors to bypass the immutability check
+        obj = object.__new__(cls)
+        _set3_i(obj, i)
+        _set3_j(obj, j)
+        _set3_k(obj, k)
+        return obj
+
+    def __init__(
+        self,
+        i: Point3 | Point3.InterpretableTypes | int | None = None,
+        j: int | None = None,
+        k: int | None = None,
+        /,
+    ) -> None:
+        if type(i) is not int or type(j) is not int or type(k) is not int:
+            i, j, k = self._cast_args(i, j, k)
+        _set3_i(self, i)
+        _set3_j(self, j)
+        _set3_k(self, k)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            _set3_hash(self, h := hash((self.i, self.j, self.k)))
+            return h
+
+    # in-place operators fall back to regular ones, returning new objects
+    __iadd__ = Point3.__add__
+    __isub__ = Point3.__sub__
+    __imul__ = Point3.__mul__
+
+
+_set3_hash = FrozenPoint3.__dict__["_hash"].__set__
+
+
+# types in submodules that are imported on first access to keep the package import fast
+_lazy_attrs = {
+    "PointArray": "aoc2024.arrays",
+    "Grid": "aoc2024.grid",
+    "Bitboard": "aoc2024.bitboard",
+}
+
+
+def __getattr__(attr: str) -> Any:
+    if attr in _lazy_attrs:
+        import importlib
+        return getattr(importlib.import_module(_lazy_attrs[attr]), attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
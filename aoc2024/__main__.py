@@ -0,0 +1,218 @@
+# coding: utf-8
+
+"""
+Command line interface, use as ``python -m aoc2024 <command> [options]``.
+"""
+
+from __future__ import annotations
+
+import sys
+import argparse
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc2024", description="aoc2024 command line interface")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # run
+    run_parser = subparsers.add_parser("run", help="run solutions of multiple days and print a summary")
+    run_parser.add_argument("--days", "-d", default="1-25", help="days to run, e.g. '1-5,7'; default: 1-25")
+    run_parser.add_argument("--parts", "-p", default="ab", choices=["a", "b", "ab"], help="parts to run; default: ab")
+    run_parser.add_argument("--jobs", "-j", type=int, default=None, help="number of parallel processes; default: "
+        "number of cpus")
+    run_parser.add_argument("--profile", type=int, default=0, metavar="N", help="profile parts with cProfile, dump "
+        "pstats files and print the top N functions per part; default: 0 (disabled)")
+    run_parser.add_argument("--memory", type=int, default=0, metavar="N", help="trace memory usage and print the top "
+        "N allocation sites per part; default: 0 (disabled)")
+    run_parser.add_argument("--counters", action="store_true", help="collect and print hot-path counters")
+    run_parser.add_argument("--parse-cache", action="store_true", help="cache outputs of parse stages on disk")
+    run_parser.add_argument("--cache", action="store_true", help="reuse stored results of parts whose input and module "
+        "source did not change")
+    run_parser.add_argument("--force", "-f", action="store_true", help="recompute and store results even if cached")
+    run_parser.add_argument("--timeout", type=float, default=None, metavar="SECONDS", help="time budget per part, "
+        "parts are run in child processes and killed on overrun; default: no budget")
+    run_parser.add_argument("--max-memory", type=float, default=None, metavar="MIB", help="memory budget per part in "
+        "MiB, parts are run in child processes with limited address space; default: no budget")
+
+    # bench
+    bench_parser = subparsers.add_parser("bench", help="benchmark solutions with repeated, timed calls")
+    bench_parser.add_argument("--days", "-d", default="1-25", help="days to benchmark, e.g. '1-5,7'; default: 1-25")
+    bench_parser.add_argument("--parts", "-p", default="ab", choices=["a", "b", "ab"], help="parts to benchmark; "
+        "default: ab")
+    bench_parser.add_argument("--jobs", "-j", type=int, default=1, help="number of parallel processes; default: 1")
+    bench_parser.add_argument("--warmup", "-w", type=int, default=1, help="number of untimed warmup calls; default: 1")
+    bench_parser.add_argument("--repeat", "-r", type=int, default=None, help="number of timed calls; default: chosen "
+        "automatically per part based on --min-time")
+    bench_parser.add_argument("--min-time", "-t", type=float, default=1.0, help="targeted total time in seconds of "
+        "timed calls per part when --repeat is not set; default: 1.0")
+    bench_parser.add_argument("--json", "-o", dest="json_path", help="json file to write results to, e.g. to be "
+        "used as a baseline later on")
+    bench_parser.add_argument("--baseline", "-b", dest="baseline_path", help="json file with baseline results to "
+        "compare against")
+    bench_parser.add_argument("--max-ratio", "-m", type=float, default=1.2, help="maximum ratio of median runtimes "
+        "w.r.t. the baseline before a part is considered a regression; default: 1.2")
+    bench_parser.add_argument("--parse-cache", action="store_true", help="load outputs of parse stages from the "
+        "on-disk cache instead of parsing in each timed call")
+
+    # importtime
+    importtime_parser = subparsers.add_parser("importtime", help="measure import times of day modules in fresh "
+        "interpreters")
+    importtime_parser.add_argument("--days", "-d", default="1-25", help="days to measure, e.g. '1-5,7'; default: "
+        "1-25")
+    importtime_parser.add_argument("--top", "-n", type=int, default=3, help="number of slowest direct imports to "
+        "show per day; default: 3")
+
+    # coldstart
+    coldstart_parser = subparsers.add_parser("coldstart", help="break down the wall time of running parts in fresh "
+        "interpreters into phases")
+    coldstart_parser.add_argument("--days", "-d", default="1-25", help="days to measure, e.g. '1-5,7'; default: "
+        "1-25")
+    coldstart_parser.add_argument("--parts", "-p", default="ab", choices=["a", "b", "ab"], help="parts to measure; "
+        "default: ab")
+    coldstart_parser.add_argument("--repeat", "-r", type=int, default=1, help="number of measurements per part, the "
+        "median per phase is reported; default: 1")
+
+    # scale
+    scale_parser = subparsers.add_parser("scale", help="time solutions on synthetic inputs of growing size and fit "
+        "their complexity exponents")
+    scale_parser.add_argument("--days", "-d", default="1-25", help="days to measure, e.g. '1-5,7', days without input "
+        "generator are skipped; default: 1-25")
+    scale_parser.add_argument("--parts", "-p", default="ab", choices=["a", "b", "ab"], help="parts to measure; "
+        "default: ab")
+    scale_parser.add_argument("--sizes", "-s", default=None, help="comma-separated sizes to generate inputs for; "
+        "default: sizes defined per day")
+    scale_parser.add_argument("--repeat", "-r", type=int, default=3, help="number of timed calls per size, the "
+        "minimum is reported; default: 3")
+    scale_parser.add_argument("--timeout", "-t", type=float, default=10.0, help="time budget in seconds per size, "
+        "larger sizes are skipped on overrun; default: 10.0")
+    scale_parser.add_argument("--seed", type=int, default=0, help="random seed for input generation; default: 0")
+    scale_parser.add_argument("--max-exponent", "-m", type=float, default=1.5, help="exponent above which parts are "
+        "flagged; default: 1.5")
+
+    # diff
+    diff_parser = subparsers.add_parser("diff", help="check alternative implementations against reference solutions "
+        "and report speedups")
+    diff_parser.add_argument("--days", "-d", default="1-25", help="days to check, e.g. '1-5,7', days without variants "
+        "are skipped; default: 1-25")
+    diff_parser.add_argument("--parts", "-p", default="ab", choices=["a", "b", "ab"], help="parts to check; default: "
+        "ab")
+    diff_parser.add_argument("--random", "-n", dest="n_random", type=int, default=5, help="number of generated inputs "
+        "per day; default: 5")
+    diff_parser.add_argument("--seed", type=int, default=0, help="random seed for input generation; default: 0")
+    diff_parser.add_argument("--min-time", "-t", type=float, default=0.5, help="targeted total time in seconds of "
+        "timed calls on the puzzle input, the minimum is reported; default: 0.5")
+
+    # watch
+    watch_parser = subparsers.add_parser("watch", help="run a day in a warm interpreter and re-run it whenever its "
+        "module is saved")
+    watch_parser.add_argument("day", help="day to watch, e.g. 'day06' or '6'")
+    watch_parser.add_argument("--parts", "-p", default="ab", choices=["a", "b", "ab"], help="parts to run; default: "
+        "ab")
+    watch_parser.add_argument("--interval", "-i", type=float, default=0.5, help="polling interval in seconds; "
+        "default: 0.5")
+
+    # microbench
+    microbench_parser = subparsers.add_parser("microbench", help="measure the cost of basic operations on point "
+        "types compared to tuples and complex numbers")
+    microbench_parser.add_argument("--repeat", "-r", type=int, default=5, help="number of measurements per operation, "
+        "the minimum is reported; default: 5")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        from aoc2024.runner import parse_days, run
+
+        results = run(
+            parse_days(args.days),
+            parts=args.parts,
+            jobs=args.jobs,
+            profile=args.profile,
+            memory=args.memory,
+            counters=args.counters,
+            parse_cache=args.parse_cache,
+            cache=args.cache,
+            force=args.force,
+            timeout=args.timeout,
+            max_memory=None if args.max_memory is None else int(args.max_memory * 1024**2),
+        )
+        return 0 if all(res.correct is not False and not res.error for res in results) else 1
+
+    if args.command == "bench":
+        from aoc2024.runner import parse_days, bench
+
+        _, comparisons = bench(
+            parse_days(args.days),
+            parts=args.parts,
+            jobs=args.jobs,
+            json_path=args.json_path,
+            baseline_path=args.baseline_path,
+            max_ratio=args.max_ratio,
+            warmup=args.warmup,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            parse_cache=args.parse_cache,
+        )
+        return 1 if any(c.regressed for c in comparisons) else 0
+
+    if args.command == "importtime":
+        from aoc2024.runner import parse_days, print_import_times
+
+        print_import_times(parse_days(args.days), top=args.top)
+        return 0
+
+    if args.command == "coldstart":
+        from aoc2024.runner import parse_days, print_cold_starts
+
+        print_cold_starts(parse_days(args.days), parts=args.parts, repeat=args.repeat)
+        return 0
+
+    if args.command == "scale":
+        from aoc2024.runner import parse_days, print_scaling
+
+        print_scaling(
+            parse_days(args.days),
+            parts=args.parts,
+            sizes=[int(size) for size in args.sizes.split(",")] if args.sizes else None,
+            repeat=args.repeat,
+            timeout=args.timeout,
+            seed=args.seed,
+            max_exponent=args.max_exponent,
+        )
+        return 0
+
+    if args.command == "diff":
+        from aoc2024.runner import parse_days
+        from aoc2024.differential import print_variant_checks
+
+        checks = print_variant_checks(
+            parse_days(args.days),
+            parts=args.parts,
+            n_random=args.n_random,
+            seed=args.seed,
+            min_time=args.min_time,
+        )
+        return 0 if all(c.ok for c in checks) else 1
+
+    if args.command == "watch":
+        from aoc2024.runner import parse_days, watch
+
+        try:
+            days = parse_days(args.day.lower().removeprefix("day").lstrip("0") or "0")
+        except ValueError as e:
+            parser.error(f"invalid day '{args.day}': {e}")
+        if len(days) != 1:
+            parser.error("watch expects a single day")
+        watch(days[0], parts=args.parts, interval=args.interval)
+        return 0
+
+    if args.command == "microbench":
+        from aoc2024.bench import print_point_micro_benchmark
+
+        print_point_micro_benchmark(repeat=args.repeat)
+        return 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+# coding: utf-8
+
+"""
+NumPy-backed containers for batched coordinate operations.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Any, Self
+
+import numpy as np
+
+from aoc2024 import Point
+
+
+class PointArray:
+    """
+    Array of *n* 2D points stored as an integer array of shape ``(n, 2)``, with columns ``i`` and ``j`` following the
+    convention of :py:class:`aoc2024.Point`. Arithmetic is vectorized and accepts other point arrays of the same length
+    (element-wise), as well as single points given as :py:class:`aoc2024.Point`, tuples, complex numbers or arrays of
+    shape ``(2,)`` (broadcast to all elements). Indexing with integers returns a :py:class:`aoc2024.Point`, while
+    slices, index arrays and boolean masks return a new point array.
+    """
+
+    dtype = np.int64
+
+    def __init__(self, data: Iterable[Point | tuple[int, int]] | np.ndarray | None = None, /) -> None:
+        super().__init__()
+
+        if data is None:
+            arr = np.empty((0, 2), dtype=self.dtype)
+        elif isinstance(data, np.ndarray):
+            arr = data.astype(self.dtype, copy=False)
+        else:
+            arr = np.array([(p.i, p.j) if isinstance(p, Point) else p for p in data], dtype=self.dtype)
+            if arr.size == 0:
+                arr = arr.reshape(0, 2)
+
+        # validation
+        if arr.ndim != 2 or arr.shape[1] != 2:
+            raise ValueError(f"invalid shape for {self.__class__.__name__}: {arr.shape}")
+
+        # store values
+        self.data = arr
+
+    @classmethod
+    def from_complex(cls, values: Iterable[complex] | np.ndarray) -> Self:
+        """
+        Creates a point array from complex numbers whose real and imaginary parts denote ``i`` and ``j``.
+        """
+        values = np.asarray(values if isinstance(values, np.ndarray) else list(values), dtype=complex)
+        arr = np.stack([values.real, values.imag], axis=1)
+        # parts must be integers
+        if not np.array_equal(arr, np.round(arr)):
+            raise ValueError(f"invalid values for {cls.__name__}: complex numbers with non-integer parts")
+        return cls(arr)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], sep: str = ",", *, swap: bool = False) -> Self:
+        """
+        Parses *lines* containing two integers separated by *sep* into a point array. When *swap* is *True*, the first
+        number denotes ``j`` and the second one ``i``, e.g. for ``x,y`` coordinates.
+        """
+        arr = np.array([line.split(sep) for line in lines], dtype=cls.dtype).reshape(-1, 2)
+        return cls(arr[:, ::-1] if swap else arr)
+
+    @classmethod
+    def where(cls, mask: np.ndarray) -> Self:
+        """
+        Returns the positions of all *True* values in a 2D boolean *mask*, in row-major order.
+        """
+        return cls(np.argwhere(mask))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.data.tolist()})"
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[Point]:
+        for i, j in self.data.tolist():
+            yield Point._from_ij(i, j)
+
+    def __getitem__(self, index: Any) -> Point | Self:
+        if isinstance(index, (int, np.integer)):
+            i, j = self.data[index].tolist()
+            return Point._from_ij(i, j)
+        return self.__class__(self.data[index])
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PointArray):
+            return NotImplemented
+        return self.data.shape == other.data.shape and bool((self.data == other.data).all())
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def i(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    @property
+    def j(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    @classmethod
+    def _cast_operand(cls, other: Any) -> np.ndarray | None:
+        # returns an array of shape (2,) or (n, 2) for supported operands, or None
+        if isinstance(other, PointArray):
+            return other.data
+        if isinstance(other, Point):
+            return np.array((other.i, other.j), dtype=cls.dtype)
+        if isinstance(other, complex):
+            # parts must be integers
+            if not other.real.is_integer() or not other.imag.is_integer():
+                raise ValueError(f"invalid value for {cls.__name__}: {other}")
+            return np.array((int(other.real), int(other.imag)), dtype=cls.dtype)
+        if isinstance(other, (tuple, list, np.ndarray)):
+            arr = np.asarray(other)
+            if arr.shape[-1:] == (2,) and arr.ndim <= 2:
+                return arr
+        return None
+
+    def __add__(self, other: Any) -> Self:
+        if (arr := self._cast_operand(other)) is None:
+            return NotImplemented
+        return self.__class__(self.data + arr)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> Self:
+        if (arr := self._cast_operand(other)) is None:
+            return NotImplemented
+        return self.__class__(self.data - arr)
+
+    def __rsub__(self, other: Any) -> Self:
+        if (arr := self._cast_operand(other)) is None:
+            return NotImplemented
+        return self.__class__(arr - self.data)
+
+    def __mul__(self, other: Any) -> Self:
+        # scaling by an integer or per-axis factors
+        if isinstance(other, (int, np.integer)):
+            return self.__class__(self.data * other)
+        if (arr := self._cast_operand(other)) is None:
+            return NotImplemented
+        return self.__class__(self.data * arr)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> Self:
+        return self.__class__(-self.data)
+
+    def in_bounds(self, shape: tuple[int, int]) -> np.ndarray:
+        """
+        Returns a boolean mask of points with ``0 <= i < shape[0]`` and ``0 <= j < shape[1]``.
+        """
+        # comparing columns separately is much faster than reducing over the short axis
+        i, j = self.i, self.j
+        return (i >= 0) & (i < shape[0]) & (j >= 0) & (j < shape[1])
+
+    def clip(self, shape: tuple[int, int]) -> Self:
+        """
+        Returns a point array with only those points that are within bounds of a grid with a certain *shape*.
+        """
+        return self.__class__(self.data[self.in_bounds(shape)])
+
+    def wrap(self, shape: tuple[int, int]) -> Self:
+        """
+        Returns a point array with coordinates wrapped into a grid with a certain *shape* via modulo.
+        """
+        return self.__class__(self.data % shape)
+
+    def unique(self) -> Self:
+        """
+        Returns a point array with duplicate points removed, sorted by ``i`` and ``j``.
+        """
+        return self.__class__(np.unique(self.data, axis=0))
+
+    def to_grid(self, shape: tuple[int, int], dtype: type = bool) -> np.ndarray:
+        """
+        Returns a grid with a certain *shape* that marks all points within bounds. For boolean *dtype*'s, marked cells
+        are *True*, otherwise they contain the number of points per cell.
+        """
+        grid: np.ndarray = np.zeros(shape, dtype=dtype)
+        data = self.data[self.in_bounds(shape)]
+        if dtype is bool:
+            grid[data[:, 0], data[:, 1]] = True
+        else:
+            np.add.at(grid, (data[:, 0], data[:, 1]), 1)
+        return grid
+
+    def in_grid(self, grid: np.ndarray) -> np.ndarray:
+        """
+        Returns a boolean mask of points that refer to truthy cells of a 2D *grid*, with points out of bounds being
+        *False*.
+        """
+        mask = self.in_bounds(grid.shape)  # type: ignore[arg-type]
+        data = self.data[mask]
+        mask[mask] = grid[data[:, 0], data[:, 1]].astype(bool)
+        return mask
@@ -0,0 +1,385 @@
+# coding: utf-8
+
+"""
+Statistical benchmarking of solution functions.
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import math
+import time
+import random
+import timeit
+import platform
+import statistics
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Any
+
+from aoc2024 import Part, human_time_diff
+
+
+@dataclass
+class BenchmarkStats:
+    """
+    Timing statistics of repeated calls of a solution function for a single puzzle part.
+    """
+
+    puzzle_id: str
+    day: int
+    part: Part
+    value: int | str | None
+    warmup: int
+    times: list[float] = field(repr=False)
+
+    @property
+    def repeat(self) -> int:
+        return len(self.times)
+
+    @property
+    def min(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.times)
+
+    @property
+    def p95(self) -> float:
+        if len(self.times) < 2:
+            return self.times[0]
+        return statistics.quantiles(self.times, n=20, method="inclusive")[-1]
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        d = asdict(self)
+        d.pop("times")
+        d.update({
+            attr: getattr(self, attr)
+            for attr in ["repeat", "min", "median", "mean", "p95", "stddev"]
+        })
+        return d
+
+    def print(self) -> None:
+        print(f"🔁 repeats  : {self.warmup} warmup + {self.repeat} timed")
+        for attr in ["min", "median", "mean", "p95", "stddev"]:
+            print(f"⏰ {attr:<8} : {human_time_diff(getattr(self, attr))}")
+
+
+def measure(
+    call: Callable[..., Any],
+    *,
+    warmup: int = 1,
+    repeat: int | None = None,
+    min_time: float = 1.0,
+    max_repeat: int = 10_000,
+    setup: Callable[[], Any] | None = None,
+) -> tuple[Any, list[float]]:
+    """
+    Calls *call* *warmup* times without timing it, followed by *repeat* timed calls and returns the last return value
+    and the list of measured times in seconds. When *repeat* is *None*, it is chosen such that the timed calls take
+    roughly *min_time* seconds in total, capped at *max_repeat*. *setup*, when given, is invoked before each call
+    outside of the timed region and its return value is passed to *call*.
+    """
+    def timed() -> tuple[Any, float]:
+        args = () if setup is None else (setup(),)
+        t1 = time.perf_counter()
+        ret = call(*args)
+        return ret, time.perf_counter() - t1
+
+    for _ in range(warmup):
+        timed()
+
+    # first timed call, also used to estimate the number of repetitions
+    ret, t = timed()
+    times = [t]
+    if repeat is None:
+        repeat = max(1, min(max_repeat, math.ceil(min_time / max(t, 1e-9))))
+
+    for _ in range(repeat - 1):
+        ret, t = timed()
+        times.append(t)
+
+    return ret, times
+
+
+def measure_interleaved(
+    call_a: Callable[..., Any],
+    call_b: Callable[..., Any],
+    *,
+    warmup: int = 1,
+    repeat: int | None = None,
+    min_time: float = 1.0,
+    max_repeat: int = 10_000,
+    setup: Callable[[], Any] | None = None,
+) -> tuple[Any, Any, list[float], list[float]]:
+    """
+    Same as :py:func:`measure`, but for two calls *call_a* and *call_b* that are timed in alternating order (ABBA) per
+    round so that drifts in thermal state and caches affect both equally. Returns the last return values of both
+    calls and their lists of measured times. When *repeat* is *None*, the number of rounds is chosen such that all
+    timed calls take roughly *min_time* seconds in total, with at least three rounds.
+    """
+    def timed(call: Callable[..., Any]) -> tuple[Any, float]:
+        args = () if setup is None else (setup(),)
+        t1 = time.perf_counter()
+        ret = call(*args)
+        return ret, time.perf_counter() - t1
+
+    for _ in range(warmup):
+        timed(call_a)
+        timed(call_b)
+
+    rets: list[Any] = [None, None]
+    times: tuple[list[float], list[float]] = ([], [])
+    i = 0
+    while repeat is None or i < repeat:
+        # alternate the order in each round
+        for j in ((0, 1) if i % 2 == 0 else (1, 0)):
+            rets[j], t = timed((call_a, call_b)[j])
+            times[j].append(t)
+        i += 1
+        # estimate the number of rounds after the first one
+        if repeat is None:
+            repeat = max(3, min(max_repeat, math.ceil(min_time / max(times[0][0] + times[1][0], 1e-9))))
+
+    return rets[0], rets[1], times[0], times[1]
+
+
+def bootstrap_ci(
+    ratios: list[float],
+    confidence: float = 0.95,
+    n_resamples: int = 2000,
+    seed: int = 0,
+) -> tuple[float, float]:
+    """
+    Returns the bootstrap confidence interval of the geometric mean of *ratios* at a *confidence* level, using
+    *n_resamples* resamples drawn with a fixed *seed*.
+    """
+    rng = random.Random(seed)
+    logs = [math.log(r) for r in ratios]
+    means = sorted(statistics.fmean(rng.choices(logs, k=len(logs))) for _ in range(n_resamples))
+    alpha = (1 - confidence) / 2
+    lower = means[int(alpha * (n_resamples - 1))]
+    upper = means[int(math.ceil((1 - alpha) * (n_resamples - 1)))]
+    return math.exp(lower), math.exp(upper)
+
+
+@dataclass
+class ABComparison:
+    """
+    Interleaved timings of two solution functions *name_a* and *name_b* for a single puzzle part.
+    """
+
+    puzzle_id: str
+    day: int
+    part: Part
+    name_a: str
+    name_b: str
+    value_a: int | str | None
+    value_b: int | str | None
+    warmup: int
+    times_a: list[float] = field(repr=False)
+    times_b: list[float] = field(repr=False)
+    confidence: float = 0.95
+
+    @property
+    def match(self) -> bool:
+        return self.value_a == self.value_b
+
+    @property
+    def ratios(self) -> list[float]:
+        # per-round speedups of b over a
+        return [ta / max(tb, 1e-12) for ta, tb in zip(self.times_a, self.times_b)]
+
+    @property
+    def speedup(self) -> float:
+        # geometric mean of per-round speedups of b over a
+        return math.exp(statistics.fmean(math.log(r) for r in self.ratios))
+
+    @property
+    def speedup_ci(self) -> tuple[float, float]:
+        return bootstrap_ci(self.ratios, confidence=self.confidence)
+
+    @property
+    def significant(self) -> bool:
+        lower, upper = self.speedup_ci
+        return lower > 1 or upper < 1
+
+    def print(self) -> None:
+        lower, upper = self.speedup_ci
+        print(f"🔁 repeats  : {self.warmup} warmup + {len(self.times_a)} interleaved rounds")
+        print(f"⏰ median a : {human_time_diff(statistics.median(self.times_a))} ({self.name_a})")
+        print(f"⏰ median b : {human_time_diff(statistics.median(self.times_b))} ({self.name_b})")
+        print(
+            f"🚀 speedup  : {self.speedup:.3f}x of b over a, {self.confidence:.0%} ci [{lower:.3f}x, {upper:.3f}x]"
+            f"{'' if self.significant else ', not significant'}",
+        )
+        if self.match:
+            print(f"✅ results  : {self.value_a}")
+        else:
+            print(f"❌ results  : {self.value_a} != {self.value_b}")
+
+
+def write_json(stats: list[BenchmarkStats], path: str) -> None:
+    """
+    Writes a list of benchmark *stats* including some information about the environment to a json file at *path*.
+    """
+    content = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": [s.to_dict() for s in stats],
+    }
+    with open(path, "w") as f:
+        json.dump(content, f, indent=4)
+
+
+def read_json(path: str) -> dict[str, dict[str, Any]]:
+    """
+    Reads benchmark results written by :py:func:`write_json` from *path* and returns them mapped to their puzzle ids.
+    """
+    with open(path, "r") as f:
+        content = json.load(f)
+    return {d["puzzle_id"]: d for d in content["results"]}
+
+
+@dataclass
+class Comparison:
+    """
+    Comparison of the median runtime of a puzzle part against a baseline.
+    """
+
+    puzzle_id: str
+    day: int
+    part: Part
+    median: float
+    baseline: float | None
+    max_ratio: float
+
+    @property
+    def ratio(self) -> float | None:
+        return None if self.baseline is None else self.median / self.baseline
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio is not None and self.ratio > self.max_ratio
+
+    @property
+    def improved(self) -> bool:
+        return self.ratio is not None and self.ratio < 1 / self.max_ratio
+
+    @property
+    def change(self) -> str:
+        if (ratio := self.ratio) is None:
+            return "new"
+        if ratio >= 1:
+            return f"{ratio:.2f}x slower"
+        return f"{1 / ratio:.2f}x faster"
+
+
+def compare(
+    stats: list[BenchmarkStats],
+    baseline: dict[str, dict[str, Any]],
+    max_ratio: float = 1.2,
+) -> list[Comparison]:
+    """
+    Compares the median runtimes in *stats* against a *baseline* as returned by :py:func:`read_json`. Parts whose
+    median grew by more than a factor *max_ratio* are considered regressions.
+    """
+    return [
+        Comparison(
+            puzzle_id=s.puzzle_id,
+            day=s.day,
+            part=s.part,
+            median=s.median,
+            baseline=baseline[s.puzzle_id]["median"] if s.puzzle_id in baseline else None,
+            max_ratio=max_ratio,
+        )
+        for s in stats
+    ]
+
+
+def point_micro_benchmark(repeat: int = 5) -> dict[str, dict[str, float | None]]:
+    """
+    Measures the cost of basic operations on 2D and 3D points in nanoseconds, comparing :py:class:`aoc2024.Point`,
+    :py:class:`aoc2024.FrozenPoint` and their 3D counterparts against plain tuples and complex numbers. The number of
+    loops per measurement is determined automatically and the minimum of *repeat* measurements is reported. Returns a
+    dictionary mapping operation names to dictionaries that map type names to times, or *None* for unsupported
+    combinations.
+    """
+    from aoc2024 import Point, FrozenPoint, Point3, FrozenPoint3
+
+    # statements per operation and type, evaluated with a and b being instances, s a set containing a and i, j and k
+    # being integers
+    stmts: dict[str, dict[str, str]] = {
+        "construct": {
+            "tuple": "(i, j)",
+            "complex": "complex(i, j)",
+            **dict.fromkeys(["Point", "FrozenPoint"], "T(i, j)"),
+            **dict.fromkeys(["Point3", "FrozenPoint3"], "T(i, j, k)"),
+        },
+        "add point": {
+            "tuple": "(a[0] + b[0], a[1] + b[1])",
+            "complex": "a + b",
+            **dict.fromkeys(["Point", "FrozenPoint", "Point3", "FrozenPoint3"], "a + b"),
+        },
+        "add tuple": {
+            **dict.fromkeys(["Point", "FrozenPoint"], "a + (1, 2)"),
+            **dict.fromkeys(["Point3", "FrozenPoint3"], "a + (1, 2, 3)"),
+        },
+        "eq": dict.fromkeys(["tuple", "complex", "Point", "FrozenPoint", "Point3", "FrozenPoint3"], "a == b"),
+        "hash": dict.fromkeys(["tuple", "complex", "Point", "FrozenPoint", "Point3", "FrozenPoint3"], "hash(a)"),
+        "set lookup": dict.fromkeys(["tuple", "complex", "Point", "FrozenPoint", "Point3", "FrozenPoint3"], "a in s"),
+    }
+
+    # instances per type, using non-literal values to avoid constant folding
+    types: dict[str, tuple[Any, Any, Any]] = {
+        "tuple": (tuple, tuple([1, 2]), tuple([3, 4])),
+        "complex": (complex, complex(1, 2), complex(3, 4)),
+        "Point": (Point, Point(1, 2), Point(3, 4)),
+        "FrozenPoint": (FrozenPoint, FrozenPoint(1, 2), FrozenPoint(3, 4)),
+        "Point3": (Point3, Point3(1, 2, 3), Point3(3, 4, 5)),
+        "FrozenPoint3": (FrozenPoint3, FrozenPoint3(1, 2, 3), FrozenPoint3(3, 4, 5)),
+    }
+
+    results: dict[str, dict[str, float | None]] = {}
+    for op, op_stmts in stmts.items():
+        results[op] = {}
+        for name, (T, a, b) in types.items():
+            if name not in op_stmts:
+                results[op][name] = None
+                continue
+            timer = timeit.Timer(op_stmts[name], globals={"T": T, "a": a, "b": b, "s": {a}, "i": 1, "j": 2, "k": 3})
+            number, _ = timer.autorange()
+            results[op][name] = min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+    return results
+
+
+def print_point_micro_benchmark(repeat: int = 5) -> dict[str, dict[str, float | None]]:
+    """
+    Runs :py:func:`point_micro_benchmark`, prints a table with the cost per operation and type and returns the results.
+    """
+    from tabulate import tabulate
+
+    results = point_micro_benchmark(repeat=repeat)
+    names = list(next(iter(results.values())))
+    rows = [
+        [op] + ["-" if (t := times[name]) is None else f"{t:.0f} ns" for name in names]
+        for op, times in results.items()
+    ]
+    print(tabulate(rows, headers=["operation"] + names, colalign=["left"] + ["right"] * len(names)))
+
+    return results
@@ -0,0 +1,198 @@
+# coding: utf-8
+
+"""
+Boolean grids packed into Python ints for bit-parallel operations.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Iterable, Iterator, Any, Self
+
+
+@functools.cache
+def full_mask(height: int, width: int) -> int:
+    """
+    Returns the bits of all cells of a bitboard with *height* and *width*, with guard bits cleared.
+    """
+    stride = width + 1
+    row = (1 << width) - 1
+    # repeat the row pattern via a geometric series of shifts
+    return row * (((1 << (stride * height)) - 1) // ((1 << stride) - 1)) if height else 0
+
+
+class Bitboard:
+    """
+    Boolean grid of *height* rows and *width* columns packed into a single Python int *bits*, with cell ``(i, j)``
+    stored at bit ``i * stride + j``. Each row is followed by an always-cleared guard bit (``stride = width + 1``), so
+    that horizontal shifts do not leak into adjacent rows. Operations return new bitboards, so that a whole set of
+    cells, e.g. a BFS frontier, advances in a few big-int operations:
+
+    .. code-block:: python
+
+        free = Bitboard.from_lines(data, "#").invert()
+        frontier = Bitboard.from_cells(h, w, [(0, 0)])
+        frontier = frontier.dilate() & free
+    """
+
+    __slots__ = ("height", "width", "stride", "mask", "bits")
+
+    def __init__(self, height: int, width: int, bits: int = 0) -> None:
+        super().__init__()
+
+        # attributes
+        self.height = height
+        self.width = width
+        self.stride = width + 1
+        self.mask = full_mask(height, width)
+        self.bits = bits & self.mask
+
+    @classmethod
+    def from_lines(cls, lines: list[str], chars: str) -> Self:
+        """
+        Creates a bitboard from *lines* with bits set for all cells containing one of *chars*.
+        """
+        height, width = len(lines), len(lines[0]) if lines else 0
+        # build a string of binary digits with the least significant bit (0, 0) last and guard bits in between rows
+        table = str.maketrans({c: ("1" if c in chars else "0") for line in lines for c in set(line)})
+        digits = "0".join(line.translate(table)[::-1] for line in reversed(lines))
+        return cls(height, width, int(digits, 2) if digits else 0)
+
+    @classmethod
+    def from_cells(cls, height: int, width: int, cells: Iterable[tuple[int, int]]) -> Self:
+        """
+        Creates a bitboard with bits set for all *cells* given as ``(i, j)`` coordinates.
+        """
+        stride, bits = width + 1, 0
+        for i, j in cells:
+            bits |= 1 << (i * stride + j)
+        return cls(height, width, bits)
+
+    def _new(self, bits: int) -> Self:
+        # fast constructor for bits that are known to have cleared guard bits
+        board = object.__new__(self.__class__)
+        board.height, board.width, board.stride, board.mask = self.height, self.width, self.stride, self.mask
+        board.bits = bits
+        return board
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(height={self.height}, width={self.width}, count={len(self)})"
+
+    def __str__(self) -> str:
+        return "\n".join(
+            "".join("#" if self.bits >> (i * self.stride + j) & 1 else "." for j in range(self.width))
+            for i in range(self.height)
+        )
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Bitboard):
+            return NotImplemented
+        return (self.height, self.width, self.bits) == (other.height, other.width, other.bits)
+
+    def __hash__(self) -> int:
+        return hash((self.height, self.width, self.bits))
+
+    def __contains__(self, cell: tuple[int, int]) -> bool:
+        i, j = cell
+        return 0 <= i < self.height and 0 <= j < self.width and bool(self.bits >> (i * self.stride + j) & 1)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        # coordinates of all set cells in row-major order
+        bits, stride = self.bits, self.stride
+        while bits:
+            low = bits & -bits
+            yield divmod(low.bit_length() - 1, stride)
+            bits ^= low
+
+    def __and__(self, other: Bitboard) -> Self:
+        return self._new(self.bits & other.bits)
+
+    def __or__(self, other: Bitboard) -> Self:
+        return self._new(self.bits | other.bits)
+
+    def __xor__(self, other: Bitboard) -> Self:
+        return self._new(self.bits ^ other.bits)
+
+    def __sub__(self, other: Bitboard) -> Self:
+        return self._new(self.bits & ~other.bits)
+
+    def invert(self) -> Self:
+        return self._new(self.bits ^ self.mask)
+
+    def set(self, i: int, j: int) -> Self:
+        return self._new(self.bits | 1 << (i * self.stride + j))
+
+    def clear(self, i: int, j: int) -> Self:
+        return self._new(self.bits & ~(1 << (i * self.stride + j)))
+
+    def lowest(self) -> Self:
+        """
+        Returns a bitboard with only the first set cell in row-major order, or an empty one.
+        """
+        return self._new(self.bits & -self.bits)
+
+    # shifts by one cell, moving set cells in the respective direction and dropping those that leave the grid
+
+    def north(self) -> Self:
+        return self._new(self.bits >> self.stride)
+
+    def south(self) -> Self:
+        return self._new(self.bits << self.stride & self.mask)
+
+    def east(self) -> Self:
+        return self._new(self.bits << 1 & self.mask)
+
+    def west(self) -> Self:
+        return self._new(self.bits >> 1 & self.mask)
+
+    def dilate(self) -> Self:
+        """
+        Returns a bitboard with all set cells and their 4-neighbors.
+        """
+        b, s = self.bits, self.stride
+        return self._new((b | b << 1 | b >> 1 | b << s | b >> s) & self.mask)
+
+    def bfs(self, free: Bitboard) -> Iterator[Self]:
+        """
+        Breadth-first search starting at all set cells, only moving through *free* cells, yielding the frontier of
+        cells that are first reached with each number of steps, starting with the set cells themselves. Set cells that
+        are not free are ignored. Iteration ends once no new cells are reachable.
+        """
+        # free cells never contain guard bits, so masking with unseen free cells suffices
+        s = self.stride
+        frontier = self.bits & free.bits
+        unseen = free.bits & ~frontier
+        while frontier:
+            yield self._new(frontier)
+            b = frontier
+            frontier = (b << 1 | b >> 1 | b << s | b >> s) & unseen
+            unseen ^= frontier
+
+    def distance(self, target: Bitboard, free: Bitboard) -> int | None:
+        """
+        Returns the number of steps it takes to reach any cell of *target* from any set cell, only moving through
+        *free* cells, or *None* if not reachable.
+        """
+        for steps, frontier in enumerate(self.bfs(free)):
+            if frontier.bits & target.bits:
+                return steps
+        return None
+
+    def flood(self, free: Bitboard) -> Self:
+        """
+        Returns all cells reachable from the set cells, only moving through *free* cells. Set cells that are not free
+        are ignored.
+        """
+        full = self.mask & free.bits
+        s = self.stride
+        region, prev = self.bits & full, 0
+        while region != prev:
+            prev, b = region, region
+            region = (b | b << 1 | b >> 1 | b << s | b >> s) & full
+        return self._new(region)
@@ -0,0 +1,239 @@
+# coding: utf-8
+
+"""
+Content-hashed on-disk caches with size-bounded eviction.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import pickle
+import hashlib
+import inspect
+import tempfile
+from types import CodeType
+from typing import Any, Iterator
+
+from aoc2024 import this_dir
+
+
+cache_dir = os.path.join(os.path.dirname(this_dir), ".cache")
+
+# marker for missing cache entries, as None is a valid value
+missing = object()
+
+
+def hash_bytes(data: bytes | memoryview | str) -> str:
+    """
+    Returns the sha256 hex digest of *data*, encoding strings as utf-8.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def _code_names(code: CodeType) -> Iterator[str]:
+    # global names referenced by a code object, including nested functions and comprehensions
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _code_names(const)
+
+
+def hash_source(obj: Any) -> str:
+    """
+    Returns a hash of the source code of a function or class *obj*, including the sources of all functions and classes
+    of the same module it refers to by name, recursively. Changes to helpers in other modules are not detected.
+    """
+    module_name = obj.__module__
+    module = sys.modules.get(module_name)
+    sources: list[str] = []
+    seen: set[int] = set()
+
+    def visit(obj: Any) -> None:
+        if id(obj) in seen:
+            return
+        seen.add(id(obj))
+        try:
+            sources.append(inspect.getsource(obj))
+        except (OSError, TypeError):
+            sources.append(f"{module_name}.{obj.__qualname__}")
+            return
+
+        # find referenced names
+        funcs = [obj] if inspect.isfunction(obj) else [f for f in vars(obj).values() if inspect.isfunction(f)]
+        for func in funcs:
+            for name in _code_names(func.__code__):
+                dep = getattr(module, name, None)
+                if (inspect.isfunction(dep) or inspect.isclass(dep)) and dep.__module__ == module_name:
+                    visit(dep)
+
+    visit(obj)
+
+    return hash_bytes("\n".join(sources))
+
+
+def hash_module(name: str) -> str:
+    """
+    Returns a hash of the source file of the imported module *name*.
+    """
+    with open(sys.modules[name].__file__, "rb") as f:  # type: ignore[arg-type]
+        return hash_bytes(f.read())
+
+
+def package_deps(name: str) -> list[str]:
+    """
+    Returns the names of all imported modules of this package that the module *name* refers to through its globals,
+    i.e., modules imported as a whole or whose functions and classes are imported by name, transitively and including
+    *name* itself and the package. Other day modules are skipped, and so are the globals of the package, as they
+    contain all submodules imported so far.
+    """
+    package = __name__.split(".", 1)[0]
+    deps = {name, package}
+    stack = [name]
+    while stack:
+        for obj in vars(sys.modules[stack.pop()]).values():
+            dep = obj.__name__ if inspect.ismodule(obj) else getattr(obj, "__module__", None)
+            if (
+                isinstance(dep, str) and
+                dep not in deps and
+                dep.split(".", 1)[0] == package and
+                not dep.split(".")[-1].startswith("day") and
+                dep in sys.modules
+            ):
+                deps.add(dep)
+                stack.append(dep)
+    return sorted(deps)
+
+
+def hash_modules(names: list[str]) -> str:
+    """
+    Returns a combined hash of the source files of all imported modules *names*.
+    """
+    return hash_bytes(":".join(f"{name}={hash_module(name)}" for name in names))
+
+
+class DiskCache:
+    """
+    Pickle-based key-value cache stored in *directory*, with one file per key. When the total size exceeds
+    *max_size* bytes, least recently used entries are evicted. Entries are written atomically so that multiple
+    processes can share a cache. Values that can no longer be unpickled (e.g. after renaming a class) are treated as
+    missing.
+    """
+
+    def __init__(self, directory: str, max_size: int) -> None:
+        super().__init__()
+
+        # attributes
+        self.directory = directory
+        self.max_size = max_size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.directory!r}, max_size={self.max_size})"
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def get(self, key: str, default: Any = missing) -> Any:
+        """
+        Returns the value stored for *key*, or *default* when missing.
+        """
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return default
+        except Exception:
+            # unreadable entry
+            self.delete(key)
+            return default
+
+        # mark as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores *value* for *key* and evicts old entries if needed. Values that cannot be pickled are not stored.
+        """
+        try:
+            content = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        if len(content) > self.max_size:
+            return
+
+        # write to a temporary file first and move it into place
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, self.path(key))
+        except:
+            os.remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        # (access time, size, path) of all entries
+        entries: list[tuple[float, int, str]] = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pickle"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    @property
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """
+        Removes least recently used entries until the total size is below *max_size*.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+# cache of parsed inputs
+parse_cache = DiskCache(os.path.join(cache_dir, "parse"), max_size=256 * 1024**2)
+
+# cache of solution results
+# version of stored results, to be increased when the meaning of results changes without any source change
+result_cache_version = 2
+
+result_cache = DiskCache(os.path.join(cache_dir, "results"), max_size=16 * 1024**2)
@@ -7,12 +7,14 @@ https://adventofcode.com/2024/day/1
 from __future__ import annotations
 
 import heapq
+import random
 from collections import defaultdict
+from typing import Iterable
 
 from aoc2024 import Solver, Part
 
 
-def solution(data: list[str], part: Part) -> int | None:
+def solution(data: Iterable[str], part: Part) -> int | None:
     heapl: list[int] = []
     heapr: list[int] = []
     counts: dict[int, int] = defaultdict(int)
@@ -40,5 +42,18 @@ def solution(data: list[str], part: Part) -> int | None:
         )
 
 
+def generate(size: int, rng: random.Random) -> list[str]:
+    # size pairs of location ids, with repeated ids on the right
+    right = [rng.randint(10000, 99999) for _ in range(max(size // 4, 1))]
+    return [f"{rng.randint(10000, 99999)}   {rng.choice(right)}" for _ in range(size)]
+
+
+# sizes used for scaling reports
+scale_sizes = (1000, 2000, 4000, 8000, 16000)
+
+
+solver = Solver(year=2024, day=1, truth_a=1319616, truth_b=27267728)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=1, truth_a=1319616, truth_b=27267728).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
@@ -6,14 +6,15 @@ https://adventofcode.com/2024/day/2
 
 from __future__ import annotations
 
+import random
+from typing import Iterable
+
 from aoc2024 import Solver, Part
 
 
-def solution(data: list[str], part: Part) -> int | None:
-    # parse levels
-    levels: list[list[int]] = []
-    for line in data:
-        levels.append(list(map(int, line.split())))
+def solution(data: Iterable[str], part: Part) -> int | None:
+    # parse levels lazily, line by line
+    levels = (list(map(int, line.split())) for line in data)
 
     # helper to check if a sequence is safe
     def is_safe(seq: list[int], *, skip: int = -1) -> bool:
@@ -35,5 +36,24 @@ def solution(data: list[str], part: Part) -> int | None:
     )
 
 
+def generate(size: int, rng: random.Random) -> list[str]:
+    # size reports with 5 to 8 mostly monotonic levels
+    lines = []
+    for _ in range(size):
+        sign = rng.choice((1, -1))
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + sign * rng.choice((1, 2, 3, 3, 0, 4, -1)))
+        lines.append(" ".join(map(str, levels)))
+    return lines
+
+
+# sizes used for scaling reports
+scale_sizes = (1000, 2000, 4000, 8000, 16000)
+
+
+solver = Solver(year=2024, day=2, truth_a=564, truth_b=604)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=2, truth_a=564, truth_b=604).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False, stream=True)
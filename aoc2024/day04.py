@@ -6,55 +6,30 @@ https://adventofcode.com/2024/day/4
 
 from __future__ import annotations
 
-from aoc2024 import Solver, Part
+from aoc2024 import Solver, Part, Grid
 
 
 def solution(data: list[str], part: Part) -> int | None:
-    # dimensions
-    m, n = len(data), len(data[0])
-    assert m == n
+    grid = Grid(data)
 
     if part == "a":
-        # helper
-        n_xmas = [0]
-        def count(s: str) -> None:
-            n_xmas[0] += s.count("XMAS") + s.count("SAMX")
-
-        # horizontal
-        for line in data:
-            count(line)
-
-        # vertical
-        for j in range(n):
-            row = "".join(data[i][j] for i in range(m))
-            count(row)
-
-        # diagonals
-        # (making use of zip's truncation at the shortest iterable)
-        # sweeping left-right and right-left
-        for start in range(n):
-            count("".join(data[i][j] for i, j in zip(range(0, m), range(start, n))))
-            count("".join(data[i][j] for i, j in zip(range(m - 1, -1, -1), range(start, n))))
-        # sweeping top-down and bottom-up, skipping the main diagonal
-        for start in range(1, m):
-            count("".join(data[i][j] for i, j in zip(range(start, m), range(0, n))))
-            count("".join(data[i][j] for i, j in zip(range(m - 1 - start, -1, -1), range(0, n))))
-
-        return n_xmas[0]
-
-    # sliding 3x3 window, "convolve" important characters into string and compare against possible targets
-    targets = {"MSAMS", "SSAMM", "MMASS", "SMASM"}
-    n_x_mas = 0
-    for i in range(m - 2):
-        for j in range(n - 2):
-            line = data[i][j] + data[i][j + 2]
-            line += data[i + 1][j + 1]
-            line += data[i + 2][j] + data[i + 2][j + 2]
-            if line in targets:
-                n_x_mas += 1
-
-    return n_x_mas
+        # count in all lines in all orientations
+        lines = grid.rows() + grid.columns() + grid.diagonals() + grid.antidiagonals()
+        return sum(line.count("XMAS") + line.count("SAMX") for line in lines)
+
+    # check the diagonal corners of all "A" cells (the border keeps corners of edge cells from matching) and compare
+    # them against possible targets, given as bytes in clockwise order starting north-west
+    cells = grid.cells
+    nw, ne, se, sw = grid.offsets8[7], grid.offsets8[1], grid.offsets8[3], grid.offsets8[5]
+    targets = {tuple(b"MSSM"), tuple(b"SSMM"), tuple(b"MMSS"), tuple(b"SMMS")}
+    return sum(
+        1 for cell in grid.find_all("A")
+        if (cells[cell + nw], cells[cell + ne], cells[cell + se], cells[cell + sw]) in targets
+    )
+
+
+solver = Solver(year=2024, day=4, truth_a=2483, truth_b=1925)
 
 
 if __name__ == "__main__":
-    Solver(year=2024, day=4, truth_a=2483, truth_b=1925).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
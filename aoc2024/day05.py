@@ -61,5 +61,8 @@ def solution(data: list[str], part: Part) -> int | None:
     return sum_b
 
 
+solver = Solver(year=2024, day=5, truth_a=6267, truth_b=5184)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=5, truth_a=6267, truth_b=5184).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
@@ -6,57 +6,46 @@ https://adventofcode.com/2024/day/6
 
 from __future__ import annotations
 
-from aoc2024 import Solver, Part
+import random
 
+from aoc2024 import Solver, Part, Grid, count
+from aoc2024.generators import to_lines
 
-Point = tuple[int, int]
-Points = set[Point]
-Direction = tuple[int, int]
-PointsWithDirection = set[tuple[Point, Direction]]
+
+# byte values of relevant cells, with the border marking the outside of the map
+obstacle, outside = ord("#"), ord(" ")
 
 
 def solution(data: list[str], part: Part) -> int | None:
-    # find the starting point
-    imax, jmax = len(data), len(data[0])
-    start: Point
-    for i in range(imax):
-        if "^" in data[i]:
-            start = i, data[i].index("^")
-            break
+    # find the starting point, cells are integer ids and directions are indices into the clockwise neighbor offsets
+    grid = Grid(data, border=" ")
+    cells, offsets = grid.cells, grid.offsets4
+    start = grid.find("^")
+    assert start is not None
 
-    # walking rules
-    up, down, left, right = (-1, 0), (1, 0), (0, -1), (0, 1)
-    next_dir = {
-        up: right,
-        right: down,
-        down: left,
-        left: up,
-    }
-
-    # helper to walk over the map, returns visited points or an empty set in case a loop is found
-    def walk(*, insert_obstacle: Point | None = None) -> Points:
-        seen: Points = set()
-        seen_dir: PointsWithDirection = set()
-        point, direction = start, up
+    # helper to walk over the map, returns the visited directions per cell as bit masks, or None if a loop is found
+    def walk() -> bytearray | None:
+        count("walks")
+        seen_dir = bytearray(len(cells))
+        cell, direction = start, 0
         while True:
-            # loop detected if the point was already visited with the same direction
-            if (pwd := (point, direction)) in seen_dir:
-                return set()
-            seen_dir.add(pwd)
-            # store the current point
-            seen.add(point)
+            # loop detected if the cell was already visited with the same direction
+            if seen_dir[cell] & (bit := 1 << direction):
+                return None
+            seen_dir[cell] |= bit
             # if the next move brings us out of bounds, the walking is done
-            inext, jnext = point[0] + direction[0], point[1] + direction[1]
-            if not (0 <= inext < imax) or not (0 <= jnext < jmax):
-                return seen
-            # switch directions if the next move is an obstacle, otherwise advance
-            if data[inext][jnext] == "#" or (inext, jnext) == insert_obstacle:
-                direction = next_dir[direction]
+            if (c := cells[next_cell := cell + offsets[direction]]) == outside:
+                return seen_dir
+            # switch directions if the next move is an obstacle (turning right), otherwise advance
+            if c == obstacle:
+                direction = (direction + 1) & 3
             else:
-                point = inext, jnext
+                cell = next_cell
 
-    # get points visited by the guard, don't assume a loop in part a
-    points = walk()
+    # get cells visited by the guard, don't assume a loop in part a
+    seen_dir = walk()
+    assert seen_dir is not None
+    points = [cell for cell, bits in enumerate(seen_dir) if bits]
     if part == "a":
         return len(points)
 
@@ -67,12 +56,102 @@ def solution(data: list[str], part: Part) -> int | None:
     #   - if an obstacle is found or the end of the map is reached, stop this branch and make a step on the main branch
     #   - if a points is found that was already seen while walking in the same direction, an obstacle could have been
     #     placed in front of the point the temporary branch started from
-    # ... but brute force is also rather quick, so check potential obstacles at all positions we visited in part a
-    return sum(
-        1 for point in points - {start}
-        if not walk(insert_obstacle=point)
-    )
+    # ... but brute force is also rather quick, so check potential obstacles at all positions we visited in part a,
+    # temporarily placing them on the map
+    n_loops = 0
+    for cell in points:
+        if cell == start:
+            continue
+        cells[cell] = obstacle
+        n_loops += walk() is None
+        cells[cell] = ord(".")
+    return n_loops
+
+
+def solution_resume(data: list[str], part: Part) -> int | None:
+    # same as above, but in part b, walks with an inserted obstacle resume from the state right before the guard first
+    # reaches it, since the walk up to that point is not affected
+    if part == "a":
+        return solution(data, part)
+
+    grid = Grid(data, border=" ")
+    cells, offsets = grid.cells, grid.offsets4
+    start = grid.find("^")
+    assert start is not None
+
+    # walk once, remembering the state before each cell is visited for the first time
+    first_states: dict[int, tuple[int, int]] = {}
+    cell, direction = start, 0
+    while (c := cells[next_cell := cell + offsets[direction]]) != outside:
+        if c == obstacle:
+            direction = (direction + 1) & 3
+            continue
+        if next_cell != start and next_cell not in first_states:
+            first_states[next_cell] = cell, direction
+        cell = next_cell
+
+    # helper to check if the walk starting at a state loops
+    def loops(cell: int, direction: int) -> bool:
+        count("walks")
+        seen_dir = bytearray(len(cells))
+        while not seen_dir[cell] & (bit := 1 << direction):
+            seen_dir[cell] |= bit
+            if (c := cells[next_cell := cell + offsets[direction]]) == outside:
+                return False
+            if c == obstacle:
+                direction = (direction + 1) & 3
+            else:
+                cell = next_cell
+        return True
+
+    # check all obstacles, temporarily placing them on the map
+    n_loops = 0
+    for obstacle_cell, (cell, direction) in first_states.items():
+        cells[obstacle_cell] = obstacle
+        n_loops += loops(cell, direction)
+        cells[obstacle_cell] = ord(".")
+    return n_loops
+
+
+# alternative implementations, checked against solution
+variants = {"resume": solution_resume}
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    # size x size map where obstacles guide the guard along an outward spiral with rings two cells apart, so that the
+    # walk covers a large part of the map as in real inputs, plus random obstacles next to the walk
+    grid = [["."] * size for _ in range(size)]
+    start = i, j = size // 2, size // 2
+    path = {start}
+    (di, dj), arm = (-1, 0), 0
+    while True:
+        # walk along the arm
+        inside = True
+        for _ in range(2 * (arm // 2 + 1)):
+            i, j = i + di, j + dj
+            if not (inside := 0 <= i < size and 0 <= j < size):
+                break
+            path.add((i, j))
+        # place an obstacle behind its end and turn right, unless the guard leaves the map
+        ni, nj = i + di, j + dj
+        if not inside or not (0 <= ni < size and 0 <= nj < size):
+            break
+        grid[ni][nj] = "#"
+        (di, dj), arm = (dj, -di), arm + 1
+    for i in range(size):
+        for j in range(size):
+            if grid[i][j] == "." and (i, j) not in path and rng.random() < 0.03:
+                grid[i][j] = "#"
+    grid[start[0]][start[1]] = "^"
+    return to_lines(grid)
+
+
+# sizes used for scaling reports
+scale_sizes = (16, 24, 32, 48, 64)
+
+
+solver = Solver(year=2024, day=6, truth_a=4696, truth_b=1443)
 
 
 if __name__ == "__main__":
-    Solver(year=2024, day=6, truth_a=4696, truth_b=1443).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
@@ -7,11 +7,14 @@ https://adventofcode.com/2024/day/7
 from __future__ import annotations
 
 import math
+import random
+from typing import Iterable
 
 from aoc2024 import Solver, Part
+from aoc2024.parallel import map_reduce
 
 
-def solution(data: list[str], part: Part) -> int | None:
+def solution(data: Iterable[str], part: Part) -> int | None:
     # helper that checks if a target value can be reached by combining a current value
     # and a list of remaining numbers (dp style)
     def check(target: int, cur: int, nums: tuple[int, ...]) -> bool:
@@ -32,17 +35,39 @@ def solution(data: list[str], part: Part) -> int | None:
     def num_digits(n: int) -> int:
         return int(math.floor(math.log10(n))) + 1
 
-    # parse and check all
-    res = 0
-    for line in data:
+    # helper to parse and check a single equation, returning its target if it can be reached and 0 otherwise
+    def calibrate(line: str) -> int:
         parts = line.split(":", 1)
         target = int(parts[0])
         nums = tuple(map(int, parts[1].strip().split()))
-        if check(target, nums[0], nums[1:]):
-            res += target
+        return target if check(target, nums[0], nums[1:]) else 0
 
-    return res
+    # check all, equations are independent and can be distributed over processes when given as a list of lines (as
+    # by the runner and benchmarks), while streamed lines are checked lazily one by one in constant memory
+    return map_reduce(calibrate, data)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    # size equations with 3 to 12 numbers, whose targets are reachable for about half of them
+    lines = []
+    for _ in range(size):
+        nums = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        target = nums[0]
+        for num in nums[1:]:
+            target = rng.choice([target + num, target * num, int(f"{target}{num}")])
+        if rng.random() < 0.5:
+            target += 1
+        lines.append(f"{target}: {' '.join(map(str, nums))}")
+    return lines
+
+
+# sizes used for scaling reports
+scale_sizes = (50, 100, 200, 400)
+
+
+solver = Solver(year=2024, day=7, truth_a=7710205485870, truth_b=20928985450275)
 
 
 if __name__ == "__main__":
-    Solver(year=2024, day=7, truth_a=7710205485870, truth_b=20928985450275).solve(solution, part="x", submit=False)
+    # streamed input keeps memory constant, so equations are checked serially, see map_reduce
+    solver.solve(solution, part="x", submit=False, stream=True)
@@ -6,52 +6,41 @@ https://adventofcode.com/2024/day/8
 
 from __future__ import annotations
 
-import itertools
-from collections import defaultdict
+import numpy as np
 
-from aoc2024 import Solver, Part
+from aoc2024 import Solver, Part, PointArray
 
 
 def solution(data: list[str], part: Part) -> int | None:
-    # parse into per-type antenna locations, stored as complex numbers (real -> i, imag -> j)
-    imax, jmax = len(data), len(data[0])
-    antennas: defaultdict[str, set[complex]] = defaultdict(set)
-    for i in range(imax):
-        for j in range(jmax):
-            if data[i][j] != ".":
-                antennas[data[i][j]].add(complex(i, j))
-
-    # helper to check if a point is within the map bounds
-    def within_bounds(p: complex, imax: int, jmax: int) -> bool:
-        return 0 <= p.real < imax and 0 <= p.imag < jmax
-
-    # find unique antinode locations evaluating all pairs of same antennas
-    antinodes: set[complex] = set()
-    for points in antennas.values():
-        for p1, p2 in itertools.combinations(points, 2):
-            # difference vector
-            diff = p2 - p1
-
-            if part == "a":
-                # check single locations on either side
-                if within_bounds((p := p2 + diff), imax, jmax):
-                    antinodes.add(p)
-                if within_bounds((p := p1 - diff), imax, jmax):
-                    antinodes.add(p)
-
-            else:  # "b"
-                # check all locations on either side
-                p = p2
-                while within_bounds(p, imax, jmax):
-                    antinodes.add(p)
-                    p += diff
-                p = p1
-                while within_bounds(p, imax, jmax):
-                    antinodes.add(p)
-                    p -= diff
-
-    return len(antinodes)
+    # parse antenna locations and types
+    grid = np.frombuffer("".join(data).encode(), dtype=np.uint8).reshape(len(data), -1)
+    shape = grid.shape
+    antennas = PointArray.where(grid != ord("."))
+    types = grid[grid != ord(".")]
+
+    # build all pairs of antennas and keep those of the same type
+    idx1, idx2 = np.triu_indices(len(antennas), k=1)
+    same = types[idx1] == types[idx2]
+    p1, p2 = antennas[idx1[same]], antennas[idx2[same]]
+    # difference vectors
+    diff = p2 - p1
+
+    # find unique antinode locations evaluating all pairs at once
+    if part == "a":
+        # mark single locations on either side
+        return int(((p2 + diff).to_grid(shape) | (p1 - diff).to_grid(shape)).sum())
+
+    # part b: mark all locations on either side up to the maximum possible distance at once, with steps k being the
+    # leading dimension
+    k = np.arange(max(shape))[:, None, None]
+    antinodes = PointArray((p2.data + k * diff.data).reshape(-1, 2)).to_grid(shape)
+    antinodes |= PointArray((p1.data - k * diff.data).reshape(-1, 2)).to_grid(shape)
+
+    return int(antinodes.sum())
+
+
+solver = Solver(year=2024, day=8, truth_a=280, truth_b=958)
 
 
 if __name__ == "__main__":
-    Solver(year=2024, day=8, truth_a=280, truth_b=958).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
@@ -6,6 +6,7 @@ https://adventofcode.com/2024/day/9
 
 from __future__ import annotations
 
+import random
 from collections import deque
 
 from aoc2024 import Solver, Part
@@ -83,5 +84,17 @@ def solution(data: list[str], part: Part) -> int | None:
     return index_checksum[1]
 
 
+def generate(size: int, rng: random.Random) -> list[str]:
+    # disk map with size digits (made odd), alternating files of length 1 to 9 and free space of length 0 to 9
+    return ["".join(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)) for i in range(size | 1))]
+
+
+# sizes used for scaling reports
+scale_sizes = (2000, 4000, 8000, 16000)
+
+
+solver = Solver(year=2024, day=9, truth_a=6432869891895, truth_b=6467290479134)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=9, truth_a=6432869891895, truth_b=6467290479134).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
@@ -6,37 +6,36 @@ https://adventofcode.com/2024/day/10
 
 from __future__ import annotations
 
+import random
 from collections import deque
 
-from aoc2024 import Solver, Part
+from aoc2024 import Solver, Part, Grid
 
 
-def solution(data: list[str], part: Part) -> int | None:
-    # convert to complex mapping
-    heights: dict[complex, int] = {
-        complex(i, j): int(c)
-        for i, line in enumerate(data)
-        for j, c in enumerate(line)
-    }
+def parse(data: list[str]) -> Grid:
+    # grid of heights with a border that is never part of a trail
+    return Grid(data, border=" ")
 
+
+def solution(heights: Grid, part: Part) -> int | None:
     # find heads
-    heads = [p for p, h in heights.items() if h == 0]
+    cells, offsets = heights.cells, heights.offsets4
+    heads = heights.find_all("0")
 
-    # walking helper returning the number of reachable tops given a starting point
+    # walking helper returning the number of reachable tops given a starting cell
     # note: part A could be solved faster by using a decicated function that drops duplicates right away
     #       instead of at the end, but the penalty is not too high and the code is more readable
-    def num_reachable_tops(head: complex, unique: bool) -> int:
-        directions = (1, -1, 1j, -1j)
-        # check each height
+    def num_reachable_tops(head: int, unique: bool) -> int:
+        # check each height, compared as byte values
         q = deque([head])
-        height = 0
-        while height < 9:
+        height = ord("0")
+        while height < ord("9"):
             height += 1
             for _ in range(len(q)):
                 h = q.popleft()
                 # check each direction
-                for d in directions:
-                    if heights.get(p := h + d) == height:
+                for d in offsets:
+                    if cells[p := h + d] == height:
                         q.append(p)
         return len(set(q) if unique else q)
 
@@ -44,5 +43,20 @@ def solution(data: list[str], part: Part) -> int | None:
     return sum(num_reachable_tops(h, unique=(part == "a")) for h in heads)
 
 
+def generate(size: int, rng: random.Random) -> list[str]:
+    # size x size map of diagonal slopes with some noise
+    return [
+        "".join(str((i + j + (rng.random() < 0.2)) % 10) for j in range(size))
+        for i in range(size)
+    ]
+
+
+# sizes used for scaling reports
+scale_sizes = (32, 64, 128, 256)
+
+
+solver = Solver(year=2024, day=10, truth_a=737, truth_b=1619)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=10, truth_a=737, truth_b=1619).solve(solution, part="x", submit=False)
+    solver.solve(solution, parse=parse, part="x", submit=False)
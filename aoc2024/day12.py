@@ -6,18 +6,23 @@ https://adventofcode.com/2024/day/12
 
 from __future__ import annotations
 
+import random
 from collections import defaultdict, deque
 
 from aoc2024 import Solver, Part
+from aoc2024.generators import to_lines
 
 
-def solution(data: list[str], part: Part) -> int | None:
+def parse(data: list[str]) -> dict[str, set[complex]]:
     # parse into complex groups
     groups: dict[str, set[complex]] = defaultdict(set)
     for i, line in enumerate(data):
         for j, c in enumerate(line):
             groups[c].add(complex(i, j))
+    return groups
 
+
+def solution(groups: dict[str, set[complex]], part: Part) -> int | None:
     # walking directions
     directions = [1, 1j, -1, -1j]
 
@@ -65,5 +70,26 @@ def solution(data: list[str], part: Part) -> int | None:
     return price
 
 
+def generate(size: int, rng: random.Random) -> list[str]:
+    # size x size map of rectangular regions of random sizes, with some single cells flipped
+    rows: list[int] = []
+    cols: list[int] = []
+    for bounds in (rows, cols):
+        while len(bounds) < size:
+            bounds.extend([len(bounds)] * rng.randint(1, 20))
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    grid = [[letters[(rows[i] * 7 + cols[j] * 3) % 26] for j in range(size)] for i in range(size)]
+    for _ in range(size * size // 20):
+        grid[rng.randrange(size)][rng.randrange(size)] = rng.choice(letters)
+    return to_lines(grid)
+
+
+# sizes used for scaling reports
+scale_sizes = (35, 70, 140, 280)
+
+
+solver = Solver(year=2024, day=12, truth_a=1370100, truth_b=818286)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=12, truth_a=1370100, truth_b=818286).solve(solution, part="x", submit=False)
+    solver.solve(solution, parse=parse, part="x", submit=False)
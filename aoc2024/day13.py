@@ -7,7 +7,9 @@ https://adventofcode.com/2024/day/13
 from __future__ import annotations
 
 import re
+import random
 from dataclasses import dataclass
+from typing import Iterable, Iterator
 
 from aoc2024 import Solver, Part
 
@@ -26,34 +28,35 @@ class Game:
         return self.ax * self.by == self.ay * self.bx
 
 
-def solution(data: list[str], part: Part) -> int | None:
-    # parse games
-    games: list[Game] = []
+def iter_games(data: Iterable[str], offset: int = 0) -> Iterator[Game]:
+    # parse games lazily, three lines each
     cre = re.compile(r".+\: X(\+|=)(?P<x>\d+), Y(\+|=)(?P<y>\d+)$")
-    offset = 0 if part == "a" else 10000000000000
-    while data:
-        ma = cre.match(data.pop(0))
-        mb = cre.match(data.pop(0))
-        mp = cre.match(data.pop(0))
+    lines = iter(data)
+    for line in lines:
+        ma = cre.match(line)
+        mb = cre.match(next(lines))
+        mp = cre.match(next(lines))
         assert ma and mb and mp
-        games.append(Game(
+        yield Game(
             ax=int(ma.group("x")), ay=int(ma.group("y")),
             bx=int(mb.group("x")), by=int(mb.group("y")),
             px=int(mp.group("x")) + offset, py=int(mp.group("y")) + offset,
-        ))
+        )
 
+
+def solution(data: Iterable[str], part: Part) -> int | None:
     # strategy: two unknowns and two equations, so we can just solve analytically (by hand or via matrix inversion);
     #           however, there is an edge case if the buttons result in linear independent moves (i.e., they construct a
     #           non-invertible matrix), in which case a more iterative approach is needed; knowing aoc, this is likely
     #           not realized in the puzzle input, but still check
 
     tokens = 0
-    for g in games:
+    for g in iter_games(data, offset=0 if part == "a" else 10000000000000):
         assert not g.linear_dependent_buttons
         nb = (g.ax * g.py - g.px * g.ay) / (g.ax * g.by - g.ay * g.bx) * 1.0  # enforce float
         na = (g.px - nb * g.bx) / g.ax
-        # require integer solutions
-        if not na.is_integer() or not nb.is_integer():
+        # require non-negative integer solutions
+        if not na.is_integer() or not nb.is_integer() or na < 0 or nb < 0:
             continue
         # cap for part a
         if part == "a" and (na > 100 or nb > 100):
@@ -63,5 +66,52 @@ def solution(data: list[str], part: Part) -> int | None:
     return tokens
 
 
+def solution_integer(data: Iterable[str], part: Part) -> int | None:
+    # same as above, but solving with integer arithmetic only (cramer's rule), avoiding float rounding for large prizes
+    tokens = 0
+    for g in iter_games(data, offset=0 if part == "a" else 10000000000000):
+        det = g.ax * g.by - g.ay * g.bx
+        assert det != 0
+        na, ra = divmod(g.px * g.by - g.py * g.bx, det)
+        nb, rb = divmod(g.ax * g.py - g.ay * g.px, det)
+        # require non-negative integer solutions
+        if ra or rb or na < 0 or nb < 0:
+            continue
+        # cap for part a
+        if part == "a" and (na > 100 or nb > 100):
+            continue
+        tokens += 3 * na + nb
+
+    return tokens
+
+
+# alternative implementations, checked against solution
+variants = {"integer": solution_integer}
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    # size games with linear independent buttons, about half of them being winnable within 100 presses per button
+    lines = []
+    for _ in range(size):
+        while True:
+            ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+            if ax * by != ay * bx:
+                break
+        # winnable games use the same press counts for both axes
+        na, nb = rng.randint(1, 100), rng.randint(1, 100)
+        px, py = ax * na + bx * nb, ay * na + by * nb
+        if rng.random() < 0.5:
+            py = ay * rng.randint(1, 100) + by * rng.randint(1, 100)
+        lines += [f"Button A: X+{ax}, Y+{ay}", f"Button B: X+{bx}, Y+{by}", f"Prize: X={px}, Y={py}"]
+    return lines
+
+
+# sizes used for scaling reports
+scale_sizes = (320, 640, 1280, 2560)
+
+
+solver = Solver(year=2024, day=13, truth_a=30413, truth_b=92827349540204)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=13, truth_a=30413, truth_b=92827349540204).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False, stream=True)
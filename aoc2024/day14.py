@@ -7,55 +7,29 @@ https://adventofcode.com/2024/day/14
 from __future__ import annotations
 
 import re
-import heapq
-import operator
-import functools
-from collections import defaultdict
-from dataclasses import dataclass
 
-from aoc2024 import Solver, Part
+import numpy as np
 
-
-@dataclass
-class Robot:
-    p: complex
-    v: complex
-
-    @property
-    def x(self) -> int:
-        return int(self.p.real)
-
-    @property
-    def y(self) -> int:
-        return int(self.p.imag)
+from aoc2024 import Solver, Part, PointArray
 
 
 def solution(data: list[str], part: Part) -> int | None:
     w, h = 101, 103
 
-    # parse input
-    robots: list[Robot] = []
+    # parse input into robot positions and velocities, using (x, y) coordinates as (i, j)
     cre = re.compile(r"p=(\d+),(\d+) v=(-?\d+),(-?\d+)$")
-    for line in data:
-        m = cre.match(line)
-        assert m
-        robots.append(Robot(
-            p=complex(int(m.group(1)), int(m.group(2))),
-            v=complex(int(m.group(3)), int(m.group(4))),
-        ))
+    values = np.array([cre.match(line).groups() for line in data], dtype=np.int64)  # type: ignore[union-attr]
+    p = PointArray(values[:, :2])
+    v = PointArray(values[:, 2:])
 
     if part == "a":
-        # advance each robot, then increment qudrant counts
-        counts = [[0, 0], [0, 0]]
-        for robot in robots:
-            # advance
-            robot.p += 100 * robot.v
-            robot.p = complex(robot.x % w, robot.y % h)
-            # divide
-            if robot.x != w // 2 and robot.y != h // 2:
-                counts[int(robot.x < w // 2)][int(robot.y < h // 2)] += 1
+        # advance all robots at once, then count robots per quadrant, skipping those on the center lines
+        p = (p + v * 100).wrap((w, h))
+        x, y = p.i, p.j
+        mask = (x != w // 2) & (y != h // 2)
+        counts = np.bincount(2 * (x[mask] < w // 2) + (y[mask] < h // 2), minlength=4)
         # build product
-        return functools.reduce(operator.mul, sum(counts, []))
+        return int(np.prod(counts))
 
     # part b
     # it is unclear what the tree looks like, but a *guess* is that there should be at least one
@@ -63,48 +37,35 @@ def solution(data: list[str], part: Part) -> int | None:
 
     interactive = False  # disable for submission
 
-    # helper function to check if there is a straight line
-    # (xs must be a heap and is modified in place)
-    def has_line(xs: list[int], min_len: int = 10) -> bool:
-        last_x, n = -1, 0
-        while xs:
-            # stop early
-            if len(xs) < min_len - n:
-                return False
-            # check if next value connects to last one
-            if (x := heapq.heappop(xs)) == last_x + 1:
-                n += 1
-                if n == min_len:
-                    return True
-            else:
-                n = 0
-            last_x = x
-        return False
+    # helper function to check if there is a straight line of at least min_len + 1 consecutive x values for any y
+    def has_line(grid: np.ndarray, min_len: int = 10) -> bool:
+        # grid has shape (w, h), so shifting along the first axis and combining finds consecutive x values
+        line = grid[min_len:]
+        for n in range(min_len):
+            line = line & grid[n:n - min_len]
+        return bool(line.any())
 
     for t in range(1, 100_001):
-        # advance each robot, remember the x coordinates of robots per y coordinate for the line check
-        xs_per_y: dict[int, list[int]] = defaultdict(list)
-        for robot in robots:
-            robot.p += robot.v
-            robot.p = complex(robot.x % w, robot.y % h)
-            heapq.heappush(xs_per_y[robot.y], robot.x)
-        # check if there is a straight line
-        for xs in xs_per_y.values():
-            if has_line(xs):
-                if interactive:
-                    # print robots
-                    positions = set([robot.p for robot in robots])
-                    for y in range(h):
-                        print("".join(("*" if complex(x, y) in positions else " ") for x in range(w)))
-                    print(f"{t=}")
-                    while (inp := input("accept? y/n: ").strip()) not in {"y", "n"}:
-                        continue
-                    if inp == "n":
-                        break
-                return t
+        # advance all robots at once and check if there is a straight line
+        p = (p + v).wrap((w, h))
+        grid = p.to_grid((w, h))
+        if has_line(grid):
+            if interactive:
+                # print robots
+                for y in range(h):
+                    print("".join(("*" if grid[x, y] else " ") for x in range(w)))
+                print(f"{t=}")
+                while (inp := input("accept? y/n: ").strip()) not in {"y", "n"}:
+                    continue
+                if inp == "n":
+                    continue
+            return t
 
     raise ValueError("no solution found after 100k iterations :(")
 
 
+solver = Solver(year=2024, day=14, truth_a=230172768, truth_b=8087)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=14, truth_a=230172768, truth_b=8087).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
@@ -80,5 +80,8 @@ def solution(data: list[str], part: Part) -> int | None:
     return sum(b.i * 100 + b.j for b in boxes)
 
 
+solver = Solver(year=2024, day=15, truth_a=1438161, truth_b=1437981)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=15, truth_a=1438161, truth_b=1437981).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
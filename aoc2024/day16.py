@@ -6,87 +6,66 @@ https://adventofcode.com/2024/day/16
 
 from __future__ import annotations
 
-import heapq
-import operator
-import functools
-from dataclasses import dataclass
+import random
 
-from aoc2024 import Solver, Part, Point
+from aoc2024 import Solver, Part, Grid, count
+from aoc2024.search import dial
+from aoc2024.generators import random_maze, to_lines
 
 
-# derived types
-class Direction(Point): pass  # noqa: E701
+def solution(data: list[str], part: Part) -> int | None:
+    # find start and end cells, walls are just cells of the grid
+    grid = Grid(data, border="#")
+    cells, offsets = grid.cells, grid.offsets4
+    start, end = grid.find("S"), grid.find("E")
+    assert start is not None and end is not None
+    wall = ord("#")
+
+    # search states are cell ids combined with direction indices into the clockwise offsets
+    def neighbors(state: int) -> list[tuple[int, int]]:
+        count("expansions")
+        cell, d = divmod(state, 4)
+        # turn left or right
+        moves = [(cell * 4 + (d + 1) % 4, 1000), (cell * 4 + (d + 3) % 4, 1000)]
+        # walk straight unless there is a wall
+        if cells[new_cell := cell + offsets[d]] != wall:
+            moves.append((new_cell * 4 + d, 1))
+        return moves
+
+    # find the best paths from the start facing east to the end in any direction, recording all of them for part b,
+    # using a bucket queue as there are only two different scores per move
+    end_states = [end * 4 + d for d in range(4)]
+    result = dial(
+        len(cells) * 4,
+        start * 4 + 1,
+        neighbors,
+        max_weight=1000,
+        targets=end_states,
+        all_preds=(part == "b"),
+    )
+    assert result.target is not None
+    score = result.dist[result.target]
 
+    if part == "a":
+        # just return score
+        return score
 
-@dataclass
-class Path:
-    pos: Point
-    dir: Direction
-    score: int
-    visited: set[Point]
+    # part b: count cells on all best paths, possibly ending in different directions
+    best_end_states = [state for state in end_states if result.dist[state] == score]
+    return len({state // 4 for state in result.path_nodes(best_end_states)})
 
-    def __lt__(self, other: Path) -> bool:  # for heapq ordering
-        return self.score < other.score
 
+def generate(size: int, rng: random.Random) -> list[str]:
+    # maze with loops
+    return to_lines(random_maze(size, rng, loops=0.1))
 
-def solution(data: list[str], part: Part) -> int | None:
-    # find start and end points, remember walls
-    start: Point = Point()
-    end: Point = Point()
-    walls: set[Point] = set()
-    for i, line in enumerate(data):
-        for j, c in enumerate(line):
-            if not start and c == "S":
-                start = Point(i, j)
-            elif not end and c == "E":
-                end = Point(i, j)
-            elif c == "#":
-                walls.add(Point(i, j))
-
-    # walk one step at a time, always choosing the most promising path
-    directions = [Direction(1j), Direction(-1j), Direction(1), Direction(-1)]  # EWSN
-    paths: list[Path] = [Path(start, directions[0], 0, {start})]
-    visited: dict[tuple[Point, Direction], int] = {}
-    best_paths: list[Path] = []
-    while paths:
-        path = heapq.heappop(paths)
-        # additional stopping criterion for part b (no effect for part a):
-        # no need to continue if there were better paths
-        if best_paths and path.score > best_paths[0].score:
-            break
-        # check if end is reached
-        if path.pos == end:
-            best_paths.append(path)
-            # we can stop here for part a, but need to keep looking for part b
-            if part == "a":
-                break
-            continue
-        # check if visited already with a better score
-        if visited.get((path.pos, path.dir), float("inf")) < path.score:
-            continue
-        visited[(path.pos, path.dir)] = path.score
-        # check possible next moves
-        for d in directions:
-            # skip going backwards
-            if d == -path.dir:
-                continue
-            # skip walls
-            if (new_pos := path.pos + d) in walls:
-                continue
-            # add to paths, either walk straight or turn
-            if d is path.dir:
-                new_path = Path(new_pos, d, path.score + 1, path.visited | {new_pos})
-            else:
-                new_path = Path(path.pos, d, path.score + 1000, path.visited)
-            heapq.heappush(paths, new_path)
 
-    if part == "a":
-        # just return score
-        return best_paths[0].score
+# sizes used for scaling reports
+scale_sizes = (21, 41, 81, 161)
+
 
-    # part b: intersect visited fields
-    return len(functools.reduce(operator.or_, (p.visited for p in best_paths)))
+solver = Solver(year=2024, day=16, truth_a=83432, truth_b=467)
 
 
 if __name__ == "__main__":
-    Solver(year=2024, day=16, truth_a=83432, truth_b=467).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
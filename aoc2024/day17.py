@@ -96,5 +96,8 @@ def solution(data: list[str], part: Part) -> int | str | None:
     raise ValueError("no solution found :(")
 
 
+solver = Solver(year=2024, day=17, truth_a="4,0,4,7,1,2,7,1,6", truth_b=202322348616234)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=17, truth_a="4,0,4,7,1,2,7,1,6", truth_b=202322348616234).solve(solution, part="x", submit=False)  # noqa
+    solver.solve(solution, part="x", submit=False)
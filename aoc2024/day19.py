@@ -6,9 +6,8 @@ https://adventofcode.com/2024/day/19
 
 from __future__ import annotations
 
-import functools
-
 from aoc2024 import Solver, Part
+from aoc2024.memo import memo
 
 
 def solution(data: list[str], part: Part) -> int | str | None:
@@ -18,7 +17,8 @@ def solution(data: list[str], part: Part) -> int | str | None:
     designs = data[1:]
 
     # helper to count the number of possible towel designs
-    @functools.cache
+    # suffixes depend on the towels, so the cache is per call
+    @memo
     def count_combinations(design: str) -> int:
         # check if the full design is already possible, plus all possible splits
         # up to the maximum towel length
@@ -36,5 +36,8 @@ def solution(data: list[str], part: Part) -> int | str | None:
     return sum(map(count_combinations, designs))
 
 
+solver = Solver(year=2024, day=19, truth_a=272, truth_b=1041529704688380)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=19, truth_a=272, truth_b=1041529704688380).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
@@ -6,69 +6,65 @@ https://adventofcode.com/2024/day/20
 
 from __future__ import annotations
 
-from aoc2024 import Solver, Part
+import random
+
+from aoc2024 import Solver, Part, Grid
+from aoc2024.search import bfs
+from aoc2024.generators import random_maze, to_lines
 
 
 def solution(data: list[str], part: Part) -> int | str | None:
-    # parse positions
-    h, w = len(data), len(data[0])
-    start: complex = complex(0, 0)
-    end: complex = complex(0, 0)
-    walls: set[complex] = set()
-    directions = [1, -1, 1j, -1j]
-    for i, line in enumerate(data):
-        for j, c in enumerate(line):
-            if c == "#":
-                walls.add(complex(i, j))
-            elif c == "S":
-                start = complex(i, j)
-            elif c == "E":
-                end = complex(i, j)
-
-    # initial walk starting from the end, storing the distance to the end
-    # (assuming the path through the maze is unique, i.e., no loops possible, no dead ends)
-    distances: dict[complex, int] = {}
-    pos, steps = end, 0
-    while True:
-        distances[pos] = steps
-        if pos == start:
-            break
-        # just one step possible
-        for d in directions:
-            new_pos = pos + d
-            if (0 <= pos.real < h) and (0 <= pos.imag < w) and new_pos not in walls and new_pos not in distances:
-                pos = new_pos
-                steps += 1
-                break
-        else:
-            raise ValueError("wrong assumption about maze")
-
-    # go along the path again, at each position scanning for cheats within a search window
-    # each cheat is identified by its start and end points only!
+    # parse positions into a grid whose wall border is wide enough for the search window below, so that offsets
+    # between cell ids never wrap around rows
     search_window = 2 if part == "a" else 20
+    grid = Grid(data, border="#", pad=search_window)
+    cells, offsets = grid.cells, grid.offsets4
+    start, end = grid.find("S"), grid.find("E")
+    assert start is not None and end is not None
+
+    # initial walk starting from the end, storing the distance to the end per cell id (-1 for cells not on the path)
+    wall = ord("#")
+    result = bfs(len(cells), end, lambda cell: [cell + d for d in offsets if cells[cell + d] != wall])
+    if not result.reached(start):
+        raise ValueError("no path through the maze")
+    distances, path = result.dist, result.order
+
+    # offsets of all cheats within the search window along with their lengths, avoiding trivial cheats
+    cheat_offsets = [
+        (i * grid.stride + j, abs(i) + abs(j))
+        for i in range(-search_window, search_window + 1)
+        for j in range(abs(i) - search_window, search_window - abs(i) + 1)
+        if abs(i) + abs(j) > 1
+    ]
+
+    # go along the path again, at each position scanning for cheats within the search window
+    # each cheat is identified by its start and end points only, which are unique per position and offset
     min_improvement = 100
-    cheats: set[tuple[complex, complex]] = set()
-    for pos, steps_left in distances.items():
+    n_cheats = 0
+    for pos in path:
         # skip cases where no improvement is possible
-        if steps_left < min_improvement:
+        if (steps_left := distances[pos]) < min_improvement:
             continue
-        # within a search window, check if a shortcut is possible
-        for i in range(-search_window, search_window + 1):
-            for j in range(-(offset := search_window - abs(i)), offset + 1):
-                # avoid trivial cheats
-                if abs(diff := complex(i, j)) <= 1:
-                    continue
-                # must be on path
-                if (new_pos := pos + diff) not in distances:
-                    continue
-                # must be an improvement
-                if steps_left - (distances[new_pos] + abs(i) + abs(j)) < min_improvement:
-                    continue
-                # add the cheat, identified by the two positions
-                cheats.add((pos, new_pos))
-
-    return len(cheats)
+        # the end must be on the path and the cheat must be an improvement
+        max_distance = steps_left - min_improvement
+        for diff, length in cheat_offsets:
+            if 0 <= distances[pos + diff] <= max_distance - length:
+                n_cheats += 1
+
+    return n_cheats
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    # race track along the unique path through a maze
+    return to_lines(random_maze(size, rng, path_only=True))
+
+
+# sizes used for scaling reports
+scale_sizes = (21, 41, 81, 161)
+
+
+solver = Solver(year=2024, day=20, truth_a=1384, truth_b=1008542)
 
 
 if __name__ == "__main__":
-    Solver(year=2024, day=20, truth_a=1384, truth_b=1008542).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
@@ -7,6 +7,7 @@ https://adventofcode.com/2024/day/21
 from __future__ import annotations
 
 from collections import Counter
+from typing import Iterable
 
 from aoc2024 import Solver, Part
 
@@ -14,7 +15,7 @@ from aoc2024 import Solver, Part
 Pos = tuple[int, int]
 
 
-def solution(data: list[str], part: Part) -> int | str | None:
+def solution(data: Iterable[str], part: Part) -> int | str | None:
     # i-j coordinates of number and direction pad (0,0 at top left, i to bottom, j to right)
     num_coords = {n: divmod(k, 3) for k, n in enumerate("789456123 0A")}
     dir_coords = {d: divmod(k, 3) for k, d in enumerate(" ^A<v>")}
@@ -67,5 +68,8 @@ def solution(data: list[str], part: Part) -> int | str | None:
     )
 
 
+solver = Solver(year=2024, day=21, truth_a=202648, truth_b=248919739734728)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=21, truth_a=202648, truth_b=248919739734728).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
@@ -6,12 +6,15 @@ https://adventofcode.com/2024/day/22
 
 from __future__ import annotations
 
-from collections import deque
+import random
+from typing import Iterable
+from collections import Counter, deque
 
 from aoc2024 import Solver, Part
+from aoc2024.parallel import map_reduce, concat
 
 
-def solution(data: list[str], part: Part) -> int | str | None:
+def parse(data: list[str]) -> list[list[int]]:
     # initial secret per buyer
     initial_secrets: list[int] = list(map(int, data))
 
@@ -26,15 +29,21 @@ def solution(data: list[str], part: Part) -> int | str | None:
             secrets.append(secret)
         return secrets
 
-    # simulate all secrets
-    buyers_secrets: list[list[int]] = list(map(simulate_secrets, initial_secrets))
+    # helper returning the secrets of a single buyer as a list of one, so that lists of buyers can be concatenated
+    def simulate_buyer(secret: int) -> list[list[int]]:
+        return [simulate_secrets(secret)]
 
+    # simulate all secrets, shared by both parts, buyers are independent and can be distributed over processes
+    return map_reduce(simulate_buyer, initial_secrets, concat)
+
+
+def solution(buyers_secrets: list[list[int]], part: Part) -> int | str | None:
     # part a: return the sum of the 2000th secret per buyer
     if part == "a":
         return sum(s[-1] for s in buyers_secrets)
 
     # part b: per buyer, create a dictionary of the four last price changes mapped to the current price; then
-    # loop over all unique price change sequences (brute-force) and check which one yields the highest sum
+    # sum up prices per price change sequence over all buyers and pick the highest sum
 
     # helper to create the price changes -> price mapping
     def get_sequence_prices(secrets: list[int]) -> dict[tuple[int, ...], int]:
@@ -55,16 +64,28 @@ def solution(data: list[str], part: Part) -> int | str | None:
                 window.popleft()
         return prices
 
-    # get all price change sequences and brute-force the best one
-    prices = list(map(get_sequence_prices, map(simulate_secrets, map(int, data))))
-    max_sum_price = -1
-    for seq in set.union(*(set(p.keys()) for p in prices)):
-        sum_price = sum(p[seq] for p in prices if seq in p)
-        if sum_price > max_sum_price:
-            max_sum_price = sum_price
+    # helper to sum up prices per price change sequence
+    def sum_prices(prices: Iterable[dict[tuple[int, ...], int]]) -> Counter[tuple[int, ...]]:
+        sum_price: Counter[tuple[int, ...]] = Counter()
+        for p in prices:
+            sum_price.update(p)
+        return sum_price
+
+    # buyers are independent and can be distributed over processes
+    return max(map_reduce(get_sequence_prices, buyers_secrets, sum_prices).values(), default=-1)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    # size initial secrets
+    return [str(rng.randrange(1, 16777216)) for _ in range(size)]
+
+
+# sizes used for scaling reports
+scale_sizes = (50, 100, 200, 400)
+
 
-    return max_sum_price
+solver = Solver(year=2024, day=22, truth_a=19854248602, truth_b=2223)
 
 
 if __name__ == "__main__":
-    Solver(year=2024, day=22, truth_a=19854248602, truth_b=2223).solve(solution, part="x", submit=False)
+    solver.solve(solution, parse=parse, part="x", submit=False)
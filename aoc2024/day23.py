@@ -6,10 +6,12 @@ https://adventofcode.com/2024/day/23
 
 from __future__ import annotations
 
+import random
 from collections import defaultdict
 from typing import Generator
 
 from aoc2024 import Solver, Part
+from aoc2024.generators import random_names
 
 
 # helper returning all unique, sorted combinations of values
@@ -66,10 +68,38 @@ def solution(data: list[str], part: Part) -> int | str | None:
     raise RuntimeError("no solution found :(")
 
 
+def generate(size: int, rng: random.Random) -> list[str]:
+    # about size computers with exactly 13 connections each (as the solution expects), including a single
+    # fully-connected network of 13 computers; the remaining m computers (odd) are arranged in a random circle, each
+    # connected to its 12 closest neighbors, and 13 of them connect to one computer in the network each while the
+    # others are matched with their opposite computer in the circle
+    m = max(size - 13, 27) | 1
+    names = random_names(m + 13, rng, length=2)
+    rng.shuffle(names)
+    network, circle = names[:13], names[13:]
+    pairs = [(a, b) for i, a in enumerate(network) for b in network[i + 1:]]
+    pairs += [(circle[i], circle[(i + d) % m]) for i in range(m) for d in range(1, 7)]
+    stubs = set(rng.sample(range(m), 13))
+    pairs += [(network[k], circle[i]) for k, i in enumerate(sorted(stubs))]
+    rest = [circle[i] for i in range(m) if i not in stubs]
+    half = len(rest) // 2
+    pairs += [(rest[i], rest[i + half]) for i in range(half)]
+    lines = [f"{a}-{b}" for a, b in pairs]
+    rng.shuffle(lines)
+    return lines
+
+
+# sizes used for scaling reports
+scale_sizes = (65, 130, 260, 520)
+
+
+solver = Solver(
+    year=2024,
+    day=23,
+    truth_a=1163,
+    truth_b="bm,bo,ee,fo,gt,hv,jv,kd,md,mu,nm,wx,xh",
+)
+
+
 if __name__ == "__main__":
-    Solver(
-        year=2024,
-        day=23,
-        truth_a=1163,
-        truth_b="bm,bo,ee,fo,gt,hv,jv,kd,md,mu,nm,wx,xh",
-    ).solve(solution, part="x", submit=False)
+    solver.solve(solution, part="x", submit=False)
@@ -7,10 +7,12 @@ https://adventofcode.com/2024/day/24
 from __future__ import annotations
 
 import re
+import random
 from operator import and_, or_, xor
 from dataclasses import dataclass
 
 from aoc2024 import Solver, Part
+from aoc2024.generators import random_names
 
 
 @dataclass
@@ -30,7 +32,7 @@ class Gate:
         return name == self.inp1 or name == self.inp2
 
 
-def solution(data: list[str], part: Part) -> int | str | None:
+def parse(data: list[str]) -> tuple[dict[str, Gate], dict[str, int]]:
     # parse into gate objects and values
     gates: dict[str, Gate] = {}
     values: dict[str, int] = {}
@@ -42,6 +44,11 @@ def solution(data: list[str], part: Part) -> int | str | None:
         else:
             inp_name, val = line.split(": ")
             values[inp_name] = int(val)
+    return gates, values
+
+
+def solution(parsed: tuple[dict[str, Gate], dict[str, int]], part: Part) -> int | str | None:
+    gates, values = parsed
     n_outputs = sum(1 for key in gates if key.startswith("z"))
 
     # helper to recursively "pull" values from inputs and a state dict
@@ -81,10 +88,38 @@ def solution(data: list[str], part: Part) -> int | str | None:
     return ",".join(sorted(swap_gates))
 
 
+def generate(size: int, rng: random.Random) -> list[str]:
+    # correct ripple-carry adder for two numbers with size bits, without swapped outputs
+    names = iter(random_names(4 * size, rng, exclude="xyz"))
+    lines = [f"{v}{i:02d}: {rng.randint(0, 1)}" for v in "xy" for i in range(size)]
+    gates = ["x00 XOR y00 -> z00", f"x00 AND y00 -> {(carry := next(names))}"]
+    for i in range(1, size):
+        x, y, z = f"x{i:02d}", f"y{i:02d}", f"z{i:02d}"
+        t, a, b = next(names), next(names), next(names)
+        c = f"z{size:02d}" if i == size - 1 else next(names)
+        gates += [
+            f"{x} XOR {y} -> {t}",
+            f"{t} XOR {carry} -> {z}",
+            f"{x} AND {y} -> {a}",
+            f"{t} AND {carry} -> {b}",
+            f"{a} OR {b} -> {c}",
+        ]
+        carry = c
+    rng.shuffle(gates)
+    return lines + gates
+
+
+# sizes used for scaling reports
+scale_sizes = (12, 23, 45, 90, 180)
+
+
+solver = Solver(
+    year=2024,
+    day=24,
+    truth_a=46463754151024,
+    truth_b="cqk,fph,gds,jrs,wrk,z15,z21,z34",
+)
+
+
 if __name__ == "__main__":
-    Solver(
-        year=2024,
-        day=24,
-        truth_a=46463754151024,
-        truth_b="cqk,fph,gds,jrs,wrk,z15,z21,z34",
-    ).solve(solution, part="x", example=False)
+    solver.solve(solution, parse=parse, part="x", example=False)
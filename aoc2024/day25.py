@@ -39,5 +39,8 @@ def solution(data: list[str], part: Part) -> int | str | None:
     return None
 
 
+solver = Solver(year=2024, day=25, truth_a=3291, truth_b=None)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=25, truth_a=3291, truth_b=None).solve(solution, part="a", submit=False)
+    solver.solve(solution, part="a", submit=False)
@@ -0,0 +1,184 @@
+# coding: utf-8
+
+"""
+Differential testing of alternative solution implementations against the reference ``solution`` of a day.
+
+Day modules can register alternative implementations with the same signature as ``solution`` in a module-level
+``variants`` dictionary, mapping names to functions. When the day has a ``parse`` stage, variants receive its output
+as well.
+"""
+
+from __future__ import annotations
+
+import os
+import glob
+import random
+import traceback
+from types import ModuleType
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Any, cast
+
+from aoc2024 import Part, data_dir, human_time_diff
+from aoc2024.runner import import_day
+
+
+@dataclass
+class VariantCheck:
+    """
+    Outcome of checking a variant against the reference solution for a single part across multiple inputs, with
+    runtimes measured on the actual puzzle input.
+    """
+
+    day: int
+    variant: str
+    part: Part
+    inputs: list[str] = field(default_factory=list)
+    mismatches: list[str] = field(default_factory=list)
+    reference_time: float | None = None
+    variant_time: float | None = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def speedup(self) -> float | None:
+        if not self.reference_time or not self.variant_time:
+            return None
+        return self.reference_time / self.variant_time
+
+
+def get_variants(mod: ModuleType) -> dict[str, Callable[[Any, Part], int | str | None]]:
+    """
+    Returns the variants registered in a day module *mod*.
+    """
+    return dict(getattr(mod, "variants", {}))
+
+
+def test_inputs(mod: ModuleType, n_random: int = 5, seed: int = 0) -> list[tuple[str, list[str]]]:
+    """
+    Returns named inputs of a day module *mod* to check variants on, consisting of the puzzle input, all locally
+    available example inputs and *n_random* inputs created by the ``generate`` function of the module (if any) at
+    its two smallest ``scale_sizes``.
+    """
+    solver = mod.solver
+    inputs = [("input", solver.load())]
+
+    # examples that were already downloaded
+    pattern = os.path.join(data_dir, f"example*{solver.day:02d}.txt")
+    for path in sorted(glob.glob(pattern)):
+        with open(path, "r") as f:
+            lines = [line for line in (line.strip() for line in f.read().splitlines()) if line]
+        inputs.append((os.path.basename(path)[:-4], lines))
+
+    # random inputs
+    if (generate := getattr(mod, "generate", None)) is not None:
+        sizes = sorted(getattr(mod, "scale_sizes", (10,)))[:2]
+        for i in range(n_random):
+            size = sizes[i % len(sizes)]
+            inputs.append((f"random{i}(size={size})", generate(size, random.Random(seed + i))))
+
+    return inputs
+
+
+def check_variants(
+    day: int,
+    parts: str = "ab",
+    n_random: int = 5,
+    seed: int = 0,
+    min_time: float = 0.5,
+) -> list[VariantCheck]:
+    """
+    Runs all variants of a *day* and its reference solution for all *parts* on the inputs returned by
+    :py:func:`test_inputs` and returns a :py:class:`VariantCheck` per variant and part. Results of a variant that
+    differ from the reference or raise an exception are recorded as mismatches, while inputs the reference itself
+    fails on are skipped. Runtimes are measured as the minimum of repeated calls taking about *min_time* seconds in
+    total on the puzzle input, including parsing.
+    """
+    from aoc2024.bench import measure
+
+    mod = import_day(day)
+    variants = get_variants(mod)
+    if not variants:
+        return []
+    parse = getattr(mod, "parse", None)
+    inputs = test_inputs(mod, n_random=n_random, seed=seed)
+
+    def call(func: Callable[[Any, Part], int | str | None], lines: list[str], part: Part) -> int | str | None:
+        return func(list(lines) if parse is None else parse(list(lines)), part)
+
+    checks: list[VariantCheck] = []
+    for part in cast(Iterable[Part], parts):
+        part_checks = {name: VariantCheck(day=day, variant=name, part=part) for name in variants}
+
+        for input_name, lines in inputs:
+            try:
+                expected = call(mod.solution, lines, part)
+            except Exception:
+                continue
+            for name, func in variants.items():
+                check = part_checks[name]
+                check.inputs.append(input_name)
+                try:
+                    value = call(func, lines, part)
+                except Exception as e:
+                    check.mismatches.append(f"{input_name}: {traceback.format_exception_only(e)[-1].strip()}")
+                    continue
+                if value != expected:
+                    check.mismatches.append(f"{input_name}: {value} != {expected}")
+
+        # timings on the puzzle input
+        lines = inputs[0][1]
+        time_call = lambda func: min(measure(lambda: call(func, lines, part), warmup=0, min_time=min_time)[1])
+        reference_time = time_call(mod.solution)
+        for name, func in variants.items():
+            check = part_checks[name]
+            check.reference_time = reference_time
+            if "input" in check.inputs and not any(m.startswith("input:") for m in check.mismatches):
+                check.variant_time = time_call(func)
+
+        checks.extend(part_checks.values())
+
+    return checks
+
+
+def print_variant_checks(
+    days: list[int],
+    parts: str = "ab",
+    n_random: int = 5,
+    seed: int = 0,
+    min_time: float = 0.5,
+) -> list[VariantCheck]:
+    """
+    Checks variants of all *parts* of all *days* via :py:func:`check_variants`, prints a table with the number of
+    checked inputs, mismatches and speedups followed by mismatch details, and returns the checks.
+    """
+    from tabulate import tabulate
+
+    checks: list[VariantCheck] = []
+    for day in days:
+        checks.extend(check_variants(day, parts=parts, n_random=n_random, seed=seed, min_time=min_time))
+
+    rows = [
+        [
+            c.day,
+            c.part,
+            c.variant,
+            len(c.inputs),
+            "✅" if c.ok else f"❌ {len(c.mismatches)}",
+            "-" if c.reference_time is None else human_time_diff(c.reference_time),
+            "-" if c.variant_time is None else human_time_diff(c.variant_time),
+            "-" if c.speedup is None else f"{c.speedup:.2f}x",
+        ]
+        for c in checks
+    ]
+    print(tabulate(rows, headers=["day", "part", "variant", "inputs", "match", "reference", "variant", "speedup"]))
+
+    # mismatch details
+    for c in checks:
+        if c.mismatches:
+            print(f"\n❌ day {c.day}, part {c.part}, variant {c.variant}:")
+            for mismatch in c.mismatches:
+                print(f"   {mismatch}")
+
+    return checks
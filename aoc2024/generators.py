@@ -0,0 +1,87 @@
+# coding: utf-8
+
+"""
+Helpers for generating synthetic puzzle inputs of arbitrary size, used by the optional ``generate`` functions of day
+modules.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+
+
+def to_lines(grid: list[list[str]]) -> list[str]:
+    """
+    Joins a *grid* of characters into lines.
+    """
+    return ["".join(row) for row in grid]
+
+
+def random_names(n: int, rng: random.Random, length: int = 3, exclude: str = "") -> list[str]:
+    """
+    Returns *n* unique random names of lowercase letters with a minimum *length*, none starting with a character in
+    *exclude*. The length is increased if needed to fit *n* names.
+    """
+    first = [c for c in string.ascii_lowercase if c not in exclude]
+    while len(first) * 26**(length - 1) < 2 * n:
+        length += 1
+    names: set[str] = set()
+    while len(names) < n:
+        names.add(rng.choice(first) + "".join(rng.choices(string.ascii_lowercase, k=length - 1)))
+    return sorted(names)
+
+
+def random_maze(size: int, rng: random.Random, *, loops: float = 0.0, path_only: bool = False) -> list[list[str]]:
+    """
+    Returns a square maze with an odd side length of at least *size*, surrounded by walls, with the start ``S`` in the
+    bottom-left and the end ``E`` in the top-right corner. Corridors are carved with a randomized depth-first search,
+    resulting in a perfect maze (a tree). A fraction *loops* of the remaining inner walls between corridors is removed
+    to create alternative paths. When *path_only* is *True*, all cells except those on the unique path between start
+    and end are turned into walls, resulting in a single race track without branches.
+    """
+    n = max(size | 1, 5)
+    grid = [["#"] * n for _ in range(n)]
+
+    # carve corridors between cells at odd coordinates with an iterative dfs
+    start, end = (n - 2, 1), (1, n - 2)
+    grid[start[0]][start[1]] = "."
+    parents: dict[tuple[int, int], tuple[int, int]] = {start: start}
+    stack = [start]
+    while stack:
+        i, j = stack[-1]
+        neighbors = [
+            (i + di, j + dj)
+            for di, dj in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < i + di < n - 1 and 0 < j + dj < n - 1 and (i + di, j + dj) not in parents
+        ]
+        if not neighbors:
+            stack.pop()
+            continue
+        ni, nj = rng.choice(neighbors)
+        grid[(i + ni) // 2][(j + nj) // 2] = grid[ni][nj] = "."
+        parents[(ni, nj)] = (i, j)
+        stack.append((ni, nj))
+
+    if path_only:
+        # trace back from the end and keep only the path
+        path = {end}
+        cell = end
+        while cell != start:
+            parent = parents[cell]
+            path |= {parent, ((cell[0] + parent[0]) // 2, (cell[1] + parent[1]) // 2)}
+            cell = parent
+        grid = [["." if (i, j) in path else "#" for j in range(n)] for i in range(n)]
+    elif loops > 0:
+        # remove some walls that separate two corridors
+        for i in range(1, n - 1):
+            for j in range(1, n - 1):
+                if grid[i][j] != "#" or rng.random() >= loops:
+                    continue
+                if (i % 2 == 1 and j % 2 == 0) or (i % 2 == 0 and j % 2 == 1):
+                    grid[i][j] = "."
+
+    grid[start[0]][start[1]] = "S"
+    grid[end[0]][end[1]] = "E"
+
+    return grid
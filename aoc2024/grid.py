@@ -0,0 +1,157 @@
+# coding: utf-8
+
+"""
+Compact character grids with integer cell ids.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, Self
+
+
+class Grid:
+    """
+    Character grid of *lines*, stored row by row in a flat bytearray surrounded by *pad* rows and columns of a *border*
+    character. Cells are addressed by integer ids, i.e., their index into :py:attr:`cells`, so that neighbors are
+    reached by adding one of the precomputed :py:attr:`offsets4` or :py:attr:`offsets8` without any bounds checks, as
+    long as walks stop at border cells. Coordinates ``(i, j)`` refer to the inner grid without the border.
+
+    For performance-critical loops, it is recommended to read :py:attr:`cells` directly, which contains byte values,
+    e.g. ``grid.cells[cell] == ord("#")``.
+    """
+
+    def __init__(self, lines: list[str], *, border: str = " ", pad: int = 1) -> None:
+        super().__init__()
+
+        # validation
+        if len(border) != 1:
+            raise ValueError(f"border must be a single character, got '{border}'")
+        if pad < 1:
+            raise ValueError(f"pad must be positive, got {pad}")
+        if len({len(line) for line in lines}) > 1:
+            raise ValueError("lines must have equal lengths")
+
+        # attributes
+        self.height = len(lines)
+        self.width = len(lines[0]) if lines else 0
+        self.pad = pad
+        self.border = border
+        self.stride = self.width + 2 * pad
+
+        # fill cells
+        b = border.encode("ascii")
+        edge = b * (pad * self.stride)
+        side = b * pad
+        self.cells = bytearray(edge + b"".join(side + line.encode("ascii") + side for line in lines) + edge)
+
+        # neighbor offsets, 4-neighbors ordered clockwise starting north, 8-neighbors including diagonals in between
+        s = self.stride
+        self.offsets4 = (-s, 1, s, -1)
+        self.offsets8 = (-s, -s + 1, 1, s + 1, s, s - 1, -1, -s - 1)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(height={self.height}, width={self.width})"
+
+    def __str__(self) -> str:
+        return "\n".join(self.rows())
+
+    def __len__(self) -> int:
+        return self.height * self.width
+
+    def __getitem__(self, cell: int | tuple[int, int]) -> str:
+        if isinstance(cell, tuple):
+            cell = self.id(*cell)
+        return chr(self.cells[cell])
+
+    def __setitem__(self, cell: int | tuple[int, int], char: str) -> None:
+        if isinstance(cell, tuple):
+            cell = self.id(*cell)
+        self.cells[cell] = ord(char)
+
+    def __iter__(self) -> Iterator[int]:
+        # ids of all inner cells in row-major order
+        for i in range(self.height):
+            start = (i + self.pad) * self.stride + self.pad
+            yield from range(start, start + self.width)
+
+    def copy(self) -> Self:
+        grid = object.__new__(self.__class__)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def id(self, i: int, j: int) -> int:
+        """
+        Returns the id of the cell at coordinates *i* and *j*.
+        """
+        return (i + self.pad) * self.stride + j + self.pad
+
+    def pos(self, cell: int) -> tuple[int, int]:
+        """
+        Returns the coordinates of a *cell* id.
+        """
+        i, j = divmod(cell, self.stride)
+        return i - self.pad, j - self.pad
+
+    def is_border(self, cell: int) -> bool:
+        i, j = self.pos(cell)
+        return not (0 <= i < self.height and 0 <= j < self.width)
+
+    def find(self, char: str, start: int = 0) -> int | None:
+        """
+        Returns the id of the first cell containing *char* at or after cell id *start*, or *None* if not found.
+        """
+        cell = self.cells.find(ord(char), start)
+        return None if cell < 0 else cell
+
+    def find_all(self, char: str) -> list[int]:
+        """
+        Returns the ids of all cells containing *char* in row-major order.
+        """
+        cells, c = [], ord(char)
+        cell = self.cells.find(c)
+        while cell >= 0:
+            cells.append(cell)
+            cell = self.cells.find(c, cell + 1)
+        return cells
+
+    def count(self, char: str) -> int:
+        return self.cells.count(ord(char)) - (char == self.border) * (len(self.cells) - len(self))
+
+    def rows(self) -> list[str]:
+        """
+        Returns all rows of the inner grid.
+        """
+        return [self._view(self.id(i, 0), self.width, 1) for i in range(self.height)]
+
+    def columns(self) -> list[str]:
+        """
+        Returns all columns of the inner grid, read top to bottom.
+        """
+        return [self._view(self.id(0, j), self.height, self.stride) for j in range(self.width)]
+
+    def diagonals(self) -> list[str]:
+        """
+        Returns all diagonals of the inner grid running from top-left to bottom-right, starting with the one in the
+        bottom-left corner.
+        """
+        h, w, step = self.height, self.width, self.stride + 1
+        return [
+            self._view(self.id(max(d, 0), max(-d, 0)), min(h - max(d, 0), w - max(-d, 0)), step)
+            for d in range(h - 1, -w, -1)
+        ]
+
+    def antidiagonals(self) -> list[str]:
+        """
+        Returns all diagonals of the inner grid running from top-right to bottom-left, starting with the one in the
+        top-left corner.
+        """
+        h, w, step = self.height, self.width, self.stride - 1
+        return [
+            self._view(self.id(i := max(d - w + 1, 0), d - i), min(d, h - 1) - i + 1, step)
+            for d in range(h + w - 1)
+        ]
+
+    def _view(self, start: int, n: int, step: int) -> str:
+        # string of n cells from start in steps of step
+        return self.cells[start:start + (n - 1) * step + 1:step].decode("ascii")
@@ -0,0 +1,186 @@
+# coding: utf-8
+
+"""
+Read-once input store, serving input files as bytes, memory views or lines.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import mmap
+import hashlib
+import functools
+from array import array
+from typing import Iterable, Iterator
+
+
+# files larger than this are memory-mapped instead of read
+mmap_threshold = 16 * 1024**2
+
+# default size of chunks when streaming files
+chunk_size = 1024**2
+
+# line breaks, \r is removed from the end of lines separately
+_line_break = re.compile(b"\n")
+
+
+class Input:
+    """
+    Contents of an input file at *path*, read once and served in different representations on request. Files larger
+    than *mmap_threshold* bytes are memory-mapped. Representations are computed lazily and cached:
+
+        - :py:attr:`buffer`: the raw content as bytes or mmap
+        - :py:attr:`view`: a zero-copy memoryview of the buffer
+        - :py:attr:`line_offsets`: start offsets of all lines plus the total size
+        - :py:meth:`line_view`: a zero-copy view of a single line
+        - :py:attr:`text`: the decoded content, only cached for files that are not memory-mapped
+        - :py:meth:`lines`: materialized str lines
+        - :py:attr:`digest`: the sha256 hex digest of the content
+    """
+
+    def __init__(self, path: str, *, mmap_threshold: int = mmap_threshold) -> None:
+        super().__init__()
+
+        # attributes
+        self.path = path
+        self.mmap_threshold = mmap_threshold
+
+        # file state at the time of reading, used to detect changes
+        stat = os.stat(path)
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+
+        # cached text and lines, the latter mapped to whether they are stripped
+        self._text: str | None = None
+        self._lines: dict[bool, tuple[str, ...]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.path!r}, size={self.size})"
+
+    @property
+    def changed(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return True
+        return (stat.st_mtime_ns, stat.st_size) != (self.mtime_ns, self.size)
+
+    @functools.cached_property
+    def buffer(self) -> bytes | mmap.mmap:
+        with open(self.path, "rb") as f:
+            if self.size > self.mmap_threshold:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return f.read()
+
+    @property
+    def view(self) -> memoryview:
+        return memoryview(self.buffer)
+
+    @functools.cached_property
+    def line_offsets(self) -> array[int]:
+        # start offsets of all lines, followed by the total size such that line i spans [offsets[i], offsets[i + 1])
+        offsets = array("Q", [0])
+        offsets.extend(m.end() for m in _line_break.finditer(self.buffer))
+        # no empty trailing line after a final newline
+        if offsets[-1] != self.size:
+            offsets.append(self.size)
+        return offsets
+
+    @property
+    def n_lines(self) -> int:
+        return len(self.line_offsets) - 1
+
+    def line_view(self, i: int) -> memoryview:
+        """
+        Returns a zero-copy view of line *i* without its line break.
+        """
+        start, stop = self.line_offsets[i], self.line_offsets[i + 1]
+        view = self.view[start:stop]
+        while view and view[-1] in b"\r\n":
+            view = view[:-1]
+        return view
+
+    @functools.cached_property
+    def digest(self) -> str:
+        return hashlib.sha256(self.buffer).hexdigest()
+
+    @property
+    def text(self) -> str:
+        # memory-mapped files are decoded on each access instead of keeping a copy of the full content
+        buf = self.buffer
+        if not isinstance(buf, bytes):
+            return buf[:].decode("utf-8")
+        if self._text is None:
+            self._text = buf.decode("utf-8")
+        return self._text
+
+    def lines(self, strip: bool = True) -> list[str]:
+        """
+        Returns the lines of the input as a new list of strings, optionally with whitespace *strip*'ed and empty lines
+        removed. Lines are split the same way as by :py:func:`iter_lines`, and memory-mapped files are split chunk by
+        chunk without copying their full content first. The list itself is not cached, so callers are free to change it
+        in-place.
+        """
+        if strip not in self._lines:
+            buf = self.buffer
+            chunks: Iterable[bytes]
+            if isinstance(buf, bytes):
+                chunks = [buf]
+            else:
+                chunks = (buf[i:i + chunk_size] for i in range(0, len(buf), chunk_size))
+            self._lines[strip] = tuple(_split_lines(chunks, strip))
+        return list(self._lines[strip])
+
+    def close(self) -> None:
+        # only close buffers that were actually mapped, without mapping them first through the cached property
+        if isinstance(buf := self.__dict__.get("buffer"), mmap.mmap):
+            buf.close()
+
+
+# inputs read so far in this process, mapped to their path
+_inputs: dict[str, Input] = {}
+
+
+def get_input(path: str) -> Input:
+    """
+    Returns the :py:class:`Input` for *path*, reading it only once per process unless the file changed.
+    """
+    path = os.path.abspath(path)
+    inp = _inputs.get(path)
+    if inp is None or inp.changed:
+        if inp is not None:
+            inp.close()
+        inp = _inputs[path] = Input(path)
+    return inp
+
+
+def iter_lines(path: str, *, strip: bool = True, chunk_size: int = chunk_size) -> Iterator[str]:
+    """
+    Lazily yields the lines of the file at *path*, reading it in chunks of *chunk_size* bytes so that memory usage does
+    not depend on the file size. Same as for :py:meth:`Input.lines`, whitespace is optionally *strip*'ed and empty
+    lines are skipped. In contrast to :py:func:`get_input`, the file is read again on each call.
+    """
+    with open(path, "rb") as f:
+        yield from _split_lines(iter(functools.partial(f.read, chunk_size), b""), strip)
+
+
+def _split_lines(chunks: Iterable[bytes], strip: bool) -> Iterator[str]:
+    # splits at \n only, consistent with line_offsets, and removes a trailing \r
+    rest = b""
+    for chunk in chunks:
+        # decode all complete lines at once, which never splits multi-byte characters, and keep the remainder
+        data = rest + chunk
+        pos = data.rfind(b"\n") + 1
+        rest = data[pos:]
+        if pos:
+            yield from _clean_lines(data[:pos - 1].decode("utf-8").split("\n"), strip)
+    # remainder after the last line break
+    if rest:
+        yield from _clean_lines([rest.decode("utf-8")], strip)
+
+
+def _clean_lines(lines: list[str], strip: bool) -> list[str]:
+    if strip:
+        return [line for line in map(str.strip, lines) if line]
+    return [line.removesuffix("\r") for line in lines]
@@ -0,0 +1,114 @@
+# coding: utf-8
+
+"""
+Running calls in a child process with time and memory budgets.
+"""
+
+from __future__ import annotations
+
+import os
+import math
+import signal
+import resource
+import traceback
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Callable, Any, Literal, TypeVar
+
+from aoc2024 import human_time_diff
+
+
+T = TypeVar("T")
+
+Status = Literal["TIMEOUT", "OOM"]
+
+
+class BudgetExceeded(Exception):
+    """
+    Raised when a call exceeded its time or memory budget, with *status* being ``"TIMEOUT"`` or ``"OOM"``.
+    """
+
+    def __init__(self, status: Status, msg: str) -> None:
+        super().__init__(msg)
+
+        self.status = status
+
+
+def _virtual_memory() -> int:
+    # current virtual memory size of the process in bytes, or 0 if unknown
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _child(call: Callable[[], Any], conn: Connection, timeout: float | None, max_memory: int | None) -> None:
+    # runs in the child process, applies resource limits, invokes call and sends back ("ok", value) or ("error", ...)
+    if max_memory is not None:
+        limit = _virtual_memory() + max_memory
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if timeout is not None:
+        # cpu time limit as a backstop in case the parent is not able to kill the child
+        limit = math.ceil(timeout) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (limit, limit))
+
+    try:
+        msg = ("ok", call())
+    except MemoryError:
+        msg = ("oom", None)
+    except BaseException as e:
+        msg = ("error", (e, "".join(traceback.format_exception(e))))
+
+    try:
+        conn.send(msg)
+    except Exception as e:
+        # value or exception not picklable, or memory exhausted while doing so
+        conn.send(("error", (RuntimeError(f"cannot send result: {e}"), "")))
+    finally:
+        conn.close()
+
+
+def run_isolated(call: Callable[[], T], *, timeout: float | None = None, max_memory: int | None = None) -> T:
+    """
+    Invokes *call* in a forked child process and returns its return value, which must be picklable. The child is killed
+    when it takes longer than *timeout* seconds of wall time, and its address space is limited to *max_memory* bytes on
+    top of what it already uses when forked. Overruns are raised as :py:class:`BudgetExceeded`, while other exceptions
+    raised by *call* are re-raised in the current process.
+    """
+    ctx = multiprocessing.get_context("fork")
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_child, args=(call, send_conn, timeout, max_memory))
+    proc.start()
+    send_conn.close()
+
+    try:
+        # wait for the result or the child to die
+        if not recv_conn.poll(timeout):
+            raise BudgetExceeded("TIMEOUT", f"timeout after {human_time_diff(timeout or 0.0)}")
+        try:
+            status, value = recv_conn.recv()
+        except EOFError:
+            # child died without sending, either killed by the kernel or by exceeding cpu limits
+            proc.join()
+            if proc.exitcode in (-signal.SIGXCPU, -signal.SIGKILL) and timeout is not None:
+                raise BudgetExceeded("TIMEOUT", f"timeout after {human_time_diff(timeout)}")
+            if max_memory is not None:
+                raise BudgetExceeded("OOM", f"child process died with exit code {proc.exitcode}, likely out of memory")
+            raise RuntimeError(f"child process died with exit code {proc.exitcode}")
+    finally:
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
+        recv_conn.close()
+
+    if status == "oom":
+        from aoc2024.memory import human_bytes
+        raise BudgetExceeded("OOM", f"memory budget of {human_bytes(max_memory or 0)} exceeded")
+    if status == "error":
+        exc, tb = value
+        if tb:
+            exc.add_note(f"raised in child process:\n{tb}")
+        raise exc
+
+    return value
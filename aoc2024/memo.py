@@ -0,0 +1,205 @@
+# coding: utf-8
+
+"""
+Bounded and instrumented memoization of pure functions.
+
+Memoized functions keep hit, miss and eviction statistics that the :py:class:`aoc2024.Solver` reports as counters
+(``<name>_hits``, ``<name>_misses``, ``<name>_evictions`` and ``<name>_size``) when enabled, e.g. via
+``python -m aoc2024 run --counters``. Their *scope* decides whether the solver clears caches around each solution call
+(``"call"``) or keeps them, so that parts solved in the same process share results (``"shared"``).
+"""
+
+from __future__ import annotations
+
+import time
+import heapq
+import weakref
+import functools
+from dataclasses import dataclass
+from typing import Callable, Literal, Any, TypeAlias
+
+
+Policy: TypeAlias = Literal["lru", "cost"]
+Scope: TypeAlias = Literal["call", "shared"]
+
+# all memoized functions, used by the solver to reset caches and collect statistics
+_registry: weakref.WeakSet[Callable[..., Any]] = weakref.WeakSet()
+
+# marker for cache misses
+_missing = object()
+
+
+@dataclass
+class MemoInfo:
+    """
+    Statistics of a memoized function, accumulated since it was created.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int | None
+
+
+def memo(
+    func: Callable[..., Any] | None = None,
+    /,
+    *,
+    maxsize: int | None = None,
+    policy: Policy = "lru",
+    cost: Callable[..., float] | None = None,
+    scope: Scope = "call",
+    name: str | None = None,
+) -> Any:
+    """
+    Decorator that memoizes a function *func* based on its arguments, usable with and without arguments:
+
+    .. code-block:: python
+
+        @memo
+        def f(n: int) -> int: ...
+
+        @memo(maxsize=10_000, policy="cost", scope="shared")
+        def g(n: int) -> int: ...
+
+    Without a *maxsize*, the cache is unbounded and behaves like :py:func:`functools.cache`. Otherwise, once the cache
+    is full, the entry to evict is selected by *policy*: ``"lru"`` evicts the least recently used entry (via
+    :py:func:`functools.lru_cache`), whereas ``"cost"`` evicts the entry that is cheapest to recompute. Costs are either
+    measured as the time it took to compute a value (including nested calls, which makes results of deep recursions
+    most valuable), or given by a *cost* function that is called with the same arguments as *func*. The cost policy is
+    implemented in Python and only supports positional arguments, so it has a higher per-call overhead.
+
+    With the ``"call"`` *scope*, the :py:class:`aoc2024.Solver` clears the cache before and after each solution call,
+    which makes repeated runs independent and releases memory in between. With ``"shared"``, results are kept across
+    calls, e.g. to let part b reuse values computed for part a. Counters are reported under *name*, defaulting to the
+    name of *func*.
+
+    The returned wrapper provides ``cache_info()`` returning a :py:class:`MemoInfo` and ``cache_clear()``.
+    """
+    # validation
+    if maxsize is not None and maxsize < 1:
+        raise ValueError(f"maxsize must be positive, got {maxsize}")
+    if policy not in ("lru", "cost"):
+        raise ValueError(f"unknown memo policy '{policy}'")
+    if scope not in ("call", "shared"):
+        raise ValueError(f"unknown memo scope '{scope}'")
+
+    if func is None:
+        return functools.partial(memo, maxsize=maxsize, policy=policy, cost=cost, scope=scope, name=name)
+
+    if maxsize is None or policy == "lru":
+        # functools implements both cases in C and its statistics are kept across clears, but it does not count
+        # evictions, so bounded caches count the values that were computed and stored (only adding overhead to misses)
+        # and derive evictions as n_stored - currsize
+        n_stored = 0
+
+        def store(*args: Any, **kwargs: Any) -> Any:
+            nonlocal n_stored
+            value = func(*args, **kwargs)
+            n_stored += 1
+            return value
+
+        cached = functools.lru_cache(maxsize=maxsize)(func if maxsize is None else functools.wraps(func)(store))
+        lru_info, lru_clear = cached.cache_info, cached.cache_clear
+        cleared = MemoInfo(hits=0, misses=0, evictions=0, size=0, maxsize=maxsize)
+
+        def cache_info() -> MemoInfo:
+            info = lru_info()
+            return MemoInfo(
+                hits=cleared.hits + info.hits,
+                misses=cleared.misses + info.misses,
+                evictions=cleared.evictions + (0 if maxsize is None else n_stored - info.currsize),
+                size=info.currsize,
+                maxsize=maxsize,
+            )
+
+        def cache_clear() -> None:
+            nonlocal cleared, n_stored
+            cleared = cache_info()
+            n_stored = 0
+            lru_clear()
+
+        wrapper: Any = cached
+
+    else:
+        cache: dict[tuple, Any] = {}
+        # heap of (cost, sequence number, key), the number breaks ties without comparing keys
+        heap: list[tuple[float, int, tuple]] = []
+        hits = misses = evictions = 0
+
+        def wrapper(*args: Any) -> Any:
+            nonlocal hits, misses, evictions
+            value = cache.get(args, _missing)
+            if value is not _missing:
+                hits += 1
+                return value
+            misses += 1
+            t1 = time.perf_counter()
+            value = func(*args)
+            c = time.perf_counter() - t1 if cost is None else cost(*args)
+            # nested calls might have added the same key in the meantime, which then already has a heap entry
+            if args in cache:
+                return value
+            cache[args] = value
+            heapq.heappush(heap, (c, misses, args))
+            if len(cache) > maxsize:
+                # every cached key has exactly one heap entry, so the cheapest one is always live
+                del cache[heapq.heappop(heap)[2]]
+                evictions += 1
+            return value
+
+        def cache_info() -> MemoInfo:
+            return MemoInfo(hits=hits, misses=misses, evictions=evictions, size=len(cache), maxsize=maxsize)
+
+        def cache_clear() -> None:
+            cache.clear()
+            heap.clear()
+
+        functools.update_wrapper(wrapper, func)
+
+    wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    wrapper.memo_name = name or func.__name__  # type: ignore[attr-defined]
+    wrapper.memo_scope = scope  # type: ignore[attr-defined]
+    _registry.add(wrapper)
+
+    return wrapper
+
+
+def clear(scope: Scope | None = None) -> None:
+    """
+    Clears the caches of all memoized functions, or only those with a certain *scope*.
+    """
+    for wrapper in list(_registry):
+        if scope is None or wrapper.memo_scope == scope:  # type: ignore[attr-defined]
+            wrapper.cache_clear()  # type: ignore[attr-defined]
+
+
+def snapshot() -> dict[Callable[..., Any], MemoInfo]:
+    """
+    Returns the current statistics of all memoized functions, to be passed to :py:func:`collect` later on.
+    """
+    return {wrapper: wrapper.cache_info() for wrapper in list(_registry)}  # type: ignore[attr-defined]
+
+
+def collect(before: dict[Callable[..., Any], MemoInfo] | None = None) -> dict[str, int]:
+    """
+    Returns counters of all memoized functions that were used since a :py:func:`snapshot` *before*, with hits, misses
+    and evictions relative to it and the current cache size.
+    """
+    counters: dict[str, int] = {}
+    for wrapper in list(_registry):
+        info = wrapper.cache_info()  # type: ignore[attr-defined]
+        prev = (before or {}).get(wrapper)
+        hits = info.hits - (prev.hits if prev else 0)
+        misses = info.misses - (prev.misses if prev else 0)
+        if not hits and not misses:
+            continue
+        name = wrapper.memo_name  # type: ignore[attr-defined]
+        for key, value in [("hits", hits), ("misses", misses), ("size", info.size)]:
+            counters[f"{name}_{key}"] = counters.get(f"{name}_{key}", 0) + value
+        if info.maxsize is not None:
+            evictions = info.evictions - (prev.evictions if prev else 0)
+            counters[f"{name}_evictions"] = counters.get(f"{name}_evictions", 0) + evictions
+    return counters
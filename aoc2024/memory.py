@@ -0,0 +1,159 @@
+# coding: utf-8
+
+"""
+Memory measurement helpers based on tracemalloc and resource usage.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import resource
+import tracemalloc
+from types import CodeType
+from dataclasses import dataclass, field
+from typing import Callable, TypeVar
+
+from aoc2024 import this_dir
+
+
+T = TypeVar("T")
+
+
+def human_bytes(n: int | float) -> str:
+    """
+    Convert a number of bytes to a human-readable string.
+    """
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(n) < 1024:
+            return f"{n:.1f} {unit}" if unit != "B" else f"{int(n)} B"
+        n /= 1024
+    return f"{n:.2f} GiB"
+
+
+def peak_rss() -> int:
+    """
+    Returns the peak resident set size of the current process in bytes.
+    """
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macos bytes
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+@dataclass
+class AllocationSite:
+    """
+    Memory allocated at a single source line.
+    """
+
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryStats:
+    """
+    Memory usage of a single call, see :py:func:`trace_call`.
+    """
+
+    peak_traced: int
+    peak_rss: int
+    peak_rss_increase: int
+    sites: list[AllocationSite] = field(default_factory=list)
+
+    def print(self, top: int | None = None) -> None:
+        print(
+            f"🧠 memory   : {human_bytes(self.peak_traced)} peak traced, {human_bytes(self.peak_rss)} peak rss "
+            f"(+{human_bytes(self.peak_rss_increase)})",
+        )
+        sites = self.sites[:top]
+        if not sites:
+            return
+        print(f"🧠 top {len(sites)} allocation sites:")
+        print(f"   {'size':>10}  {'count':>9}  location")
+        for site in sites:
+            print(f"   {human_bytes(site.size):>10}  {site.count:>9}  {site.location}")
+
+
+def _location(frame: tracemalloc.Frame) -> str:
+    # source location, relative to the repository if possible
+    file = frame.filename
+    repo_dir = os.path.dirname(this_dir)
+    if file.startswith(repo_dir + os.sep):
+        file = os.path.relpath(file, repo_dir)
+    return f"{file}:{frame.lineno}"
+
+
+def _monitor_return(code: CodeType, callback: Callable[[], None]) -> Callable[[], None] | None:
+    # registers callback to be invoked right before the outermost invocation of code returns, i.e., while its locals
+    # are still alive, and returns a function to unregister it again; returns None if sys.monitoring is not available
+    # or all tool ids are in use
+    monitoring = getattr(sys, "monitoring", None)
+    if monitoring is None:
+        return None
+    tool_id = next((i for i in range(6) if monitoring.get_tool(i) is None), None)
+    if tool_id is None:
+        return None
+
+    depth = [0]
+    def on_start(*args) -> None:
+        depth[0] += 1
+    def on_return(*args) -> None:
+        depth[0] -= 1
+        if depth[0] == 0:
+            callback()
+
+    monitoring.use_tool_id(tool_id, "aoc2024.memory")
+    monitoring.register_callback(tool_id, monitoring.events.PY_START, on_start)
+    monitoring.register_callback(tool_id, monitoring.events.PY_RETURN, on_return)
+    monitoring.set_local_events(tool_id, code, monitoring.events.PY_START | monitoring.events.PY_RETURN)
+
+    def unregister() -> None:
+        monitoring.set_local_events(tool_id, code, 0)
+        monitoring.register_callback(tool_id, monitoring.events.PY_START, None)
+        monitoring.register_callback(tool_id, monitoring.events.PY_RETURN, None)
+        monitoring.free_tool_id(tool_id)
+
+    return unregister
+
+
+def trace_call(call: Callable[[], T], *, code: CodeType | None = None, top: int = 10) -> tuple[T, MemoryStats]:
+    """
+    Invokes *call* with tracemalloc enabled and returns its return value and :py:class:`MemoryStats` with the peak
+    traced memory, the peak rss of the process and the *top* allocation sites by size. When the *code* object of the
+    function doing the actual work is given, allocation sites are recorded right before it returns, so that its local
+    containers are still alive. Otherwise, they are recorded after *call* returned, only covering memory that outlived
+    it. Note that tracing slows down the call and adds some memory overhead itself.
+    """
+    snapshots: list[tracemalloc.Snapshot] = []
+    unregister = None
+    if code is not None:
+        unregister = _monitor_return(code, lambda: snapshots.append(tracemalloc.take_snapshot()))
+
+    rss_before = peak_rss()
+    tracemalloc.start()
+    try:
+        ret = call()
+        if not snapshots:
+            snapshots.append(tracemalloc.take_snapshot())
+        _, peak_traced = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        if unregister is not None:
+            unregister()
+    rss_after = peak_rss()
+
+    # group allocations by line, ignoring tracemalloc internals
+    snapshot = snapshots[-1].filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    sites = [
+        AllocationSite(location=_location(stat.traceback[0]), size=stat.size, count=stat.count)
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+    return ret, MemoryStats(
+        peak_traced=peak_traced,
+        peak_rss=rss_after,
+        peak_rss_increase=rss_after - rss_before,
+        sites=sites,
+    )
@@ -0,0 +1,126 @@
+# coding: utf-8
+
+"""
+Parallel map-reduce over independent input records using forked worker processes.
+"""
+
+from __future__ import annotations
+
+import os
+import math
+import time
+import multiprocessing
+from typing import Callable, Iterable, Sequence, Any, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# function, records and reduce function of the current map, set before forking so that workers inherit them
+_state: tuple[Callable[[Any], Any], Sequence[Any], Callable[[Iterable[Any]], Any]] | None = None
+
+
+# whether the current process is a worker of a pool that already runs days or parts in parallel
+_in_worker = False
+
+
+def mark_worker() -> None:
+    """
+    Marks the current process as a worker of a pool that runs days or parts in parallel, e.g. via ``python -m aoc2024
+    run --jobs N``, so that maps stay serial instead of starting nested pools that would oversubscribe cpus. Meant to
+    be used as a pool initializer.
+    """
+    global _in_worker
+    _in_worker = True
+
+
+def can_fork() -> bool:
+    """
+    Returns whether worker processes can be forked from the current process, i.e., whether the platform supports it
+    and the current process is neither a daemonic pool worker itself nor marked via :py:func:`mark_worker`.
+    """
+    if _in_worker or multiprocessing.current_process().daemon:
+        return False
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def concat(parts: Iterable[list[T]]) -> list[T]:
+    """
+    Reduce function for :py:func:`map_reduce` that concatenates lists, e.g. for functions returning a list with a
+    single result per record.
+    """
+    return [item for part in parts for item in part]
+
+
+def _map_chunk(bounds: tuple[int, int]) -> Any:
+    # runs in forked workers, maps and reduces the records between start and stop
+    assert _state is not None
+    func, records, reduce = _state
+    start, stop = bounds
+    return reduce(map(func, records[start:stop]))
+
+
+def map_reduce(
+    func: Callable[[T], R],
+    records: Sequence[T] | Iterable[T],
+    reduce: Callable[[Iterable[R]], R] = sum,  # type: ignore[assignment]
+    *,
+    jobs: int | None = None,
+    chunks_per_job: int = 4,
+    probe_time: float = 0.01,
+    min_time: float = 0.2,
+) -> R:
+    """
+    Applies *func* to all *records* and combines the results with *reduce*, e.g. :py:func:`sum`, :py:func:`max` or
+    :py:func:`any`, which must be associative as it is applied to results per chunk of records first, and then to the
+    partial results of all chunks in their original order.
+
+    Records given as a sequence, e.g. a list of input lines, are distributed in contiguous chunks, *chunks_per_job* per
+    worker for load balancing, over a pool of *jobs* forked processes (defaulting to the number of cpus). Workers
+    inherit *func* along with everything it references, e.g. large lookup tables or closures over parsed input, so only
+    chunk bounds and partial results are pickled. The context must be treated as read-only since changes in workers are
+    not propagated back.
+
+    Whether parallelization pays off is decided automatically. Records are first processed serially for about
+    *probe_time* seconds, and the remaining ones are only distributed when their extrapolated runtime exceeds *min_time*
+    seconds, which amortizes the cost of forking. Processing also stays serial with a single job or cpu, or when forking
+    is not possible (see :py:func:`can_fork`). Other iterables, e.g. streamed input lines, are always consumed lazily
+    on the serial path, so that memory usage stays constant. Note that profiles, memory traces and counters only cover
+    the serial part.
+    """
+    global _state
+
+    if not isinstance(records, Sequence):
+        return reduce(map(func, records))
+    n = len(records)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    # serial probe
+    probe = []
+    t1 = time.perf_counter()
+    for record in records:
+        probe.append(func(record))
+        if time.perf_counter() - t1 >= probe_time:
+            break
+    n_probed = len(probe)
+    remaining_time = (time.perf_counter() - t1) / max(n_probed, 1) * (n - n_probed)
+
+    # continue serially when the rest is fast enough or parallelization is not possible
+    if n_probed == n:
+        return reduce(probe)
+    if jobs < 2 or remaining_time < min_time or not can_fork():
+        return reduce([reduce(probe), reduce(map(func, records[n_probed:]))])
+
+    # distribute the rest in chunks
+    n_chunks = min(jobs * chunks_per_job, n - n_probed)
+    size = math.ceil((n - n_probed) / n_chunks)
+    bounds = [(start, min(start + size, n)) for start in range(n_probed, n, size)]
+    _state = (func, records, reduce)
+    try:
+        with multiprocessing.get_context("fork").Pool(min(jobs, len(bounds))) as pool:
+            partials = pool.map(_map_chunk, bounds, chunksize=1)
+    finally:
+        _state = None
+
+    return reduce([reduce(probe), *partials])
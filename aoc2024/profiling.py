@@ -0,0 +1,77 @@
+# coding: utf-8
+
+"""
+Profiling helpers based on cProfile.
+"""
+
+from __future__ import annotations
+
+import os
+import pstats
+import cProfile
+from typing import Callable, Any, TypeVar
+
+from aoc2024 import this_dir, human_time_diff
+
+
+T = TypeVar("T")
+
+profile_dir = os.path.join(os.path.dirname(this_dir), "profiles")
+
+
+def profile_path(puzzle_id: str) -> str:
+    """
+    Returns the path of the pstats file for a *puzzle_id*.
+    """
+    return os.path.join(profile_dir, f"{puzzle_id}.pstats")
+
+
+def profile_call(func: Callable[..., T], *args: Any, path: str, **kwargs: Any) -> T:
+    """
+    Calls *func* with *args* and *kwargs* while cProfile is enabled, dumps the collected stats to *path* and returns
+    the return value of *func*. Stats are dumped even if *func* raises an exception.
+    """
+    prof = cProfile.Profile()
+    try:
+        return prof.runcall(func, *args, **kwargs)
+    finally:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        prof.dump_stats(path)
+
+
+def _location(key: tuple[str, int, str]) -> str:
+    # human-readable function location, relative to the repository if possible
+    file, line, func = key
+    if file == "~":
+        return func
+    repo_dir = os.path.dirname(this_dir)
+    if file.startswith(repo_dir + os.sep):
+        file = os.path.relpath(file, repo_dir)
+    return f"{file}:{line}({func})"
+
+
+def top_functions(path: str, top: int = 10, sort: str = "cumulative") -> list[tuple[str, int, float, float]]:
+    """
+    Loads profiling stats from *path* and returns the *top* functions sorted by *sort*, which should be either
+    ``"cumulative"`` or ``"tottime"`` (self time). Each entry is a tuple (location, number of calls, self time,
+    cumulative time).
+    """
+    assert sort in ("cumulative", "tottime")
+
+    entries: list[tuple[str, int, float, float]] = [
+        (_location(key), nc, tt, ct)
+        for key, (_, nc, tt, ct, _) in pstats.Stats(path).stats.items()  # type: ignore[attr-defined]
+    ]
+    entries.sort(key=(lambda e: e[3]) if sort == "cumulative" else (lambda e: e[2]), reverse=True)
+    return entries[:top]
+
+
+def print_profile(path: str, top: int = 10) -> None:
+    """
+    Prints the *top* functions by cumulative and self time from profiling stats stored at *path*.
+    """
+    for sort, title in [("cumulative", "cumulative time"), ("tottime", "self time")]:
+        print(f"🔬 top {top} by {title}:")
+        print(f"   {'ncalls':>9}  {'self':>9}  {'cumulative':>10}  function")
+        for loc, nc, tt, ct in top_functions(path, top=top, sort=sort):
+            print(f"   {nc:>9}  {human_time_diff(tt):>9}  {human_time_diff(ct):>10}  {loc}")
@@ -0,0 +1,674 @@
+# coding: utf-8
+
+"""
+Helpers to run the solutions of multiple days at once, optionally in parallel.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import statistics
+import importlib
+import traceback
+import subprocess
+from types import ModuleType
+from dataclasses import dataclass, fields
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Any, TypeVar
+
+from aoc2024 import Result, Part, human_time_diff, format_counters
+from aoc2024.bench import BenchmarkStats, Comparison
+
+
+T = TypeVar("T")
+
+
+def parse_days(spec: str) -> list[int]:
+    """
+    Parses a day specification like ``"1-5,7,10-12"`` into a sorted list of unique day numbers.
+    """
+    days: set[int] = set()
+    for chunk in spec.split(","):
+        if not (chunk := chunk.strip()):
+            continue
+        if "-" in chunk:
+            start, stop = map(int, chunk.split("-", 1))
+            days |= set(range(start, stop + 1))
+        else:
+            days.add(int(chunk))
+    if (invalid := [day for day in days if not 1 <= day <= 25]):
+        raise ValueError(f"invalid day(s): {', '.join(map(str, sorted(invalid)))}")
+    return sorted(days)
+
+
+def import_day(day: int) -> ModuleType:
+    """
+    Imports and returns the module of a *day*.
+    """
+    return importlib.import_module(f"aoc2024.day{day:02d}")
+
+
+def run_part(day: int, part: Part, **kwargs: Any) -> Result:
+    """
+    Runs a single *part* of a *day* and returns the :py:class:`Result`. Exceptions are caught and stored in the
+    result's *error* field so that a single failing part does not abort a full run. All *kwargs* are forwarded to
+    :py:meth:`Solver.run`.
+    """
+    mod = import_day(day)
+    try:
+        return mod.solver.run(mod.solution, part=part, parse=getattr(mod, "parse", None), **kwargs)
+    except Exception as e:
+        return Result(
+            puzzle_id=mod.solver.puzzle_id(part),
+            day=day,
+            part=part,
+            value=None,
+            truth=getattr(mod.solver, f"truth_{part}"),
+            runtime=0.0,
+            error="".join(traceback.format_exception_only(e)).strip(),
+        )
+
+
+def bench_part(day: int, part: Part, **kwargs: Any) -> BenchmarkStats:
+    """
+    Benchmarks a single *part* of a *day* and returns the :py:class:`BenchmarkStats`. All *kwargs* are forwarded to
+    :py:meth:`Solver.benchmark`.
+    """
+    mod = import_day(day)
+    parse = getattr(mod, "parse", None)
+    return mod.solver.benchmark(mod.solution, part=part, parse=parse, verbose=False, **kwargs)[0]
+
+
+def _map_parts(
+    func: Callable[..., T],
+    days: list[int],
+    parts: str,
+    jobs: int | None,
+    **kwargs: Any,
+) -> list[T]:
+    # calls func(day, part, **kwargs) for all parts of all days, serially if jobs is 1 and in a pool otherwise
+    tasks = [(day, part) for day in days for part in parts]
+
+    # run serially in the current process
+    if jobs == 1:
+        return [func(day, part, **kwargs) for day, part in tasks]
+
+    # run in a pool, whose workers must not start nested pools for parallel maps
+    from aoc2024.parallel import mark_worker
+
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), initializer=mark_worker) as pool:
+        futures = [pool.submit(func, day, part, **kwargs) for day, part in tasks]
+        return [future.result() for future in futures]
+
+
+def run_days(days: list[int], parts: str = "ab", jobs: int | None = None, **kwargs: Any) -> list[Result]:
+    """
+    Runs all *parts* of all *days* and returns a list of results in the order of days and parts. When *jobs* is not 1,
+    parts are distributed over a process pool with *jobs* workers (defaulting to the number of cpus). All *kwargs* are
+    forwarded to :py:meth:`Solver.run`.
+    """
+    return _map_parts(run_part, days, parts, jobs, **kwargs)
+
+
+def bench_days(days: list[int], parts: str = "ab", jobs: int | None = 1, **kwargs: Any) -> list[BenchmarkStats]:
+    """
+    Benchmarks all *parts* of all *days* and returns a list of stats in the order of days and parts. Parts are
+    benchmarked serially by default since parallel processes compete for resources and distort timings. All *kwargs*
+    are forwarded to :py:meth:`Solver.benchmark`.
+    """
+    return _map_parts(bench_part, days, parts, jobs, **kwargs)
+
+
+def print_results(results: list[Result], wall_time: float | None = None) -> None:
+    """
+    Prints a summary table of *results* and, when given, the total *wall_time*.
+    """
+    from tabulate import tabulate
+    from aoc2024.memory import human_bytes
+
+    # add parse and memory columns only when needed
+    with_parse = any(res.parse_time is not None for res in results)
+    with_memory = any(res.memory for res in results)
+
+    rows = []
+    for res in results:
+        check = {True: "✅", False: "❌", None: "-"}[res.correct]
+        if res.status:
+            value_str = f"{'⏳' if res.status == 'TIMEOUT' else '💥'} {res.status} ({res.error})"
+        elif res.error:
+            value_str = f"🚫 {res.error}"
+        else:
+            value_str = str(res.value)
+        runtime_str = human_time_diff(res.runtime)
+        row = [res.day, res.part, value_str, check, f"{runtime_str} (cached)" if res.cached else runtime_str]
+        if with_parse:
+            parse_time = "-" if res.parse_time is None else human_time_diff(res.parse_time)
+            row.append(f"{parse_time} (cached)" if res.parse_cached else parse_time)
+        if with_memory:
+            row.append(human_bytes(res.memory.peak_traced) if res.memory else "-")
+        rows.append(row)
+    headers = ["day", "part", "result", "truth", "runtime"]
+    headers += (["parse"] if with_parse else []) + (["peak memory"] if with_memory else [])
+    print(tabulate(rows, headers=headers, stralign="left"))
+
+    # totals
+    print("")
+    n_correct = sum(1 for res in results if res.correct)
+    n_checked = sum(1 for res in results if res.correct is not None)
+    total_runtime = sum(res.runtime + (res.parse_time or 0.0) for res in results)
+    print(f"✅ correct  : {n_correct} / {n_checked}")
+    print(f"⏰ runtime  : {human_time_diff(total_runtime)} (sum over parts, including parsing)")
+    if (n_cached := sum(1 for res in results if res.cached)):
+        print(f"💾 cached   : {n_cached} / {len(results)} (stored runtimes)")
+    if wall_time is not None:
+        print(f"⏱️ wall time: {human_time_diff(wall_time)}")
+
+
+def run(
+    days: list[int],
+    parts: str = "ab",
+    jobs: int | None = None,
+    profile: int = 0,
+    memory: int = 0,
+    counters: bool = False,
+    parse_cache: bool = False,
+    cache: bool = False,
+    force: bool = False,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+) -> list[Result]:
+    """
+    Runs *days* via :py:func:`run_days`, prints a summary table and returns the results. When *profile* is positive,
+    all parts are profiled with cProfile and the top *profile* functions per part are printed after the table. When
+    *memory* is positive, memory usage is traced and the top *memory* allocation sites per part are printed. When
+    *counters* is *True*, values collected through :py:func:`aoc2024.count` are printed per part. *parse_cache*,
+    *cache* and *force* are forwarded to :py:meth:`Solver.run`, so that with *cache* enabled, only parts whose input
+    or module source changed since the last run are actually computed. Per-part budgets *timeout* in seconds and
+    *max_memory* in bytes are enforced by running each part in a child process, reporting overruns as
+    ``TIMEOUT`` or ``OOM``.
+    """
+    t1 = time.perf_counter()
+    results = run_days(
+        days,
+        parts=parts,
+        jobs=jobs,
+        profile=profile > 0,
+        memory=max(memory, 0),
+        counters=counters,
+        parse_cache=parse_cache,
+        cache=cache,
+        force=force,
+        timeout=timeout,
+        max_memory=max_memory,
+    )
+    print_results(results, wall_time=time.perf_counter() - t1)
+
+    # print counters
+    for res in results:
+        if res.counters:
+            print(f"\n🔢 {res.puzzle_id}")
+            for line in format_counters(res.counters):
+                print(f"🔢 {line}")
+
+    # print memory stats
+    for res in results:
+        if res.memory:
+            print(f"\n🧠 {res.puzzle_id}")
+            res.memory.print()
+
+    # print profiling stats
+    if profile > 0:
+        from aoc2024.profiling import print_profile
+
+        for res in results:
+            if not res.profile_path:
+                continue
+            print(f"\n🔬 {res.puzzle_id}  ─  {res.profile_path}")
+            print_profile(res.profile_path, top=profile)
+
+    return results
+
+
+def print_bench(stats: list[BenchmarkStats]) -> None:
+    """
+    Prints a summary table of benchmark *stats*.
+    """
+    from tabulate import tabulate
+
+    attrs = ["min", "median", "mean", "p95", "stddev"]
+    rows = [
+        [s.day, s.part, s.repeat] + [human_time_diff(getattr(s, attr)) for attr in attrs]
+        for s in stats
+    ]
+    print(tabulate(rows, headers=["day", "part", "repeat"] + attrs, stralign="right"))
+
+
+def print_comparisons(comparisons: list[Comparison]) -> None:
+    """
+    Prints a summary table of *comparisons* against a baseline.
+    """
+    from tabulate import tabulate
+
+    if not comparisons:
+        return
+
+    rows = []
+    for c in comparisons:
+        status = "❌" if c.regressed else ("🚀" if c.improved else "➖")
+        baseline = "-" if c.baseline is None else human_time_diff(c.baseline)
+        rows.append([c.day, c.part, baseline, human_time_diff(c.median), c.change, status])
+    print(tabulate(rows, headers=["day", "part", "baseline", "median", "change", ""], stralign="right"))
+
+    # totals
+    print("")
+    print(f"❌ regressed: {sum(1 for c in comparisons if c.regressed)} (max ratio {comparisons[0].max_ratio:.2f})")
+    print(f"🚀 improved : {sum(1 for c in comparisons if c.improved)}")
+
+
+def bench(
+    days: list[int],
+    parts: str = "ab",
+    jobs: int | None = 1,
+    json_path: str | None = None,
+    baseline_path: str | None = None,
+    max_ratio: float = 1.2,
+    **kwargs: Any,
+) -> tuple[list[BenchmarkStats], list[Comparison]]:
+    """
+    Benchmarks *days* via :py:func:`bench_days`, prints a summary table and optionally writes all stats to
+    *json_path*. When *baseline_path* is given, median runtimes are compared against the stats in that file, flagging
+    parts whose median grew by more than a factor *max_ratio*. Stats and comparisons are returned.
+    """
+    from aoc2024.bench import write_json, read_json, compare
+
+    stats = bench_days(days, parts=parts, jobs=jobs, **kwargs)
+    print_bench(stats)
+    if json_path:
+        write_json(stats, json_path)
+
+    comparisons = []
+    if baseline_path:
+        comparisons = compare(stats, read_json(baseline_path), max_ratio=max_ratio)
+        print("")
+        print_comparisons(comparisons)
+
+    return stats, comparisons
+
+
+@dataclass
+class ImportTime:
+    """
+    Import time of a single module as reported by ``python -X importtime``.
+    """
+
+    module: str
+    depth: int
+    self_time: float
+    cumulative: float
+
+
+def measure_import_times(module: str) -> list[ImportTime]:
+    """
+    Imports *module* in a fresh interpreter with ``-X importtime`` and returns the import times of all modules
+    imported on the way, including those imported during interpreter startup, in the order reported.
+    """
+    cmd = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run(cmd, cwd=repo_dir, capture_output=True, text=True, check=True)
+
+    times = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        # strip the separating space, the remaining indentation encodes the depth
+        name = name[1:]
+        times.append(ImportTime(
+            module=name.strip(),
+            depth=(len(name) - len(name.lstrip())) // 2,
+            self_time=int(self_us) * 1e-6,
+            cumulative=int(cumulative_us) * 1e-6,
+        ))
+    return times
+
+
+def print_import_times(days: list[int], top: int = 3) -> None:
+    """
+    Measures import times of the modules of *days* in fresh interpreters via :py:func:`measure_import_times` and
+    prints a table with the time spent during interpreter startup, the total import time of each day module and the
+    *top* slowest modules it imports directly.
+    """
+    from tabulate import tabulate
+
+    rows = []
+    for day in days:
+        module = f"aoc2024.day{day:02d}"
+        times = measure_import_times(module)
+
+        # modules at depth 0 before the requested module are imported during startup
+        idx = next(i for i, t in enumerate(times) if t.module == module and t.depth == 0)
+        startup = sum(t.cumulative for t in times[:idx] if t.depth == 0)
+        total = times[idx].cumulative
+
+        # direct imports of the module are the depth 1 entries preceding it, after the previous depth 0 entry
+        direct = []
+        for t in reversed(times[:idx]):
+            if t.depth == 0:
+                break
+            if t.depth == 1:
+                direct.append(t)
+        direct.sort(key=lambda t: t.cumulative, reverse=True)
+        slowest = ", ".join(f"{t.module} ({human_time_diff(t.cumulative)})" for t in direct[:top])
+
+        rows.append([day, human_time_diff(startup), human_time_diff(total), slowest])
+
+    print(tabulate(rows, headers=["day", "startup", "import", f"slowest {top} imports"], stralign="left"))
+
+
+# script run in a fresh interpreter to measure cold start phases, printing wall clock timestamps as json
+_cold_start_script = """
+import time
+t_start = time.time()
+import importlib
+import aoc2024
+mod = importlib.import_module("aoc2024.day{day:02d}")
+t_import = time.time()
+data = mod.solver.load()
+t_load = time.time()
+if hasattr(mod, "parse"):
+    data = mod.parse(data)
+t_parse = time.time()
+mod.solution(data, "{part}")
+t_solve = time.time()
+print(repr([t_start, t_import, t_load, t_parse, t_solve]))
+"""
+
+
+@dataclass
+class ColdStart:
+    """
+    Breakdown of the wall time of running a single part in a fresh interpreter into its phases in seconds.
+    """
+
+    startup: float
+    imports: float
+    load: float
+    parse: float
+    solve: float
+    teardown: float
+
+    @property
+    def total(self) -> float:
+        return self.startup + self.imports + self.load + self.parse + self.solve + self.teardown
+
+
+def measure_cold_start(day: int, part: Part) -> ColdStart:
+    """
+    Runs a *part* of a *day* in a fresh interpreter and measures the wall time spent for interpreter startup, package
+    and module imports, input loading and splitting, parsing (for days with a separate parse stage), solving and
+    teardown (including interpreter shutdown).
+    """
+    cmd = [sys.executable, "-c", _cold_start_script.format(day=day, part=part)]
+    repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    t_spawn = time.time()
+    proc = subprocess.run(cmd, cwd=repo_dir, capture_output=True, text=True, check=True)
+    t_end = time.time()
+
+    t_start, t_import, t_load, t_parse, t_solve = json.loads(proc.stdout.strip().splitlines()[-1])
+    return ColdStart(
+        startup=t_start - t_spawn,
+        imports=t_import - t_start,
+        load=t_load - t_import,
+        parse=t_parse - t_load,
+        solve=t_solve - t_parse,
+        teardown=t_end - t_solve,
+    )
+
+
+def print_cold_starts(days: list[int], parts: str = "ab", repeat: int = 1) -> list[ColdStart]:
+    """
+    Measures cold start phases of all *parts* of all *days* via :py:func:`measure_cold_start`, *repeat* times each,
+    prints a table with the median time per phase and returns the median breakdowns.
+    """
+    from tabulate import tabulate
+
+    phases = [f.name for f in fields(ColdStart)]
+
+    rows = []
+    cold_starts = []
+    for day in days:
+        for part in parts:
+            measurements = [measure_cold_start(day, part) for _ in range(repeat)]  # type: ignore[arg-type]
+            cs = ColdStart(**{
+                phase: statistics.median(getattr(m, phase) for m in measurements)
+                for phase in phases
+            })
+            cold_starts.append(cs)
+            rows.append(
+                [day, part, human_time_diff(cs.total)] +
+                [human_time_diff(getattr(cs, phase)) for phase in phases] +
+                [f"{cs.solve / cs.total:.0%}"],
+            )
+
+    print(tabulate(rows, headers=["day", "part", "total"] + phases + ["solve share"], stralign="right"))
+    return cold_starts
+
+
+def fit_exponent(sizes: list[float], times: list[float]) -> float | None:
+    """
+    Fits ``time ~ size**k`` to pairs of *sizes* and *times* via least squares in log-log space and returns the
+    empirical complexity exponent *k*, or *None* when less than two points are given.
+    """
+    if len(sizes) < 2:
+        return None
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    x_mean, y_mean = statistics.fmean(xs), statistics.fmean(ys)
+    var = sum((x - x_mean)**2 for x in xs)
+    if var == 0:
+        return None
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / var
+
+
+@dataclass
+class ScalePoint:
+    """
+    Runtime of a puzzle part for a synthetic input generated at a certain *size*, with *n_bytes* being the length of
+    the input. *status* is set when the run did not succeed.
+    """
+
+    size: int
+    n_bytes: int
+    runtime: float | None
+    status: str | None = None
+
+
+@dataclass
+class Scaling:
+    """
+    Runtimes of a puzzle part across input sizes.
+    """
+
+    day: int
+    part: Part
+    points: list[ScalePoint]
+
+    @property
+    def exponent(self) -> float | None:
+        # exponent w.r.t. the input length, so that e.g. linear algorithms on grids have an exponent of 1
+        points = [p for p in self.points if p.runtime is not None]
+        return fit_exponent([p.n_bytes for p in points], [p.runtime for p in points])  # type: ignore[misc]
+
+
+def scale_part(
+    day: int,
+    part: Part,
+    sizes: list[int] | None = None,
+    repeat: int = 3,
+    timeout: float | None = 10.0,
+    seed: int = 0,
+) -> Scaling:
+    """
+    Runs a *part* of a *day* on synthetic inputs created by the ``generate`` function of the day module for all
+    *sizes* (defaulting to its ``scale_sizes``) and returns the :py:class:`Scaling` with the minimum runtime of
+    *repeat* calls per size, including parsing. Each size runs in a child process with a *timeout* for all calls,
+    see :py:func:`~aoc2024.isolation.run_isolated`. Larger sizes are skipped after the first timeout or error.
+    """
+    from aoc2024.bench import measure
+    from aoc2024.isolation import run_isolated, BudgetExceeded
+
+    mod = import_day(day)
+    if (generate := getattr(mod, "generate", None)) is None:
+        raise ValueError(f"day {day} has no input generator")
+    parse = getattr(mod, "parse", None)
+
+    if parse is None:
+        call = lambda data: mod.solution(data, part)
+    else:
+        call = lambda data: mod.solution(parse(data), part)
+
+    points = []
+    for size in (sizes or mod.scale_sizes):
+        lines = generate(size, random.Random(seed))
+        n_bytes = sum(len(line) + 1 for line in lines)
+        try:
+            _, times = run_isolated(
+                lambda: measure(call, warmup=0, repeat=repeat, setup=lambda: list(lines)),
+                timeout=timeout,
+            )
+        except BudgetExceeded as e:
+            points.append(ScalePoint(size=size, n_bytes=n_bytes, runtime=None, status=e.status))
+            break
+        except Exception as e:
+            points.append(ScalePoint(size=size, n_bytes=n_bytes, runtime=None, status=type(e).__name__))
+            break
+        points.append(ScalePoint(size=size, n_bytes=n_bytes, runtime=min(times)))
+
+    return Scaling(day=day, part=part, points=points)
+
+
+def print_scaling(
+    days: list[int],
+    parts: str = "ab",
+    sizes: list[int] | None = None,
+    repeat: int = 3,
+    timeout: float | None = 10.0,
+    seed: int = 0,
+    max_exponent: float = 1.5,
+) -> list[Scaling]:
+    """
+    Measures the scaling of all *parts* of all *days* that provide an input generator via :py:func:`scale_part`,
+    prints a table with runtimes per size and the fitted complexity exponents, and returns the scalings. Exponents
+    above *max_exponent* are flagged.
+    """
+    from tabulate import tabulate
+
+    rows = []
+    scalings = []
+    for day in days:
+        if not hasattr(import_day(day), "generate"):
+            continue
+        for part in parts:
+            scaling = scale_part(day, part, sizes=sizes, repeat=repeat, timeout=timeout, seed=seed)  # type: ignore
+            scalings.append(scaling)
+            runtimes = ", ".join(
+                p.status if p.runtime is None else human_time_diff(p.runtime)  # type: ignore[misc]
+                for p in scaling.points
+            )
+            if (exponent := scaling.exponent) is None:
+                exponent_str = "-"
+            else:
+                exponent_str = f"{'⚠️ ' if exponent > max_exponent else ''}{exponent:.2f}"
+            rows.append([
+                day,
+                part,
+                ", ".join(str(p.size) for p in scaling.points),
+                runtimes,
+                exponent_str,
+            ])
+
+    print(tabulate(rows, headers=["day", "part", "sizes", "runtimes", "exponent"], stralign="left"))
+    print(f"\n📈 exponents of the runtime w.r.t. the input length, flagged above {max_exponent}")
+    return scalings
+
+
+def _format_delta(runtime: float, prev: float | None) -> str:
+    # runtime with the difference to a previous runtime
+    if prev is None:
+        return human_time_diff(runtime)
+    diff = runtime - prev
+    return f"{human_time_diff(runtime)} ({'+' if diff >= 0 else '-'}{human_time_diff(abs(diff))}, {diff / prev:+.0%})"
+
+
+def watch(day: int, parts: str = "ab", interval: float = 0.5) -> None:
+    """
+    Runs all *parts* of a *day* in the current interpreter and runs them again whenever the day module is saved,
+    reloading it via :py:func:`importlib.reload`, until interrupted. The input is loaded only once and the output of
+    the parse stage (if any) is reused as long as neither the input nor the source of the parse function changed.
+    Runtimes are printed along with their difference to the previous run. Files are polled every *interval* seconds.
+    """
+    from aoc2024.cache import hash_source
+
+    mod = import_day(day)
+    path = mod.__file__
+    parsed: tuple[str, Any] | None = None
+    prev_runtimes: dict[str, float] = {}
+
+    def run_parts() -> None:
+        nonlocal parsed
+
+        inp = mod.solver.input()
+        print(f"\n👀 {time.strftime('%H:%M:%S')}  ─  {os.path.relpath(path)}")  # type: ignore[arg-type]
+
+        # parse once per input and parse source
+        parse = getattr(mod, "parse", None)
+        if parse is not None:
+            key = f"{inp.digest}:{hash_source(parse)}"
+            if parsed is None or parsed[0] != key:
+                t1 = time.perf_counter()
+                parsed = (key, parse(inp.lines()))
+                print(f"⏰ parse    : {human_time_diff(time.perf_counter() - t1)}")
+            else:
+                print("⏰ parse    : reused")
+
+        for part in parts:
+            data = inp.lines() if parse is None else parsed[1]  # type: ignore[index]
+            try:
+                res = mod.solver._call(mod.solution, data, part)
+            except Exception:
+                print(f"🚫 part {part}  : exception")
+                traceback.print_exc()
+                continue
+            check = {True: "✅", False: "❌", None: "✨"}[res.correct]
+            runtime = _format_delta(res.runtime, prev_runtimes.get(part))
+            truth = f" (truth: {res.truth})" if res.correct is False else ""
+            print(f"{check} part {part}  : {res.value}{truth}  ─  {runtime}")
+            prev_runtimes[part] = res.runtime
+
+    def mtimes() -> tuple[int, int]:
+        return os.stat(path).st_mtime_ns, os.stat(mod.solver.data_path()).st_mtime_ns  # type: ignore[arg-type]
+
+    run_parts()
+    last = mtimes()
+    print(f"\n👀 watching {os.path.relpath(path)}, press ctrl+c to stop")  # type: ignore[arg-type]
+    try:
+        while True:
+            time.sleep(interval)
+            if (current := mtimes()) == last:
+                continue
+            last = current
+            try:
+                mod = importlib.reload(mod)
+            except Exception:
+                print("\n🚫 reload failed")
+                traceback.print_exc()
+                continue
+            run_parts()
+    except KeyboardInterrupt:
+        print("")
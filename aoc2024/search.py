@@ -0,0 +1,268 @@
+# coding: utf-8
+
+"""
+Graph searches over integer node ids.
+
+Nodes are integers in ``range(n_nodes)``, e.g. cell ids of a :py:class:`aoc2024.grid.Grid`, optionally combined with
+further state such as ``cell * 4 + direction``. Graphs are defined implicitly by *neighbors* callables, returning the
+neighbors of a node for unweighted searches and ``(neighbor, weight)`` pairs for weighted ones. Distances and
+predecessors are stored in lists indexed by node id.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+
+# distance of unreached nodes
+unreached = -1
+
+
+@dataclass
+class SearchResult:
+    """
+    Result of a graph search, with *dist* and *pred* holding the distance and one predecessor per node (*unreached*
+    and -1 for unreached nodes and sources, respectively), *order* the nodes in the order they were settled, and
+    *target* the first target node that was reached, if any. When requested, *preds* holds all predecessors per node
+    on shortest paths.
+    """
+
+    dist: list[int] = field(repr=False)
+    pred: list[int] = field(repr=False)
+    order: list[int] = field(repr=False)
+    target: int | None = None
+    preds: list[list[int]] | None = field(default=None, repr=False)
+
+    def reached(self, node: int) -> bool:
+        return self.dist[node] != unreached
+
+    def path(self, node: int | None = None) -> list[int]:
+        """
+        Returns a shortest path from a source to *node*, defaulting to :py:attr:`target`, or an empty list if not
+        reached.
+        """
+        if node is None:
+            node = self.target
+        if node is None or not self.reached(node):
+            return []
+        path = [node]
+        while (node := self.pred[node]) >= 0:
+            path.append(node)
+        return path[::-1]
+
+    def path_nodes(self, nodes: int | Iterable[int] | None = None) -> set[int]:
+        """
+        Returns all nodes on any shortest path from a source to one or more *nodes*, defaulting to :py:attr:`target`.
+        Requires a search with ``all_preds=True``.
+        """
+        if self.preds is None:
+            raise ValueError("path_nodes requires a search with all_preds=True")
+        if nodes is None:
+            nodes = [] if self.target is None else [self.target]
+        elif isinstance(nodes, int):
+            nodes = [nodes]
+        seen = {node for node in nodes if self.reached(node)}
+        stack = list(seen)
+        while stack:
+            for pred in self.preds[stack.pop()]:
+                if pred not in seen:
+                    seen.add(pred)
+                    stack.append(pred)
+        return seen
+
+
+def _init(
+    n_nodes: int,
+    sources: Iterable[int],
+    all_preds: bool,
+) -> tuple[list[int], list[int], list[list[int]] | None, list[int]]:
+    # initial distances, predecessors and the unique list of sources
+    dist = [unreached] * n_nodes
+    pred = [-1] * n_nodes
+    preds: list[list[int]] | None = [[] for _ in range(n_nodes)] if all_preds else None
+    sources = list(dict.fromkeys(sources))
+    for source in sources:
+        dist[source] = 0
+    return dist, pred, preds, sources
+
+
+def bfs(
+    n_nodes: int,
+    sources: int | Iterable[int],
+    neighbors: Callable[[int], Iterable[int]],
+    *,
+    targets: Iterable[int] | None = None,
+    all_preds: bool = False,
+) -> SearchResult:
+    """
+    Breadth-first search on an unweighted graph of *n_nodes* starting at one or multiple *sources*. When *targets* are
+    given, the search stops once the first of them is settled, or, with *all_preds*, once all nodes at the same
+    distance are settled so that all shortest paths to the target are recorded.
+    """
+    dist, pred, preds, queue = _init(n_nodes, [sources] if isinstance(sources, int) else sources, all_preds)
+    target_set = None if targets is None else set(targets)
+    target = None
+    stop_dist = -1
+
+    # the queue doubles as the settle order
+    n_settled = 0
+    for node in queue:
+        d = dist[node]
+        if target is not None and d > stop_dist:
+            break
+        n_settled += 1
+        if target_set is not None and target is None and node in target_set:
+            target, stop_dist = node, d
+            if preds is None:
+                break
+        d += 1
+        for neighbor in neighbors(node):
+            nd = dist[neighbor]
+            if nd == unreached:
+                dist[neighbor] = d
+                pred[neighbor] = node
+                if preds is not None:
+                    preds[neighbor].append(node)
+                queue.append(neighbor)
+            elif preds is not None and nd == d:
+                preds[neighbor].append(node)
+
+    del queue[n_settled:]
+
+    return SearchResult(dist=dist, pred=pred, order=queue, target=target, preds=preds)
+
+
+def dijkstra(
+    n_nodes: int,
+    sources: int | Iterable[int],
+    neighbors: Callable[[int], Iterable[tuple[int, int]]],
+    *,
+    targets: Iterable[int] | None = None,
+    all_preds: bool = False,
+    heuristic: Callable[[int], int] | None = None,
+) -> SearchResult:
+    """
+    Dijkstra search on a graph of *n_nodes* with non-negative integer edge weights starting at one or multiple
+    *sources*, using a binary heap. Early exit and *all_preds* work as for :py:func:`bfs`. With an admissible and
+    consistent *heuristic* estimating the remaining distance to the targets, the search becomes A* (see
+    :py:func:`astar`).
+    """
+    dist, pred, preds, sources = _init(n_nodes, [sources] if isinstance(sources, int) else sources, all_preds)
+    target_set = None if targets is None else set(targets)
+    target = None
+    stop_priority = -1
+    settled = [False] * n_nodes
+    order = []
+
+    # heap of (priority, node) with priority being the distance plus the heuristic
+    h = heuristic or (lambda node: 0)
+    heap = [(h(source), source) for source in sources]
+    heapq.heapify(heap)
+    while heap:
+        priority, node = heapq.heappop(heap)
+        if settled[node]:
+            continue
+        # priorities of settled nodes never decrease for consistent heuristics
+        if target is not None and priority > stop_priority:
+            break
+        d = dist[node]
+        settled[node] = True
+        order.append(node)
+        if target_set is not None and target is None and node in target_set:
+            target, stop_priority = node, priority
+            if preds is None:
+                break
+        for neighbor, weight in neighbors(node):
+            nd = d + weight
+            old = dist[neighbor]
+            if old == unreached or nd < old:
+                dist[neighbor] = nd
+                pred[neighbor] = node
+                if preds is not None:
+                    preds[neighbor] = [node]
+                heapq.heappush(heap, (nd + h(neighbor), neighbor))
+            elif preds is not None and nd == old:
+                preds[neighbor].append(node)
+
+    return SearchResult(dist=dist, pred=pred, order=order, target=target, preds=preds)
+
+
+def astar(
+    n_nodes: int,
+    sources: int | Iterable[int],
+    neighbors: Callable[[int], Iterable[tuple[int, int]]],
+    heuristic: Callable[[int], int],
+    *,
+    targets: Iterable[int],
+    all_preds: bool = False,
+) -> SearchResult:
+    """
+    A* search from *sources* to *targets*, i.e., :py:func:`dijkstra` guided by a *heuristic* that must never
+    overestimate the remaining distance to the closest target and be consistent, so that settled distances are final.
+    """
+    return dijkstra(n_nodes, sources, neighbors, targets=targets, all_preds=all_preds, heuristic=heuristic)
+
+
+def dial(
+    n_nodes: int,
+    sources: int | Iterable[int],
+    neighbors: Callable[[int], Iterable[tuple[int, int]]],
+    *,
+    max_weight: int,
+    targets: Iterable[int] | None = None,
+    all_preds: bool = False,
+) -> SearchResult:
+    """
+    Dijkstra search using Dial's bucket queue, which replaces the heap by a circular array of *max_weight* + 1 buckets
+    of nodes per distance. This is faster than :py:func:`dijkstra` for small integer edge weights, as pushing and
+    popping take constant time. Arguments and results are the same, and a :py:class:`ValueError` is raised for edge
+    weights larger than *max_weight*.
+    """
+    dist, pred, preds, sources = _init(n_nodes, [sources] if isinstance(sources, int) else sources, all_preds)
+    target_set = None if targets is None else set(targets)
+    target = None
+    settled = [False] * n_nodes
+    order = []
+
+    n_buckets = max_weight + 1
+    buckets: list[list[int]] = [[] for _ in range(n_buckets)]
+    buckets[0].extend(sources)
+    n_queued = len(sources)
+    d = 0
+    while n_queued:
+        bucket = buckets[d % n_buckets]
+        # nodes might be added to the current bucket while iterating through zero-weight edges
+        while bucket:
+            node = bucket.pop()
+            n_queued -= 1
+            if settled[node] or dist[node] != d:
+                continue
+            settled[node] = True
+            order.append(node)
+            if target_set is not None and target is None and node in target_set:
+                target = node
+                if preds is None:
+                    return SearchResult(dist=dist, pred=pred, order=order, target=target, preds=preds)
+            for neighbor, weight in neighbors(node):
+                # larger weights would wrap around into buckets of smaller distances
+                if weight > max_weight:
+                    raise ValueError(f"edge weight {weight} exceeds max_weight {max_weight}")
+                nd = d + weight
+                old = dist[neighbor]
+                if old == unreached or nd < old:
+                    dist[neighbor] = nd
+                    pred[neighbor] = node
+                    if preds is not None:
+                        preds[neighbor] = [node]
+                    buckets[nd % n_buckets].append(neighbor)
+                    n_queued += 1
+                elif preds is not None and nd == old:
+                    preds[neighbor].append(node)
+        # all nodes at the target distance are settled
+        if target is not None:
+            break
+        d += 1
+
+    return SearchResult(dist=dist, pred=pred, order=order, target=target, preds=preds)
@@ -13,6 +13,9 @@ def solution(data: list[str], part: Part) -> int | str | None:
     return None
 
 
+solver = Solver(year=2024, day=000, truth_a=None, truth_b=None)
+
+
 if __name__ == "__main__":
-    Solver(year=2024, day=000, truth_a=None, truth_b=None).solve(solution, part="a", example=True)
-    Solver(year=2024, day=000, truth_a=None, truth_b=None).solve(solution, part="a")
+    solver.solve(solution, part="a", example=True)
+    solver.solve(solution, part="a")